@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Run logging A/B variants concurrently against cached git worktrees.
+
+Each variant ref is resolved to a commit and materialized once into a cached
+worktree (or an exported tree) keyed by commit SHA. The user's working tree is
+never touched, so variants can run side by side and later runs against the
+same commit reuse the existing checkout instead of paying setup cost again.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_HARNESS = SCRIPT_DIR / "logging_ab_harness.py"
+DEFAULT_COMPARE = SCRIPT_DIR / "compare_ab_reports.py"
+DEFAULT_OUTPUT_ROOT = Path("/tmp/ab_test_results")
+EXPORT_MARKER = ".ab-export-complete"
+
+
+class OrchestratorError(Exception):
+    pass
+
+
+@dataclass
+class Variant:
+    label: str
+    ref: str
+    commit: str = ""
+    root: Path | None = None
+    reused: bool = False
+
+
+def _log(message: str) -> None:
+    print(f"[ab] {message}", file=sys.stderr, flush=True)
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise OrchestratorError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout.strip()
+
+
+def _resolve_commit(repo: Path, ref: str) -> str:
+    return _git(repo, "rev-parse", "--verify", f"{ref}^{{commit}}")
+
+
+def _default_cache_dir(repo: Path) -> Path:
+    common = Path(_git(repo, "rev-parse", "--git-common-dir"))
+    if not common.is_absolute():
+        common = (repo / common).resolve()
+    return common / "ab-cache"
+
+
+def _worktree_head(path: Path) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(path), "rev-parse", "HEAD"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def _materialize_worktree(repo: Path, commit: str, cache_dir: Path) -> tuple[Path, bool]:
+    path = cache_dir / commit
+    if path.is_dir() and _worktree_head(path) == commit:
+        return path, True
+    if path.exists():
+        shutil.rmtree(path, ignore_errors=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _git(repo, "worktree", "prune")
+    _git(repo, "worktree", "add", "--detach", "--force", str(path), commit)
+    return path, False
+
+
+def _materialize_export(repo: Path, commit: str, cache_dir: Path) -> tuple[Path, bool]:
+    path = cache_dir / commit
+    if (path / EXPORT_MARKER).is_file():
+        return path, True
+    if path.exists():
+        shutil.rmtree(path, ignore_errors=True)
+    staging = cache_dir / f".{commit}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    result = subprocess.run(
+        ["git", "-C", str(repo), "archive", "--format=tar", commit],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise OrchestratorError(result.stderr.decode("utf-8", "replace").strip() or "git archive failed")
+    with tarfile.open(fileobj=io.BytesIO(result.stdout)) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(staging, filter="data")
+        else:
+            tar.extractall(staging)
+    (staging / EXPORT_MARKER).write_text(commit + "\n", encoding="utf-8")
+    os.replace(staging, path)
+    return path, False
+
+
+def materialize_variants(repo: Path, variants: list[Variant], cache_dir: Path, mode: str) -> None:
+    """Resolve and materialize each variant; variants on the same commit share a tree."""
+    materialize = _materialize_worktree if mode == "worktree" else _materialize_export
+    # Worktree creation mutates shared .git metadata, so setup stays serial;
+    # only the harness runs themselves are concurrent.
+    seen: dict[str, tuple[Path, bool]] = {}
+    for variant in variants:
+        variant.commit = _resolve_commit(repo, variant.ref)
+        if variant.commit not in seen:
+            seen[variant.commit] = materialize(repo, variant.commit, cache_dir)
+        variant.root, variant.reused = seen[variant.commit]
+        state = "reused" if variant.reused else "created"
+        _log(f"variant {variant.label}: {variant.ref} -> {variant.commit[:12]} ({state} {variant.root})")
+
+
+def _output_paths(output_dir: Path, testname: str, label: str) -> dict[str, Path]:
+    return {
+        "codexlog": output_dir / f"codexlog-{testname}-{label}.log",
+        "prompt_log": output_dir / f"promptlog-{testname}-{label}.log",
+        "report": output_dir / f"report-{testname}-{label}.json",
+    }
+
+
+def _run_variant(
+    variant: Variant,
+    harness: Path,
+    output_dir: Path,
+    testname: str,
+    sleep_s: float,
+    workspace: str,
+    extra_args: list[str],
+) -> Path:
+    assert variant.root is not None
+    paths = _output_paths(output_dir, testname, variant.label)
+    cmd = [
+        sys.executable,
+        str(harness),
+        "--variant",
+        variant.label,
+        "--sleep",
+        str(sleep_s),
+        "--codexlog",
+        str(paths["codexlog"]),
+        "--prompt-log",
+        str(paths["prompt_log"]),
+        "--report-file",
+        str(paths["report"]),
+        *extra_args,
+    ]
+    if workspace:
+        cmd.extend(["--workspace", workspace])
+    env = dict(os.environ)
+    env["CODEX_AB_VARIANT_ROOT"] = str(variant.root)
+    env["CODEX_AB_VARIANT_COMMIT"] = variant.commit
+    _log(f"running variant {variant.label} in {variant.root}")
+    result = subprocess.run(
+        cmd,
+        cwd=str(variant.root),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise OrchestratorError(f"variant {variant.label} failed: {result.stderr.strip()}")
+    return paths["report"]
+
+
+def _compare(compare: Path, report_a: Path, report_b: Path, fmt: str) -> str:
+    result = subprocess.run(
+        [sys.executable, str(compare), "--a", str(report_a), "--b", str(report_b), "--format", fmt],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise OrchestratorError(result.stderr.strip() or "comparison failed")
+    return result.stdout
+
+
+def run_ab(
+    repo: Path,
+    variants: list[Variant],
+    output_dir: Path,
+    testname: str,
+    sleep_s: float,
+    cache_dir: Path,
+    mode: str = "worktree",
+    harness: Path = DEFAULT_HARNESS,
+    compare: Path = DEFAULT_COMPARE,
+    workspace: str = "",
+    harness_args: list[str] | None = None,
+) -> dict[str, Any]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    materialize_variants(repo, variants, cache_dir, mode)
+
+    with ThreadPoolExecutor(max_workers=len(variants)) as pool:
+        futures = {
+            v.label: pool.submit(
+                _run_variant, v, harness, output_dir, testname, sleep_s, workspace, list(harness_args or [])
+            )
+            for v in variants
+        }
+        reports = {label: future.result() for label, future in futures.items()}
+
+    summary: dict[str, Any] = {
+        "testname": testname,
+        "mode": mode,
+        "output_dir": str(output_dir),
+        "variants": [
+            {
+                "label": v.label,
+                "ref": v.ref,
+                "commit": v.commit,
+                "root": str(v.root),
+                "reused": v.reused,
+                "report": str(reports[v.label]),
+            }
+            for v in variants
+        ],
+    }
+
+    if len(variants) == 2:
+        report_a, report_b = reports[variants[0].label], reports[variants[1].label]
+        for fmt, suffix in (("text", "txt"), ("json", "json")):
+            target = output_dir / f"ab-comparison-{testname}.{suffix}"
+            target.write_text(_compare(compare, report_a, report_b, fmt), encoding="utf-8")
+            summary[f"comparison_{fmt}"] = str(target)
+    return summary
+
+
+def _prune_cache(repo: Path, cache_dir: Path, keep: set[str]) -> None:
+    if not cache_dir.is_dir():
+        return
+    for entry in cache_dir.iterdir():
+        if entry.name in keep:
+            continue
+        _log(f"pruning cached tree {entry}")
+        shutil.rmtree(entry, ignore_errors=True)
+    _git(repo, "worktree", "prune")
+
+
+def _parse_variant(raw: str) -> Variant:
+    label, sep, ref = raw.partition("=")
+    if not sep or not label or not ref:
+        raise argparse.ArgumentTypeError(f"expected LABEL=REF, got {raw!r}")
+    return Variant(label=label, ref=ref)
+
+
+def main() -> int:
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    parser = argparse.ArgumentParser(description="Run A/B logging variants concurrently from cached git worktrees.")
+    parser.add_argument("testname", nargs="?", default="", help="Test name (defaults to timestamp-refs-sleep).")
+    parser.add_argument("--repo", default=".", help="Git repository holding the variant refs.")
+    parser.add_argument("--branch-a", default=os.environ.get("BRANCH_A", "before_optimization"))
+    parser.add_argument("--branch-b", default=os.environ.get("BRANCH_B", "after_optimization"))
+    parser.add_argument(
+        "--variant",
+        action="append",
+        type=_parse_variant,
+        default=[],
+        help="Extra or replacement variant as LABEL=REF (repeatable; overrides --branch-a/--branch-b).",
+    )
+    parser.add_argument("--sleep", type=float, default=float(os.environ.get("SLEEP_DURATION", "0.20")))
+    parser.add_argument("--output-dir", default=os.environ.get("OUTPUT_DIR", ""), help="Report output directory.")
+    parser.add_argument("--cache-dir", default="", help="Tree cache (defaults to <git-common-dir>/ab-cache/<mode>).")
+    parser.add_argument("--mode", choices=("worktree", "export"), default="worktree")
+    parser.add_argument("--harness", default=str(DEFAULT_HARNESS), help="Harness script to run per variant.")
+    parser.add_argument("--workspace", default="", help="Optional --workspace passed through to the harness.")
+    parser.add_argument("--prune", action="store_true", help="Remove cached trees not used by this run first.")
+    args, harness_args = parser.parse_known_args()
+
+    repo = Path(args.repo).resolve()
+    variants = args.variant or [Variant("A", args.branch_a), Variant("B", args.branch_b)]
+    testname = args.testname or f"{timestamp}-{'-'.join(v.ref for v in variants)}-{args.sleep:.2f}"
+    output_dir = Path(args.output_dir) if args.output_dir else DEFAULT_OUTPUT_ROOT / testname
+    try:
+        cache_dir = Path(args.cache_dir) if args.cache_dir else _default_cache_dir(repo) / args.mode
+        if args.prune:
+            _prune_cache(repo, cache_dir, {_resolve_commit(repo, v.ref) for v in variants})
+        summary = run_ab(
+            repo=repo,
+            variants=variants,
+            output_dir=output_dir,
+            testname=testname,
+            sleep_s=max(0.0, args.sleep),
+            cache_dir=cache_dir,
+            mode=args.mode,
+            harness=Path(args.harness),
+            workspace=args.workspace,
+            harness_args=harness_args,
+        )
+    except OrchestratorError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+
+    summary_path = output_dir / f"ab-summary-{testname}.json"
+    summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    text_path = summary.get("comparison_text")
+    if text_path:
+        print(Path(text_path).read_text(encoding="utf-8"), end="")
+    _log(f"summary written to {summary_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
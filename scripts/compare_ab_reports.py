@@ -23,6 +23,13 @@ def _metrics(report: dict[str, Any]) -> dict[str, Any]:
     return metrics
 
 
+def _fixture(report: dict[str, Any]) -> dict[str, Any]:
+    fixture = report.get("fixture", {})
+    if not isinstance(fixture, dict):
+        fixture = {}
+    return fixture
+
+
 def _as_float(value: Any) -> float:
     try:
         return float(value)
@@ -47,6 +54,12 @@ def build_comparison(report_a: dict[str, Any], report_b: dict[str, Any]) -> dict
     b_num = _as_int(metrics_b.get("num_logs"))
     a_dur = _as_float(metrics_a.get("duration_seconds"))
     b_dur = _as_float(metrics_b.get("duration_seconds"))
+    fixture_a = _fixture(report_a)
+    fixture_b = _fixture(report_b)
+    a_backend = str(fixture_a.get("backend", "disk"))
+    b_backend = str(fixture_b.get("backend", "disk"))
+    a_step_ms = _as_float(fixture_a.get("step_time_ms"))
+    b_step_ms = _as_float(fixture_b.get("step_time_ms"))
 
     phases_a = metrics_a.get("logs_by_phase", {})
     phases_b = metrics_b.get("logs_by_phase", {})
@@ -82,6 +95,8 @@ def build_comparison(report_a: dict[str, Any], report_b: dict[str, Any]) -> dict
             "logs_per_ten_sec": a_rate,
             "num_logs": a_num,
             "duration_seconds": a_dur,
+            "fixture_backend": a_backend,
+            "step_time_ms": a_step_ms,
         },
         "run_b": {
             "run_id": report_b.get("run_id", ""),
@@ -89,12 +104,16 @@ def build_comparison(report_a: dict[str, Any], report_b: dict[str, Any]) -> dict
             "logs_per_ten_sec": b_rate,
             "num_logs": b_num,
             "duration_seconds": b_dur,
+            "fixture_backend": b_backend,
+            "step_time_ms": b_step_ms,
         },
         "delta": {
             "logs_per_ten_sec": round(b_rate - a_rate, 4),
             "num_logs": b_num - a_num,
             "duration_seconds": round(b_dur - a_dur, 4),
+            "step_time_ms": round(b_step_ms - a_step_ms, 4),
         },
+        "fixture_backends_match": a_backend == b_backend,
         "winner_by_rate": better_variant,
         "phase_deltas": phase_deltas,
     }
@@ -119,6 +138,13 @@ def print_text(summary: dict[str, Any]) -> None:
         f"Delta (B-A): rate={delta['logs_per_ten_sec']:.2f}, "
         f"logs={delta['num_logs']}, dur={delta['duration_seconds']:.2f}s, winner={winner}"
     )
+    print(
+        f"Fixture: A={run_a['fixture_backend']} ({run_a['step_time_ms']:.2f}ms steps), "
+        f"B={run_b['fixture_backend']} ({run_b['step_time_ms']:.2f}ms steps), "
+        f"step delta={delta['step_time_ms']:.2f}ms"
+    )
+    if not summary["fixture_backends_match"]:
+        print("  note: fixture backends differ; step timing deltas include I/O backend noise")
     print("Phase deltas (B-A):")
     for row in summary["phase_deltas"]:
         print(f"  {row['phase']}: A={row['a']} B={row['b']} delta={row['delta']}")
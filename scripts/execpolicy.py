@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Evaluate commands against rules/*.rules and policy/*.codexpolicy.
+
+Policy files are lists of Starlark calls::
+
+    prefix_rule(
+        pattern = ["git", ["push", "fetch"]],
+        decision = "prompt",
+        match = [["git", "push"]],
+        not_match = [["git", "status"]],
+    )
+
+A rule applies when its pattern is a token prefix of the command; a pattern
+element may be a list of alternatives. When several rules apply, the
+strictest decision wins (forbidden > prompt > allow), as in Codex.
+
+All patterns are compiled into one token trie, so evaluating an argv walks at
+most ``len(argv)`` nodes instead of testing every rule. ``match`` and
+``not_match`` examples are run as self-tests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import itertools
+import json
+import shlex
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from prompt_headers import REPO_ROOT
+
+
+DEFAULT_SOURCES = (REPO_ROOT / "rules", REPO_ROOT / "policy")
+POLICY_SUFFIXES = (".rules", ".codexpolicy")
+SEVERITY = {"allow": 0, "prompt": 1, "forbidden": 2}
+RULE_KEYWORDS = {"pattern", "decision", "match", "not_match", "justification"}
+
+
+class PolicyError(Exception):
+    pass
+
+
+@dataclass
+class Rule:
+    id: int
+    source: str
+    line: int
+    pattern: list[list[str]]
+    decision: str = "allow"
+    match: list[list[str]] = field(default_factory=list)
+    not_match: list[list[str]] = field(default_factory=list)
+    justification: str = ""
+    # Source span of the call; columns are UTF-8 byte offsets, as in ast.
+    end_line: int = 0
+    col: int = 0
+    end_col: int = 0
+
+    @property
+    def location(self) -> str:
+        return f"{self.source}:{self.line}"
+
+    def expansions(self) -> Iterator[tuple[str, ...]]:
+        """Every concrete token prefix the pattern stands for."""
+        return itertools.product(*self.pattern)
+
+    def matches(self, argv: list[str]) -> bool:
+        return len(argv) >= len(self.pattern) and all(
+            token in options for token, options in zip(argv, self.pattern)
+        )
+
+
+@dataclass
+class Evaluation:
+    decision: str | None
+    rules: list[Rule]
+
+
+def _literal(node: ast.expr, path: Path) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except ValueError as exc:
+        raise PolicyError(f"{path}:{node.lineno}: only literal values are supported") from exc
+
+
+def _argv_list(value: Any, what: str, where: str) -> list[list[str]]:
+    if not isinstance(value, list) or not all(
+        isinstance(argv, list) and all(isinstance(token, str) for token in argv) for argv in value
+    ):
+        raise PolicyError(f"{where}: {what} must be a list of string lists")
+    return value
+
+
+def parse_policy_text(text: str, path: Path, first_id: int = 0) -> list[Rule]:
+    """Parse prefix_rule(...) calls; Starlark's syntax here is a subset of Python's."""
+    try:
+        module = ast.parse(text, filename=str(path))
+    except SyntaxError as exc:
+        raise PolicyError(f"{path}:{exc.lineno}: {exc.msg}") from exc
+    rules = []
+    for statement in module.body:
+        call = statement.value if isinstance(statement, ast.Expr) else None
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "prefix_rule"):
+            raise PolicyError(f"{path}:{statement.lineno}: expected prefix_rule(...)")
+        where = f"{path}:{call.lineno}"
+        if call.args:
+            raise PolicyError(f"{where}: prefix_rule takes keyword arguments only")
+        kwargs = {keyword.arg: _literal(keyword.value, path) for keyword in call.keywords}
+        unknown = set(kwargs) - RULE_KEYWORDS
+        if unknown:
+            raise PolicyError(f"{where}: unknown argument(s) {', '.join(sorted(unknown))}")
+        raw_pattern = kwargs.get("pattern")
+        if not isinstance(raw_pattern, list) or not raw_pattern:
+            raise PolicyError(f"{where}: pattern must be a non-empty list")
+        pattern = []
+        for element in raw_pattern:
+            options = [element] if isinstance(element, str) else element
+            if not isinstance(options, list) or not options or not all(isinstance(o, str) for o in options):
+                raise PolicyError(f"{where}: pattern elements must be strings or non-empty string lists")
+            pattern.append(options)
+        decision = kwargs.get("decision", "allow")
+        if decision not in SEVERITY:
+            raise PolicyError(f"{where}: decision must be one of {', '.join(SEVERITY)}")
+        rules.append(
+            Rule(
+                id=first_id + len(rules),
+                source=str(path),
+                line=call.lineno,
+                pattern=pattern,
+                decision=decision,
+                match=_argv_list(kwargs.get("match", []), "match", where),
+                not_match=_argv_list(kwargs.get("not_match", []), "not_match", where),
+                justification=kwargs.get("justification", ""),
+                end_line=call.end_lineno or call.lineno,
+                col=call.col_offset,
+                end_col=call.end_col_offset or 0,
+            )
+        )
+    return rules
+
+
+def policy_files(sources: Iterable[Path]) -> list[Path]:
+    files = []
+    for source in sources:
+        if source.is_dir():
+            files.extend(sorted(p for p in source.iterdir() if p.suffix in POLICY_SUFFIXES and p.is_file()))
+        elif source.exists():
+            files.append(source)
+    return files
+
+
+def load_rules(sources: Iterable[Path] = DEFAULT_SOURCES) -> list[Rule]:
+    rules: list[Rule] = []
+    for path in policy_files(sources):
+        rules.extend(parse_policy_text(path.read_text(encoding="utf-8"), path, len(rules)))
+    return rules
+
+
+class _Node:
+    __slots__ = ("children", "rules", "decision")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.rules: list[Rule] = []
+        # Strictest decision among rules ending exactly at this node.
+        self.decision = -1
+
+
+class PolicyTrie:
+    """All rule patterns merged into one trie keyed by argv token."""
+
+    def __init__(self, rules: list[Rule]) -> None:
+        self.rules = rules
+        self.root = _Node()
+        self.node_count = 1
+        for rule in rules:
+            for prefix in rule.expansions():
+                node = self.root
+                for token in prefix:
+                    child = node.children.get(token)
+                    if child is None:
+                        child = node.children[token] = _Node()
+                        self.node_count += 1
+                    node = child
+                if rule not in node.rules:
+                    node.rules.append(rule)
+                    node.decision = max(node.decision, SEVERITY[rule.decision])
+
+    def walk(self, argv: list[str]) -> Iterator[_Node]:
+        """Nodes for each prefix of argv that is also a pattern prefix."""
+        node = self.root
+        for token in argv:
+            node = node.children.get(token)
+            if node is None:
+                return
+            yield node
+
+    def decide(self, argv: list[str]) -> str | None:
+        severity = max((node.decision for node in self.walk(argv)), default=-1)
+        return _DECISIONS[severity] if severity >= 0 else None
+
+    def evaluate(self, argv: list[str]) -> Evaluation:
+        matched = [rule for node in self.walk(argv) for rule in node.rules]
+        decision = max((rule.decision for rule in matched), key=SEVERITY.__getitem__, default=None)
+        return Evaluation(decision, matched)
+
+
+_DECISIONS = {severity: name for name, severity in SEVERITY.items()}
+
+
+def self_test(trie: PolicyTrie) -> tuple[list[str], list[str]]:
+    """Check every rule's match/not_match examples.
+
+    Returns (failures, warnings). A failure is an example the rule itself
+    gets wrong; a warning is a match example whose overall decision differs
+    from the rule's because a stricter rule also applies.
+    """
+    failures, warnings = [], []
+    for rule in trie.rules:
+        for argv in rule.match:
+            evaluation = trie.evaluate(argv)
+            if rule not in evaluation.rules:
+                failures.append(f"{rule.location}: match example {argv} does not match pattern {rule.pattern}")
+            elif evaluation.decision != rule.decision:
+                stricter = [r.location for r in evaluation.rules if r.decision == evaluation.decision]
+                warnings.append(
+                    f"{rule.location}: {argv} is {evaluation.decision}, not {rule.decision} (overridden by {', '.join(stricter)})"
+                )
+        for argv in rule.not_match:
+            if rule.matches(argv):
+                failures.append(f"{rule.location}: not_match example {argv} matches pattern {rule.pattern}")
+    return failures, warnings
+
+
+def read_commands(path: str) -> Iterator[list[str]]:
+    """One command per line: a JSON string array, or a shell-quoted command line."""
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for number, line in enumerate(handle, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("["):
+                try:
+                    argv = json.loads(line)
+                except ValueError as exc:
+                    raise ValueError(f"{path}:{number}: invalid JSON: {exc}") from exc
+                if not isinstance(argv, list) or not all(isinstance(token, str) for token in argv):
+                    raise ValueError(f"{path}:{number}: JSON command must be an array of strings")
+            else:
+                try:
+                    argv = shlex.split(line)
+                except ValueError as exc:
+                    raise ValueError(f"{path}:{number}: {exc}") from exc
+            if argv:
+                yield argv
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Evaluate commands against prefix_rule policy files.")
+    parser.add_argument(
+        "--rules", action="append", default=[], help="Policy file or directory (repeatable; default: rules/ and policy/)."
+    )
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check = commands.add_parser("check", help="Decide one command.")
+    check.add_argument("argv", nargs="+", help="Command tokens (use -- before options).")
+    commands.add_parser("test", help="Run every rule's match/not_match examples.")
+    bulk = commands.add_parser("bulk", help="Decide every command in a file (JSON arrays or shell lines; - for stdin).")
+    bulk.add_argument("file")
+    bulk.add_argument("--summary", action="store_true", help="Print only decision counts and throughput.")
+    args = parser.parse_args()
+
+    try:
+        rules = load_rules([Path(p) for p in args.rules] or DEFAULT_SOURCES)
+    except (OSError, PolicyError) as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
+        return 2
+    trie = PolicyTrie(rules)
+
+    if args.command == "check":
+        evaluation = trie.evaluate(args.argv)
+        if args.format == "json":
+            print(json.dumps({"decision": evaluation.decision, "rules": [r.location for r in evaluation.rules]}))
+        else:
+            print(evaluation.decision or "no-match")
+            for rule in evaluation.rules:
+                print(f"  {rule.decision:<9} {rule.location}")
+        return 0
+
+    if args.command == "test":
+        failures, warnings = self_test(trie)
+        examples = sum(len(r.match) + len(r.not_match) for r in rules)
+        if args.format == "json":
+            print(json.dumps({"rules": len(rules), "examples": examples, "failures": failures, "warnings": warnings}, indent=2))
+        else:
+            for message in failures:
+                print(f"[FAIL] {message}")
+            for message in warnings:
+                print(f"[WARN] {message}")
+            print(f"{len(rules)} rules, {examples} examples, {len(failures)} failures, {len(warnings)} warnings")
+        return 1 if failures else 0
+
+    counts: dict[str, int] = {}
+    evaluated = 0
+    start = time.perf_counter()
+    try:
+        for argv in read_commands(args.file):
+            decision = trie.decide(argv) or "no-match"
+            counts[decision] = counts.get(decision, 0) + 1
+            evaluated += 1
+            if not args.summary:
+                if args.format == "json":
+                    print(json.dumps({"argv": argv, "decision": decision}))
+                else:
+                    print(f"{decision:<9} {shlex.join(argv)}")
+    except (OSError, ValueError) as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+    rate = evaluated / elapsed if elapsed else 0.0
+    summary = {"commands": evaluated, "decisions": counts, "seconds": round(elapsed, 4), "per_second": round(rate)}
+    print(json.dumps(summary) if args.format == "json" else f"{evaluated} commands in {elapsed:.3f}s ({rate:,.0f}/s): {counts}",
+          file=sys.stderr if not args.summary else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
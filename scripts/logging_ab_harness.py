@@ -4,6 +4,9 @@
 This harness intentionally creates a multi-step, granular workload and computes
 metrics only from events tagged with the current run ID. It restores all
 tracked files to their pre-run state so each execution starts from scratch.
+
+In capture mode it instead follows the records a real (or stub) agent session
+appends to ``.codexlog`` and reports the same metrics for that session only.
 """
 
 from __future__ import annotations
@@ -12,7 +15,10 @@ import argparse
 import hashlib
 import json
 import os
+import shlex
 import shutil
+import subprocess
+import sys
 import tempfile
 import time
 import uuid
@@ -91,96 +97,222 @@ def _emit_log(
         f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
 
-def _sha256(path: Path) -> str:
+def _sha256(data: bytes) -> str:
     digest = hashlib.sha256()
-    digest.update(path.read_bytes())
+    digest.update(data)
     return digest.hexdigest()
 
 
-def _workload_steps() -> list[tuple[str, Callable[[Path], str]]]:
-    def step01_create_layout(root: Path) -> str:
+class DiskFixture:
+    """Fixture filesystem rooted at a real directory (regular disk or tmpfs)."""
+
+    def __init__(self, root: Path, backend: str) -> None:
+        self.root = root
+        self.backend = backend
+
+    def describe(self) -> str:
+        return str(self.root)
+
+    def mkdir(self, rel: str) -> None:
+        (self.root / rel).mkdir(parents=True, exist_ok=True)
+
+    def write_text(self, rel: str, text: str) -> None:
+        (self.root / rel).write_text(text, encoding="utf-8")
+
+    def append_text(self, rel: str, text: str) -> None:
+        with (self.root / rel).open("a", encoding="utf-8") as f:
+            f.write(text)
+
+    def read_text(self, rel: str) -> str:
+        return (self.root / rel).read_text(encoding="utf-8")
+
+    def read_bytes(self, rel: str) -> bytes:
+        return (self.root / rel).read_bytes()
+
+    def count_lines(self, rel: str) -> int:
+        with (self.root / rel).open("r", encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def exists(self, rel: str) -> bool:
+        return (self.root / rel).exists()
+
+    def unlink(self, rel: str) -> None:
+        (self.root / rel).unlink()
+
+    def files(self, suffix: str = "") -> list[str]:
+        return [
+            p.relative_to(self.root).as_posix()
+            for p in sorted(self.root.rglob(f"*{suffix}"))
+            if p.is_file()
+        ]
+
+    def export(self, dest: Path) -> None:
+        shutil.copytree(self.root, dest, dirs_exist_ok=True)
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class MemoryFixture:
+    """Pure in-memory fixture filesystem; keeps disk latency out of step timings."""
+
+    backend = "memory"
+
+    def __init__(self) -> None:
+        self._files: dict[str, str] = {}
+        self._dirs: set[str] = set()
+
+    def describe(self) -> str:
+        return "memory://"
+
+    def mkdir(self, rel: str) -> None:
+        parts = rel.strip("/").split("/")
+        for idx in range(1, len(parts) + 1):
+            self._dirs.add("/".join(parts[:idx]))
+
+    def _require_parent(self, rel: str) -> None:
+        parent = rel.rpartition("/")[0]
+        if parent and parent not in self._dirs:
+            raise FileNotFoundError(rel)
+
+    def write_text(self, rel: str, text: str) -> None:
+        self._require_parent(rel)
+        self._files[rel] = text
+
+    def append_text(self, rel: str, text: str) -> None:
+        self._require_parent(rel)
+        self._files[rel] = self._files.get(rel, "") + text
+
+    def read_text(self, rel: str) -> str:
+        try:
+            return self._files[rel]
+        except KeyError:
+            raise FileNotFoundError(rel) from None
+
+    def read_bytes(self, rel: str) -> bytes:
+        return self.read_text(rel).encode("utf-8")
+
+    def count_lines(self, rel: str) -> int:
+        return len(self.read_text(rel).splitlines())
+
+    def exists(self, rel: str) -> bool:
+        return rel in self._files or rel in self._dirs
+
+    def unlink(self, rel: str) -> None:
+        self.read_text(rel)
+        del self._files[rel]
+
+    def files(self, suffix: str = "") -> list[str]:
+        return sorted((rel for rel in self._files if rel.endswith(suffix)), key=lambda rel: rel.split("/"))
+
+    def export(self, dest: Path) -> None:
+        for rel in self._dirs:
+            (dest / rel).mkdir(parents=True, exist_ok=True)
+        for rel, text in self._files.items():
+            (dest / rel).parent.mkdir(parents=True, exist_ok=True)
+            (dest / rel).write_text(text, encoding="utf-8")
+
+    def cleanup(self) -> None:
+        self._files.clear()
+        self._dirs.clear()
+
+
+Fixture = DiskFixture | MemoryFixture
+FIXTURE_BACKENDS = ("disk", "tmpfs", "memory")
+TMPFS_ROOT = Path("/dev/shm")
+
+
+def _create_fixture(backend: str, variant: str, fixture_dir: str = "") -> Fixture:
+    if backend == "memory":
+        return MemoryFixture()
+    prefix = f"codex-ab-{variant}-"
+    if backend == "tmpfs":
+        if not TMPFS_ROOT.is_dir():
+            raise RuntimeError(f"tmpfs fixture backend requires {TMPFS_ROOT}")
+        return DiskFixture(Path(tempfile.mkdtemp(prefix=prefix, dir=str(TMPFS_ROOT))), backend)
+    if backend == "disk":
+        parent = fixture_dir or None
+        if parent:
+            Path(parent).mkdir(parents=True, exist_ok=True)
+        return DiskFixture(Path(tempfile.mkdtemp(prefix=prefix, dir=parent)), backend)
+    raise ValueError(f"unknown fixture backend: {backend}")
+
+
+def _workload_steps() -> list[tuple[str, Callable[[Fixture], str]]]:
+    def step01_create_layout(fs: Fixture) -> str:
         for rel in ("src", "tests", "docs", "data"):
-            (root / rel).mkdir(parents=True, exist_ok=True)
+            fs.mkdir(rel)
         return "created dirs: src/tests/docs/data"
 
-    def step02_seed_files(root: Path) -> str:
-        (root / "src" / "calc.py").write_text(
+    def step02_seed_files(fs: Fixture) -> str:
+        fs.write_text(
+            "src/calc.py",
             "def add(a, b):\n    return a + b\n\n\ndef scale(values, factor):\n    return [v * factor for v in values]\n",
-            encoding="utf-8",
         )
-        (root / "tests" / "test_calc.py").write_text(
+        fs.write_text(
+            "tests/test_calc.py",
             "from src.calc import add, scale\n\n\ndef test_add():\n    assert add(2, 3) == 5\n\n\ndef test_scale():\n    assert scale([1, 2], 3) == [3, 6]\n",
-            encoding="utf-8",
         )
-        (root / "docs" / "notes.md").write_text(
+        fs.write_text(
+            "docs/notes.md",
             "# Notes\n\n- TODO: add negative tests\n- TODO: add boundary tests\n",
-            encoding="utf-8",
         )
-        (root / "data" / "payload.json").write_text(
+        fs.write_text(
+            "data/payload.json",
             json.dumps({"name": "fixture", "values": [1, 2, 3], "enabled": True}, indent=2) + "\n",
-            encoding="utf-8",
         )
         return "seeded calc.py/test_calc.py/notes.md/payload.json"
 
-    def step03_count_lines(root: Path) -> str:
+    def step03_count_lines(fs: Fixture) -> str:
         total = 0
-        for p in root.rglob("*"):
-            if p.is_file():
-                total += sum(1 for _ in p.open("r", encoding="utf-8"))
+        for rel in fs.files():
+            total += fs.count_lines(rel)
         return f"total_lines={total}"
 
-    def step04_find_todos(root: Path) -> str:
+    def step04_find_todos(fs: Fixture) -> str:
         count = 0
-        for p in root.rglob("*.md"):
-            text = p.read_text(encoding="utf-8")
-            count += text.count("TODO")
+        for rel in fs.files(".md"):
+            count += fs.read_text(rel).count("TODO")
         return f"todo_count={count}"
 
-    def step05_update_payload(root: Path) -> str:
-        payload_path = root / "data" / "payload.json"
-        payload = json.loads(payload_path.read_text(encoding="utf-8"))
+    def step05_update_payload(fs: Fixture) -> str:
+        payload = json.loads(fs.read_text("data/payload.json"))
         payload["run_tag"] = "ab-test"
         payload["values"] = [v * 2 for v in payload["values"]]
-        payload_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        fs.write_text("data/payload.json", json.dumps(payload, indent=2) + "\n")
         return "payload updated with run_tag and doubled values"
 
-    def step06_add_negative_test(root: Path) -> str:
-        test_path = root / "tests" / "test_calc.py"
-        with test_path.open("a", encoding="utf-8") as f:
-            f.write("\n\ndef test_add_negative():\n    assert add(-2, -4) == -6\n")
+    def step06_add_negative_test(fs: Fixture) -> str:
+        fs.append_text("tests/test_calc.py", "\n\ndef test_add_negative():\n    assert add(-2, -4) == -6\n")
         return "appended negative test case"
 
-    def step07_hash_source(root: Path) -> str:
-        digest = _sha256(root / "src" / "calc.py")
+    def step07_hash_source(fs: Fixture) -> str:
+        digest = _sha256(fs.read_bytes("src/calc.py"))
         return f"calc.py_sha256={digest[:16]}"
 
-    def step08_verify_imports(root: Path) -> str:
-        content = (root / "tests" / "test_calc.py").read_text(encoding="utf-8")
+    def step08_verify_imports(fs: Fixture) -> str:
+        content = fs.read_text("tests/test_calc.py")
         ok = "from src.calc import add, scale" in content
         return f"import_check={ok}"
 
-    def step09_materialize_manifest(root: Path) -> str:
-        manifest = []
-        for p in sorted(root.rglob("*")):
-            if p.is_file():
-                manifest.append(str(p.relative_to(root)))
-        (root / "data" / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    def step09_materialize_manifest(fs: Fixture) -> str:
+        manifest = fs.files()
+        fs.write_text("data/manifest.json", json.dumps(manifest, indent=2) + "\n")
         return f"manifest_files={len(manifest)}"
 
-    def step10_remove_todo_line(root: Path) -> str:
-        notes = (root / "docs" / "notes.md").read_text(encoding="utf-8").splitlines()
+    def step10_remove_todo_line(fs: Fixture) -> str:
+        notes = fs.read_text("docs/notes.md").splitlines()
         filtered = [line for line in notes if "boundary" not in line]
-        (root / "docs" / "notes.md").write_text("\n".join(filtered) + "\n", encoding="utf-8")
+        fs.write_text("docs/notes.md", "\n".join(filtered) + "\n")
         return "removed one TODO line from notes.md"
 
-    def step11_recount_todos(root: Path) -> str:
-        text = (root / "docs" / "notes.md").read_text(encoding="utf-8")
+    def step11_recount_todos(fs: Fixture) -> str:
+        text = fs.read_text("docs/notes.md")
         return f"todo_count_after_edit={text.count('TODO')}"
 
-    def step12_cleanup_artifacts(root: Path) -> str:
-        manifest = root / "data" / "manifest.json"
-        if manifest.exists():
-            manifest.unlink()
+    def step12_cleanup_artifacts(fs: Fixture) -> str:
+        if fs.exists("data/manifest.json"):
+            fs.unlink("data/manifest.json")
         return "deleted transient manifest.json"
 
     return [
@@ -225,6 +357,10 @@ def _collect_run_metrics(codexlog: Path, run_id: str, begin: datetime, end: date
         phase = str(details.get("phase", "unknown"))
         by_phase[phase] = by_phase.get(phase, 0) + 1
 
+    return _rate_metrics(total, by_phase, begin, end)
+
+
+def _rate_metrics(total: int, by_phase: dict[str, int], begin: datetime, end: datetime) -> dict[str, Any]:
     duration = max((end - begin).total_seconds(), 1.0)
     return {
         "num_logs": total,
@@ -234,22 +370,221 @@ def _collect_run_metrics(codexlog: Path, run_id: str, begin: datetime, end: date
     }
 
 
-def run_harness(workspace: Path, codexlog: Path, prompt_log: Path, variant: str, sleep_s: float) -> dict[str, Any]:
+def _parse_ts(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class LogFollower:
+    """Follow records appended to a JSONL log after a recorded byte offset.
+
+    Each poll is a single ``stat`` when nothing changed, so tight polling stays
+    cheap. Partial trailing lines are buffered until their newline arrives, and
+    a truncated/rotated file is re-read from the start.
+    """
+
+    def __init__(self, path: Path, offset: int | None = None) -> None:
+        self.path = path
+        self.offset = offset if offset is not None else self._size()
+        self.start_offset = self.offset
+        self.malformed = 0
+        self._partial = b""
+
+    def _size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def poll(self) -> list[tuple[datetime, dict[str, Any]]]:
+        size = self._size()
+        if size < self.offset:
+            self.offset = 0
+            self._partial = b""
+        if size == self.offset:
+            return []
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+        self.offset += len(chunk)
+        lines = (self._partial + chunk).split(b"\n")
+        self._partial = lines.pop()
+        arrived = _utc_now()
+        records = []
+        for raw in lines:
+            if not raw.strip():
+                continue
+            try:
+                rec = json.loads(raw)
+            except json.JSONDecodeError:
+                self.malformed += 1
+                continue
+            if isinstance(rec, dict):
+                records.append((arrived, rec))
+            else:
+                self.malformed += 1
+        return records
+
+
+def _session_metrics(
+    records: list[tuple[datetime, dict[str, Any]]],
+    begin: datetime,
+    end: datetime,
+    bucket_seconds: float,
+    malformed: int,
+) -> dict[str, Any]:
+    by_phase: dict[str, int] = {}
+    by_level: dict[str, int] = {}
+    by_bucket: dict[str, int] = {}
+    bucket_seconds = max(bucket_seconds, 0.001)
+    for arrived, rec in records:
+        details = rec.get("details", {})
+        phase = str(details.get("phase", "unknown")) if isinstance(details, dict) else "unknown"
+        by_phase[phase] = by_phase.get(phase, 0) + 1
+        level = str(rec.get("level", "UNKNOWN"))
+        by_level[level] = by_level.get(level, 0) + 1
+        ts = _parse_ts(rec.get("ts")) or arrived
+        offset = max((ts - begin).total_seconds(), 0.0)
+        bucket = f"{int(offset // bucket_seconds) * bucket_seconds:g}"
+        by_bucket[bucket] = by_bucket.get(bucket, 0) + 1
+
+    metrics = _rate_metrics(len(records), by_phase, begin, end)
+    metrics.update(
+        {
+            "logs_by_level": by_level,
+            "bucket_seconds": bucket_seconds,
+            "logs_by_time_bucket": dict(sorted(by_bucket.items(), key=lambda item: float(item[0]))),
+            "malformed_lines": malformed,
+        }
+    )
+    return metrics
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class CaptureError(RuntimeError):
+    """Live capture could not start; the log files were left as found."""
+
+
+def run_capture(
+    codexlog: Path,
+    variant: str,
+    command: list[str] | None = None,
+    attach_pid: int | None = None,
+    timeout_s: float = 0.0,
+    poll_interval: float = 0.1,
+    bucket_seconds: float = 10.0,
+) -> dict[str, Any]:
+    """Measure the logging of one live session instead of the synthetic workload.
+
+    The current ``.codexlog`` size is recorded first; only records appended
+    after that offset while the launched command (or attached PID) is alive are
+    counted. Unlike ``run_harness`` the log is not restored, since it holds real
+    session output.
+    """
+    if command is None and attach_pid is None and timeout_s <= 0:
+        raise ValueError("capture needs a command, an attach PID, or a timeout")
+
+    run_id = f"capture-{variant}-{uuid.uuid4().hex[:10]}"
+    follower = LogFollower(codexlog)
+    begin = _utc_now()
+    records: list[tuple[datetime, dict[str, Any]]] = []
+    report: dict[str, Any] = {
+        "run_id": run_id,
+        "variant": variant,
+        "mode": "capture",
+        "begin_time": begin.isoformat(),
+        "codexlog": str(codexlog),
+        "start_offset": follower.start_offset,
+        "command": command or [],
+        "attach_pid": attach_pid,
+        "status": "running",
+    }
+
+    try:
+        proc = subprocess.Popen(command) if command else None
+    except OSError as exc:
+        # Nothing has been written yet, so there is nothing to undo.
+        raise CaptureError(f"cannot launch capture command {shlex.join(command or [])!r}: {exc}") from exc
+    deadline = time.monotonic() + timeout_s if timeout_s > 0 else None
+    status = "completed"
+    try:
+        while True:
+            records.extend(follower.poll())
+            if proc is not None and proc.poll() is not None:
+                break
+            if attach_pid is not None and not _pid_alive(attach_pid):
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                status = "timeout" if (proc or attach_pid) else "completed"
+                break
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        status = "interrupted"
+    finally:
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        records.extend(follower.poll())
+
+    end = _utc_now()
+    report.update(
+        {
+            "end_time": end.isoformat(),
+            "end_offset": follower.offset,
+            "exit_code": proc.returncode if proc is not None else None,
+            "metrics": _session_metrics(records, begin, end, bucket_seconds, follower.malformed),
+            "status": status,
+        }
+    )
+    return report
+
+
+def run_harness(
+    workspace: Path,
+    codexlog: Path,
+    prompt_log: Path,
+    variant: str,
+    sleep_s: float,
+    fixture_backend: str = "disk",
+    fixture_dir: str = "",
+) -> dict[str, Any]:
     run_id = f"ab-{variant}-{uuid.uuid4().hex[:10]}"
     begin = _utc_now()
 
     codexlog_snapshot = _read_snapshot(codexlog)
     prompt_snapshot = _read_snapshot(prompt_log)
-    fixture_root = Path(tempfile.mkdtemp(prefix=f"codex-ab-{variant}-"))
+    fixture = _create_fixture(fixture_backend, variant, fixture_dir)
 
     report: dict[str, Any] = {
         "run_id": run_id,
         "variant": variant,
         "begin_time": begin.isoformat(),
         "directive": "Exclude tasks and decisions from previous test runs from all step calculations.",
+        "fixture": {"backend": fixture.backend, "root": fixture.describe()},
         "steps": [],
         "status": "running",
     }
+    step_time_ms = 0.0
 
     try:
         _emit_log(
@@ -264,7 +599,7 @@ def run_harness(workspace: Path, codexlog: Path, prompt_log: Path, variant: str,
                 "reasoning": "Need reproducible and unbiased A/B comparisons",
                 "confidence": "95%",
             },
-            f"fixture={fixture_root}",
+            f"fixture={fixture.describe()} backend={fixture.backend}",
         )
 
         steps = _workload_steps()
@@ -284,8 +619,13 @@ def run_harness(workspace: Path, codexlog: Path, prompt_log: Path, variant: str,
                 },
             )
 
-            output = fn(fixture_root)
-            report["steps"].append({"index": idx, "name": name, "output": output})
+            step_start = time.perf_counter()
+            output = fn(fixture)
+            elapsed_ms = (time.perf_counter() - step_start) * 1000.0
+            step_time_ms += elapsed_ms
+            report["steps"].append(
+                {"index": idx, "name": name, "output": output, "elapsed_ms": round(elapsed_ms, 3)}
+            )
 
             _emit_log(
                 codexlog,
@@ -307,6 +647,7 @@ def run_harness(workspace: Path, codexlog: Path, prompt_log: Path, variant: str,
 
         end = _utc_now()
         metrics = _collect_run_metrics(codexlog, run_id, begin, end)
+        report["fixture"]["step_time_ms"] = round(step_time_ms, 3)
         report.update(
             {
                 "end_time": end.isoformat(),
@@ -332,11 +673,12 @@ def run_harness(workspace: Path, codexlog: Path, prompt_log: Path, variant: str,
 
         return report
     finally:
-        # First copy fixture_root to another location for post-test examination
+        # First copy the fixture to another location for post-test examination
         archive_dir = workspace / f"ab_test_archive/{run_id}/{variant}/"
-        shutil.copytree(fixture_root, archive_dir, dirs_exist_ok=True)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        fixture.export(archive_dir)
         shutil.copytree(symlinks=True, src=archive_dir, dst=f"/tmp/ab_test_latest/{variant}", dirs_exist_ok=True)
-        shutil.rmtree(fixture_root, ignore_errors=True)
+        fixture.cleanup()
         _restore_snapshot(codexlog_snapshot)
         _restore_snapshot(prompt_snapshot)
         report["post_state_restored"] = True
@@ -354,15 +696,45 @@ def main() -> int:
         default="",
         help="Optional report output path. If omitted, report is printed to stdout only.",
     )
+    parser.add_argument(
+        "--fixture-backend",
+        choices=FIXTURE_BACKENDS,
+        default="disk",
+        help="Where the workload fixture lives: disk (tempdir), tmpfs (/dev/shm) or memory.",
+    )
+    parser.add_argument("--fixture-dir", default="", help="Parent directory for the disk fixture backend.")
+    capture = parser.add_argument_group("live capture", "Measure a real session's .codexlog output instead.")
+    capture.add_argument("--capture-command", default="", help="Command to launch and measure (shell-quoted string).")
+    capture.add_argument("--attach-pid", type=int, default=None, help="Measure until an existing process exits.")
+    capture.add_argument("--capture-timeout", type=float, default=0.0, help="Stop following after N seconds.")
+    capture.add_argument("--poll-interval", type=float, default=0.1, help="Log polling interval (seconds).")
+    capture.add_argument("--bucket-seconds", type=float, default=10.0, help="Time bucket width for counts.")
     args = parser.parse_args()
 
-    report = run_harness(
-        workspace=Path(args.workspace),
-        codexlog=Path(args.codexlog),
-        prompt_log=Path(args.prompt_log),
-        variant=args.variant,
-        sleep_s=max(0.0, args.sleep),
-    )
+    if args.capture_command or args.attach_pid is not None or args.capture_timeout > 0:
+        try:
+            report = run_capture(
+                codexlog=Path(args.codexlog),
+                variant=args.variant,
+                command=shlex.split(args.capture_command) if args.capture_command else None,
+                attach_pid=args.attach_pid,
+                timeout_s=args.capture_timeout,
+                poll_interval=max(0.01, args.poll_interval),
+                bucket_seconds=args.bucket_seconds,
+            )
+        except CaptureError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+    else:
+        report = run_harness(
+            workspace=Path(args.workspace),
+            codexlog=Path(args.codexlog),
+            prompt_log=Path(args.prompt_log),
+            variant=args.variant,
+            sleep_s=max(0.0, args.sleep),
+            fixture_backend=args.fixture_backend,
+            fixture_dir=args.fixture_dir,
+        )
 
     rendered = json.dumps(report, indent=2, ensure_ascii=False)
     if args.report_file:
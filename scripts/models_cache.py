@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Split models_cache.json into a small index and a lazily read blob file.
+
+Most of models_cache.json is a few large per-model values
+(``base_instructions``, ``model_messages``). ``split_cache`` writes:
+
+- ``index.json``: top-level fields (``etag``, ``fetched_at``, ...), every
+  small per-model field, and for each large field its ``[offset, length,
+  sha256]`` in the blob file;
+- ``blobs-<digest>.bin``: the large values as JSON, each distinct value
+  stored once (several models share the same instructions).
+
+``ModelsCache`` reads only the index and maps the blob file when opened, so
+a later rebuild that replaces the blob does not break it; large fields are
+decoded from the mapping on first access. ``refresh`` rebuilds the split files only
+when the source's ``etag``/``fetched_at`` differ from the recorded ones,
+and reads just the head of the source to find out.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from prompt_headers import REPO_ROOT, codex_cache_dir
+
+
+INDEX_VERSION = 1
+INDEX_NAME = "index.json"
+DEFAULT_SOURCE = REPO_ROOT / "models_cache.json"
+# Per-model values whose JSON encoding is larger than this go to the blob file.
+HEAVY_BYTES = 1024
+HEAD_BYTES = 4096
+_HEAD_FIELD_RE = re.compile(r'"(etag|fetched_at)"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def default_split_dir() -> Path:
+    return codex_cache_dir("models-split")
+
+
+def source_version(source: Path) -> dict[str, str | None]:
+    """``etag`` and ``fetched_at`` of a models_cache.json, read from its head.
+
+    Codex writes them before the ``models`` list; fall back to a full parse
+    if they are not found there.
+    """
+    with source.open("rb") as handle:
+        head = handle.read(HEAD_BYTES).decode("utf-8", errors="ignore")
+    found = {key: json.loads(value) for key, value in _HEAD_FIELD_RE.findall(head.split('"models"', 1)[0])}
+    if len(found) < 2:
+        data = json.loads(source.read_text(encoding="utf-8"))
+        found = {"etag": data.get("etag"), "fetched_at": data.get("fetched_at")}
+    return {"etag": found.get("etag"), "fetched_at": found.get("fetched_at")}
+
+
+def split_cache(source: Path, split_dir: Path) -> dict[str, Any]:
+    """Write index.json and the blob file for source; return the index."""
+    raw = source.read_bytes()
+    data = json.loads(raw)
+    blob = bytearray()
+    offsets: dict[str, list[Any]] = {}
+    models = []
+    for model in data.get("models", []):
+        fields: dict[str, Any] = {}
+        lazy: dict[str, list[Any]] = {}
+        for key, value in model.items():
+            encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if len(encoded) <= HEAVY_BYTES:
+                fields[key] = value
+                continue
+            digest = hashlib.sha256(encoded).hexdigest()
+            if digest not in offsets:
+                offsets[digest] = [len(blob), len(encoded), digest]
+                blob += encoded
+            lazy[key] = offsets[digest]
+        models.append({"fields": fields, "lazy": lazy})
+
+    blob_digest = hashlib.sha256(blob).hexdigest()
+    blob_name = f"blobs-{blob_digest[:16]}.bin"
+    stat = source.stat()
+    index = {
+        "version": INDEX_VERSION,
+        "source": str(source.resolve()),
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "source_sha256": hashlib.sha256(raw).hexdigest(),
+        "top": {key: value for key, value in data.items() if key != "models"},
+        "blob": blob_name,
+        "blob_size": len(blob),
+        "models": models,
+    }
+    split_dir.mkdir(parents=True, exist_ok=True)
+    blob_path = split_dir / blob_name
+    if not blob_path.exists():
+        tmp_blob = split_dir / f"{blob_name}.{os.getpid()}.tmp"
+        tmp_blob.write_bytes(blob)
+        os.replace(tmp_blob, blob_path)
+    _write_index(split_dir, index)
+    # Readers holding an mmap of an old blob keep it alive after unlink.
+    for stale in split_dir.glob("blobs-*.bin"):
+        if stale.name != blob_name:
+            stale.unlink(missing_ok=True)
+    return index
+
+
+def _write_index(split_dir: Path, index: dict[str, Any]) -> None:
+    tmp_path = split_dir / f"{INDEX_NAME}.{os.getpid()}.tmp"
+    tmp_path.write_text(json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, split_dir / INDEX_NAME)
+
+
+def _read_index(split_dir: Path) -> dict[str, Any] | None:
+    try:
+        index = json.loads((split_dir / INDEX_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION or not (split_dir / index["blob"]).exists():
+        return None
+    return index
+
+
+def refresh(source: Path = DEFAULT_SOURCE, split_dir: Path | None = None, force: bool = False) -> tuple[dict[str, Any], str]:
+    """Bring the split files up to date with source.
+
+    Returns (index, action) where action is ``unchanged`` (same file),
+    ``same-version`` (file rewritten with the same etag/fetched_at; only the
+    recorded stat is updated) or ``rebuilt``.
+    """
+    split_dir = split_dir or default_split_dir()
+    index = None if force else _read_index(split_dir)
+    if index is not None and index["source"] == str(source.resolve()):
+        stat = source.stat()
+        if index["source_mtime_ns"] == stat.st_mtime_ns and index["source_size"] == stat.st_size:
+            return index, "unchanged"
+        version = source_version(source)
+        if version["etag"] == index["top"].get("etag") and version["fetched_at"] == index["top"].get("fetched_at"):
+            index["source_mtime_ns"], index["source_size"] = stat.st_mtime_ns, stat.st_size
+            _write_index(split_dir, index)
+            return index, "same-version"
+    return split_cache(source, split_dir), "rebuilt"
+
+
+def fetched_age_seconds(fetched_at: str | None) -> float | None:
+    """Seconds since an RFC 3339 ``fetched_at`` (nanosecond precision allowed)."""
+    from datetime import datetime, timezone
+
+    if not fetched_at:
+        return None
+    match = re.match(r"(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)?$", fetched_at)
+    if not match:
+        return None
+    stamp = datetime.fromisoformat(match.group(1) + (match.group(3) or "Z").replace("Z", "+00:00"))
+    stamp = stamp.replace(microsecond=int((match.group(2) or "0")[:6].ljust(6, "0")))
+    return (datetime.now(timezone.utc) - stamp).total_seconds()
+
+
+class ModelEntry(Mapping[str, Any]):
+    """Read-only model record; large fields are decoded from the blob on access."""
+
+    def __init__(self, cache: ModelsCache, record: dict[str, Any]) -> None:
+        self._cache = cache
+        self._fields = record["fields"]
+        self._lazy = record["lazy"]
+        self._loaded: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return self._fields[key]
+        if key not in self._lazy:
+            raise KeyError(key)
+        if key not in self._loaded:
+            offset, length, _ = self._lazy[key]
+            self._loaded[key] = self._cache._read_blob(offset, length)
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        yield from self._lazy
+
+    def __len__(self) -> int:
+        return len(self._fields) + len(self._lazy)
+
+    def digest(self, key: str) -> str | None:
+        """sha256 of a large field's JSON encoding, without reading it."""
+        entry = self._lazy.get(key)
+        return entry[2] if entry else None
+
+
+class ModelsCache:
+    """Index-only view of a split models cache."""
+
+    def __init__(self, split_dir: Path, index: dict[str, Any]) -> None:
+        self.split_dir = split_dir
+        self.index = index
+        self.top: dict[str, Any] = index["top"]
+        self.models = [ModelEntry(self, record) for record in index["models"]]
+        # Mapped now rather than on first access: a rebuild unlinks the old
+        # blob, and only an existing mapping keeps it readable.
+        self._mmap: mmap.mmap | None = None
+        if index["blob_size"]:
+            with (split_dir / index["blob"]).open("rb") as handle:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def load(cls, source: Path = DEFAULT_SOURCE, split_dir: Path | None = None, check: bool = True) -> ModelsCache:
+        """Open the split cache, refreshing it from source first when check is set."""
+        split_dir = split_dir or default_split_dir()
+        index = refresh(source, split_dir)[0] if check else _read_index(split_dir)
+        if index is None:
+            index = split_cache(source, split_dir)
+        try:
+            return cls(split_dir, index)
+        except FileNotFoundError:
+            # Another process rebuilt the split files after the index was read.
+            return cls(split_dir, _read_index(split_dir) or split_cache(source, split_dir))
+
+    def model(self, slug: str) -> ModelEntry | None:
+        return next((model for model in self.models if model["slug"] == slug), None)
+
+    def _read_blob(self, offset: int, length: int) -> Any:
+        if self._mmap is None:
+            raise ValueError("models cache is closed")
+        return json.loads(self._mmap[offset : offset + length])
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _median_ms(func: Any, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return round(samples[len(samples) // 2], 3)
+
+
+def benchmark(source: Path, split_dir: Path, runs: int) -> dict[str, Any]:
+    refresh(source, split_dir)
+
+    def full_parse() -> list[Any]:
+        data = json.loads(source.read_text(encoding="utf-8"))
+        return [(m["slug"], m.get("context_window")) for m in data["models"]]
+
+    def index_only() -> list[Any]:
+        cache = ModelsCache.load(source, split_dir)
+        cache.close()
+        return [(m["slug"], m.get("context_window")) for m in cache.models]
+
+    def one_heavy_field() -> str:
+        cache = ModelsCache.load(source, split_dir)
+        text = cache.models[0]["base_instructions"]
+        cache.close()
+        return text
+
+    index_size = (split_dir / INDEX_NAME).stat().st_size
+    return {
+        "source_bytes": source.stat().st_size,
+        "index_bytes": index_size,
+        "blob_bytes": (split_dir / _read_index(split_dir)["blob"]).stat().st_size,
+        "full_parse_ms": _median_ms(full_parse, runs),
+        "split_index_ms": _median_ms(index_only, runs),
+        "split_index_plus_one_field_ms": _median_ms(one_heavy_field, runs),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Split models_cache.json into an index and a lazily read blob file.")
+    parser.add_argument("--source", default=str(DEFAULT_SOURCE), help="models_cache.json to read.")
+    parser.add_argument("--split-dir", default="", help="Output directory (defaults to $CODEX_HOME/cache/models-split).")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("refresh", help="Rebuild the split files if the source etag/fetched_at changed.")
+    build.add_argument("--force", action="store_true")
+    info = commands.add_parser("info", help="Show cache version, age and models from the index.")
+    info.add_argument("--ttl", type=int, default=0, help="Report the cache as stale when older than this many seconds.")
+    show = commands.add_parser("show", help="Print one model, or one field of it.")
+    show.add_argument("slug")
+    show.add_argument("field", nargs="?")
+    bench = commands.add_parser("bench", help="Time loading the split index against parsing the whole file.")
+    bench.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    split_dir = Path(args.split_dir) if args.split_dir else default_split_dir()
+    if args.command == "refresh":
+        index, action = refresh(source, split_dir, args.force)
+        print(json.dumps({"action": action, "etag": index["top"].get("etag"), "fetched_at": index["top"].get("fetched_at")}))
+        return 0
+    if args.command == "bench":
+        print(json.dumps(benchmark(source, split_dir, max(1, args.runs)), indent=2))
+        return 0
+
+    cache = ModelsCache.load(source, split_dir)
+    if args.command == "info":
+        age = fetched_age_seconds(cache.top.get("fetched_at"))
+        report = {**cache.top, "age_seconds": None if age is None else round(age)}
+        if args.ttl:
+            report["stale"] = age is None or age > args.ttl
+        report["models"] = [
+            {key: model.get(key) for key in ("slug", "visibility", "context_window", "default_reasoning_level")}
+            for model in cache.models
+        ]
+        print(json.dumps(report, indent=2))
+        return 1 if report.get("stale") else 0
+    model = cache.model(args.slug)
+    if model is None:
+        parser.error(f"unknown model {args.slug!r}")
+    if args.field:
+        value = model.get(args.field)
+        print(value if isinstance(value, str) else json.dumps(value, indent=2))
+    else:
+        print(json.dumps(dict(model), indent=2))
+    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Find redundant prefix rules and write a minimized, equivalent policy.
+
+Built on execpolicy.py's trie. A rule R can be removed without changing any
+decision when every concrete prefix it stands for already has, at the same
+or a shorter depth of the trie, another kept rule whose decision is at least
+as strict: every command R matches is then also matched by that rule, and
+the strictest decision wins either way. Removed rules are reported as:
+
+- ``duplicate``: same pattern and decision as a kept rule;
+- ``shadowed``: a shorter kept prefix has the same decision;
+- ``overridden``: a kept prefix has a stricter decision, so R never decides
+  anything (often a sign the policy does not do what was intended).
+
+Rules that no recorded command matched are reported as ``unused`` and are
+only dropped with ``--drop-unused``; that keeps decisions for every recorded
+command but not for commands never seen. Either way, every recorded command
+(and every ``match`` example) is re-evaluated against the minimized rules
+and the run fails if any decision changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from execpolicy import (
+    DEFAULT_SOURCES,
+    SEVERITY,
+    PolicyError,
+    PolicyTrie,
+    Rule,
+    load_rules,
+    parse_policy_text,
+    read_commands,
+)
+
+
+@dataclass
+class Removal:
+    rule: Rule
+    reason: str
+    by: Rule | None = None
+
+
+def session_commands(directory: Path) -> Iterator[list[str]]:
+    """argv lists from shell tool calls recorded in Codex session .jsonl files."""
+    for path in sorted(directory.rglob("*.jsonl")):
+        with path.open(encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                # Cheap filter; the key is JSON-escaped inside function_call arguments.
+                if "command" not in line:
+                    continue
+                try:
+                    payload = json.loads(line).get("payload") or {}
+                except ValueError:
+                    continue
+                if payload.get("type") == "local_shell_call":
+                    command = (payload.get("action") or {}).get("command")
+                elif payload.get("type") == "function_call":
+                    try:
+                        command = json.loads(payload.get("arguments") or "{}").get("command")
+                    except (ValueError, AttributeError):
+                        continue
+                else:
+                    continue
+                if isinstance(command, str):
+                    command = ["/bin/bash", "-lc", command]
+                if isinstance(command, list) and command and all(isinstance(t, str) for t in command):
+                    yield command
+
+
+def _covering_rule(trie: PolicyTrie, rule: Rule, kept: set[int]) -> Rule | None:
+    """A kept rule (not rule itself) that decides at least as strictly for all of rule's prefixes."""
+    severity = SEVERITY[rule.decision]
+    covering = None
+    for prefix in rule.expansions():
+        found = None
+        for node in trie.walk(list(prefix)):
+            for other in node.rules:
+                if other.id != rule.id and other.id in kept and SEVERITY[other.decision] >= severity:
+                    found = other
+                    break
+            if found:
+                break
+        if found is None:
+            return None
+        covering = covering or found
+    return covering
+
+
+def find_redundant(trie: PolicyTrie) -> list[Removal]:
+    """Greedy removal, longest patterns (and later duplicates) first.
+
+    Only rules covered by a still-kept rule are removed; coverage is
+    transitive (a rule covering R that is removed later is itself covered by
+    an at-least-as-strict shorter prefix), so the final set decides every
+    command exactly as the full set does.
+    """
+    kept = {rule.id for rule in trie.rules}
+    removals = []
+    for rule in sorted(trie.rules, key=lambda r: (-len(r.pattern), -r.id)):
+        by = _covering_rule(trie, rule, kept)
+        if by is None:
+            continue
+        kept.discard(rule.id)
+        if by.pattern == rule.pattern and by.decision == rule.decision:
+            reason = "duplicate"
+        elif SEVERITY[by.decision] > SEVERITY[rule.decision]:
+            reason = "overridden"
+        else:
+            reason = "shadowed"
+        removals.append(Removal(rule, reason, by))
+    return removals
+
+
+def unused_rules(trie: PolicyTrie, commands: Iterable[list[str]]) -> list[Rule]:
+    hit: set[int] = set()
+    for argv in commands:
+        for node in trie.walk(argv):
+            hit.update(rule.id for rule in node.rules)
+    return [rule for rule in trie.rules if rule.id not in hit]
+
+
+def verify(full: PolicyTrie, minimized: PolicyTrie, commands: Iterable[list[str]]) -> list[dict[str, Any]]:
+    mismatches = []
+    for argv in commands:
+        before, after = full.decide(argv), minimized.decide(argv)
+        if before != after:
+            mismatches.append({"argv": argv, "before": before, "after": after})
+    return mismatches
+
+
+def _offset(lines: list[str], line: int, col: int) -> int:
+    """Character offset in "".join(lines) of a 1-based line and UTF-8 byte column."""
+    return sum(len(text) for text in lines[: line - 1]) + len(lines[line - 1].encode("utf-8")[:col].decode("utf-8"))
+
+
+def _rule_span(rule: Rule, lines: list[str]) -> tuple[int, int]:
+    return _offset(lines, rule.line, rule.col), _offset(lines, rule.end_line, rule.end_col)
+
+
+def _rule_text(rule: Rule, lines_by_source: dict[str, list[str]]) -> str:
+    lines = lines_by_source[rule.source]
+    start, end = _rule_span(rule, lines)
+    return "".join(lines)[start:end]
+
+
+def render_minimized(rules: list[Rule], lines_by_source: dict[str, list[str]]) -> str:
+    """One policy file holding the kept rules' original text, grouped by source."""
+    out = []
+    source = None
+    for rule in rules:
+        if rule.source != source:
+            source = rule.source
+            out.append(f"{chr(10) if out else ''}# from {source}\n")
+        out.append(_rule_text(rule, lines_by_source) + "\n")
+    return "".join(out)
+
+
+_SEPARATOR_RE = re.compile(r"[ \t]*;[ \t]*")
+_LEADING_SEPARATOR_RE = re.compile(r"[ \t]*;[ \t]*$")
+
+
+def _delete_rules(lines: list[str], rules: list[Rule]) -> str:
+    """Source text with the given rules' calls cut out by column.
+
+    Each call goes with the ';' after it, or the one before it when it ends
+    its line. Other statements sharing a line are kept. A line left empty is
+    dropped along with one following blank separator line.
+    """
+    text = "".join(lines)
+    for rule in sorted(rules, key=lambda r: (r.line, r.col), reverse=True):
+        start, end = _rule_span(rule, lines)
+        separator = _SEPARATOR_RE.match(text, end)
+        if separator:
+            end = separator.end()
+        else:
+            # Last call on a shared line: take the separator before it instead.
+            separator = _LEADING_SEPARATOR_RE.search(text, text.rfind("\n", 0, start) + 1, start)
+            if separator:
+                start = separator.start()
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", end)
+        line_end = len(text) if line_end < 0 else line_end + 1
+        if not (text[line_start:start] + text[end:line_end]).strip():
+            start, end = line_start, line_end
+            next_end = text.find("\n", end)
+            next_line = text[end : len(text) if next_end < 0 else next_end + 1]
+            if next_line and not next_line.strip():
+                end += len(next_line)
+        text = text[:start] + text[end:]
+    return text
+
+
+def _same_rules(a: list[Rule], b: list[Rule]) -> bool:
+    return [(r.pattern, r.decision) for r in a] == [(r.pattern, r.decision) for r in b]
+
+
+def rewrite_sources(
+    removed: list[Rule], lines_by_source: dict[str, list[str]], full: PolicyTrie, commands: list[list[str]]
+) -> list[str]:
+    """Delete removed rules from their source files; return the files changed.
+
+    Nothing is written unless every rewritten file parses back to exactly its
+    kept rules and the resulting policy decides every command as full does.
+    """
+    removed_ids = {rule.id for rule in removed}
+    by_source: dict[str, list[Rule]] = {}
+    for rule in removed:
+        by_source.setdefault(rule.source, []).append(rule)
+    texts = {source: _delete_rules(lines_by_source[source], rules) for source, rules in by_source.items()}
+    rewritten: list[Rule] = []
+    for source in dict.fromkeys(rule.source for rule in full.rules):
+        original = [rule for rule in full.rules if rule.source == source]
+        if source not in texts:
+            rewritten += original
+            continue
+        parsed = parse_policy_text(texts[source], Path(source), len(rewritten))
+        if not _same_rules(parsed, [rule for rule in original if rule.id not in removed_ids]):
+            raise PolicyError(f"{source}: rewritten file does not parse back to the kept rules; left unchanged")
+        rewritten += parsed
+    mismatches = verify(full, PolicyTrie(rewritten), commands)
+    if mismatches:
+        raise PolicyError(f"rewritten sources change {len(mismatches)} decision(s), e.g. {mismatches[0]}; left unchanged")
+    for source, text in texts.items():
+        Path(source).write_text(text, encoding="utf-8")
+    return sorted(texts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report redundant prefix rules and emit a minimized policy.")
+    parser.add_argument(
+        "--rules", action="append", default=[], help="Policy file or directory (repeatable; default: rules/ and policy/)."
+    )
+    parser.add_argument("--commands", action="append", default=[], help="Recorded commands file (execpolicy bulk format).")
+    parser.add_argument("--sessions", action="append", default=[], help="Directory of Codex session .jsonl files.")
+    parser.add_argument("--drop-unused", action="store_true", help="Also remove rules no recorded command matched.")
+    parser.add_argument("--output", help="Write the minimized rules to this file.")
+    parser.add_argument("--in-place", action="store_true", help="Delete removed rules from their source files.")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args()
+
+    if args.drop_unused and not (args.commands or args.sessions):
+        parser.error("--drop-unused needs recorded commands (--commands or --sessions)")
+    try:
+        rules = load_rules([Path(p) for p in args.rules] or DEFAULT_SOURCES)
+        commands = [argv for path in args.commands for argv in read_commands(path)]
+        commands += [argv for directory in args.sessions for argv in session_commands(Path(directory))]
+    except (OSError, ValueError, PolicyError) as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
+        return 2
+
+    full = PolicyTrie(rules)
+    removals = find_redundant(full)
+    removed_ids = {removal.rule.id for removal in removals}
+    unused = unused_rules(full, commands) if commands else []
+    if args.drop_unused:
+        removals += [Removal(rule, "unused") for rule in unused if rule.id not in removed_ids]
+        removed_ids = {removal.rule.id for removal in removals}
+    kept = [rule for rule in rules if rule.id not in removed_ids]
+    minimized = PolicyTrie(kept)
+
+    examples = [argv for rule in rules for argv in rule.match]
+    # Dropping unused rules only promises equivalence on recorded commands.
+    checked = commands if args.drop_unused else commands + examples
+    mismatches = verify(full, minimized, checked)
+
+    lines_by_source = {source: Path(source).read_text(encoding="utf-8").splitlines(keepends=True) for source in {r.source for r in rules}}
+    if not mismatches:
+        try:
+            if args.output:
+                text = render_minimized(kept, lines_by_source)
+                output = PolicyTrie(parse_policy_text(text, Path(args.output)))
+                if not _same_rules(output.rules, kept) or verify(full, output, checked):
+                    raise PolicyError(f"{args.output}: minimized text does not reproduce the kept rules; not written")
+                Path(args.output).write_text(text, encoding="utf-8")
+            if args.in_place:
+                rewrite_sources([removal.rule for removal in removals], lines_by_source, full, checked)
+        except PolicyError as exc:
+            print(f"[ERROR] {exc}", file=sys.stderr)
+            return 2
+
+    report = {
+        "rules": len(rules),
+        "kept": len(kept),
+        "trie_nodes": [full.node_count, minimized.node_count],
+        "removed": [
+            {
+                "reason": removal.reason,
+                "rule": removal.rule.location,
+                "pattern": removal.rule.pattern,
+                "decision": removal.rule.decision,
+                "by": removal.by.location if removal.by else None,
+            }
+            for removal in removals
+        ],
+        "unused": [rule.location for rule in unused],
+        "recorded_commands": len(commands),
+        "verified_commands": len(checked),
+        "mismatches": mismatches,
+    }
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+    else:
+        for item in report["removed"]:
+            by = f" (by {item['by']})" if item["by"] else ""
+            print(f"{item['reason']:<10} {item['rule']}  {item['decision']} {json.dumps(item['pattern'])}{by}")
+        if unused and not args.drop_unused:
+            print(f"unused     {len(unused)} rule(s) matched no recorded command; --drop-unused removes them:")
+            for location in report["unused"]:
+                print(f"             {location}")
+        print(
+            f"{len(rules)} rules -> {len(kept)} (trie nodes {full.node_count} -> {minimized.node_count});"
+            f" {len(checked)} commands/examples re-checked, {len(mismatches)} decision changes"
+        )
+        for mismatch in mismatches:
+            print(f"[MISMATCH] {mismatch['argv']}: {mismatch['before']} -> {mismatch['after']}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
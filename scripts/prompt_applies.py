@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""Report which prompts apply to which files of a repository.
+
+Every prompt's ``Applies to:`` globs are compiled once into a combined
+matcher instead of being tested one by one against each path:
+
+- ``**``-style patterns that match everything are applied once per report,
+  not per file;
+- ``**/name`` patterns go into an exact basename table;
+- ``**/*.ext`` and ``**suffix`` patterns go into a reversed-suffix trie walked
+  once over each basename;
+- all remaining patterns are merged into two regexes (basename and full
+  path) whose optional lookahead groups report every pattern that matched
+  in a single pass.
+
+The tree is walked once. Per-directory results are cached keyed by the
+directory's mtime (which changes whenever an entry is added, removed or
+renamed), so a repeat run over an unchanged tree only stats directories.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from prompt_headers import DEFAULT_PROMPTS_DIR, PromptHeader, codex_cache_dir, prompt_files, read_header
+
+
+CACHE_VERSION = 1
+DEFAULT_EXCLUDES = (".git", "node_modules", "__pycache__")
+UNIVERSAL_PATTERNS = frozenset({"**", "**/*", "**/**"})
+# Directories modified this recently are not cached: a later change within the
+# same mtime tick would go unnoticed.
+RACY_WINDOW_NS = 2_000_000_000
+_WILDCARDS = set("*?[")
+_TERMINAL = ""
+
+
+def expand_braces(pattern: str) -> list[str]:
+    """Expand ``{a,b}`` sets (nesting allowed) into separate patterns."""
+    start = pattern.find("{")
+    if start < 0:
+        return [pattern]
+    depth = 0
+    for end in range(start, len(pattern)):
+        if pattern[end] == "{":
+            depth += 1
+        elif pattern[end] == "}":
+            depth -= 1
+            if depth == 0:
+                break
+    else:
+        return [pattern]
+    options: list[str] = []
+    depth = 0
+    current = ""
+    for char in pattern[start + 1 : end]:
+        if char == "," and depth == 0:
+            options.append(current)
+            current = ""
+            continue
+        depth += {"{": 1, "}": -1}.get(char, 0)
+        current += char
+    options.append(current)
+    head, tail = pattern[:start], pattern[end + 1 :]
+    return [expanded for option in options for expanded in expand_braces(head + option + tail)]
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a brace-free glob to a regex over ``/``-separated relative paths."""
+    out = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        char = pattern[i]
+        if pattern.startswith("**", i):
+            at_segment_start = i == 0 or pattern[i - 1] == "/"
+            if at_segment_start and pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            out.append(".*")
+            i += 2
+            continue
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            close = pattern.find("]", i + 2)
+            if close < 0:
+                out.append(re.escape(char))
+            else:
+                body = pattern[i + 1 : close]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = close
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def _has_wildcard(text: str) -> bool:
+    return any(char in _WILDCARDS for char in text)
+
+
+def _merged_regex(patterns: list[tuple[int, str]]) -> tuple[re.Pattern[str] | None, list[int]]:
+    # One optional lookahead per pattern: a single match() fills in the group
+    # of every pattern that matches, instead of one regex call per pattern.
+    if not patterns:
+        return None, []
+    parts = [f"(?:(?=({glob_to_regex(glob)}\\Z))|)" for _, glob in patterns]
+    return re.compile("".join(parts), re.DOTALL), [pattern_id for pattern_id, _ in patterns]
+
+
+@dataclass
+class AppliesMatcher:
+    prompts: list[str]
+    patterns: list[str] = field(default_factory=list)
+    pattern_prompts: list[list[int]] = field(default_factory=list)
+    universal: set[int] = field(default_factory=set)
+    basenames: dict[str, list[int]] = field(default_factory=dict)
+    suffix_trie: dict[str, Any] = field(default_factory=dict)
+    name_regex: re.Pattern[str] | None = None
+    name_ids: list[int] = field(default_factory=list)
+    path_regex: re.Pattern[str] | None = None
+    path_ids: list[int] = field(default_factory=list)
+    fingerprint: str = ""
+    _name_memo: dict[str, tuple[int, ...]] = field(default_factory=dict, repr=False)
+    _prompt_memo: dict[tuple[int, ...], list[int]] = field(default_factory=dict, repr=False)
+
+    def _name_hits(self, name: str) -> tuple[int, ...]:
+        hits = self._name_memo.get(name)
+        if hits is not None:
+            return hits
+        found: list[int] = list(self.basenames.get(name, ()))
+        node = self.suffix_trie
+        for char in reversed(name):
+            node = node.get(char)
+            if node is None:
+                break
+            found.extend(node.get(_TERMINAL, ()))
+        if self.name_regex is not None:
+            groups = self.name_regex.match(name).groups()
+            found.extend(self.name_ids[i] for i, group in enumerate(groups) if group is not None)
+        hits = self._name_memo[name] = tuple(found)
+        return hits
+
+    def match(self, rel_path: str, name: str) -> list[int]:
+        """Prompt indices (excluding universal prompts) whose globs match rel_path."""
+        # Basename results are memoized: large trees repeat the same file names.
+        hits = self._name_hits(name)
+        if self.path_regex is not None:
+            groups = self.path_regex.match(rel_path).groups()
+            if any(group is not None for group in groups):
+                hits += tuple(self.path_ids[i] for i, group in enumerate(groups) if group is not None)
+        prompts = self._prompt_memo.get(hits)
+        if prompts is None:
+            found = {prompt for pattern_id in hits for prompt in self.pattern_prompts[pattern_id]}
+            prompts = self._prompt_memo[hits] = sorted(found - self.universal)
+        return prompts
+
+
+def compile_matcher(headers: list[PromptHeader]) -> AppliesMatcher:
+    headers = sorted((h for h in headers if h.applies_to), key=lambda h: h.path.name)
+    matcher = AppliesMatcher(prompts=[h.path.stem for h in headers])
+    pattern_ids: dict[str, int] = {}
+    for prompt, header in enumerate(headers):
+        for raw in header.applies_to:
+            for glob in expand_braces(raw):
+                glob = glob.strip().removeprefix("./").lstrip("/")
+                if not glob:
+                    continue
+                if glob in UNIVERSAL_PATTERNS:
+                    matcher.universal.add(prompt)
+                    continue
+                if glob not in pattern_ids:
+                    pattern_ids[glob] = len(matcher.patterns)
+                    matcher.patterns.append(glob)
+                    matcher.pattern_prompts.append([])
+                matcher.pattern_prompts[pattern_ids[glob]].append(prompt)
+
+    name_patterns: list[tuple[int, str]] = []
+    path_patterns: list[tuple[int, str]] = []
+    for pattern_id, glob in enumerate(matcher.patterns):
+        if glob.startswith("**/") and "/" not in glob[3:]:
+            base = glob[3:]
+        elif glob.startswith("**") and "/" not in glob and not _has_wildcard(glob[2:]):
+            # "**.json" / "**manifest.json": any path ending in the literal.
+            base = "*" + glob[2:]
+        else:
+            path_patterns.append((pattern_id, glob))
+            continue
+        if not _has_wildcard(base):
+            matcher.basenames.setdefault(base, []).append(pattern_id)
+        elif base.startswith("*") and not _has_wildcard(base[1:]):
+            node = matcher.suffix_trie
+            for char in reversed(base[1:]):
+                node = node.setdefault(char, {})
+            node.setdefault(_TERMINAL, []).append(pattern_id)
+        else:
+            name_patterns.append((pattern_id, base))
+    matcher.name_regex, matcher.name_ids = _merged_regex(name_patterns)
+    matcher.path_regex, matcher.path_ids = _merged_regex(path_patterns)
+
+    source = json.dumps([CACHE_VERSION, matcher.prompts, [h.applies_to for h in headers]])
+    matcher.fingerprint = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return matcher
+
+
+def load_matcher(prompts_dir: Path = DEFAULT_PROMPTS_DIR) -> AppliesMatcher:
+    return compile_matcher([read_header(path) for path in prompt_files(prompts_dir)])
+
+
+def default_cache_path(root: Path) -> Path:
+    digest = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return codex_cache_dir("prompt-applies", f"{digest}.json")
+
+
+def _load_cache(cache_path: Path | None, fingerprint: str) -> dict[str, Any]:
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION or data.get("fingerprint") != fingerprint:
+        return {}
+    return data.get("dirs", {})
+
+
+def _save_cache(cache_path: Path, fingerprint: str, dirs: dict[str, Any]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    payload = {"version": CACHE_VERSION, "fingerprint": fingerprint, "dirs": dirs}
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def scan_tree(
+    root: Path,
+    matcher: AppliesMatcher,
+    cache_path: Path | None = None,
+    excludes: tuple[str, ...] = DEFAULT_EXCLUDES,
+) -> tuple[dict[str, list[int]], dict[str, int]]:
+    """Walk root once and map each file's relative path to matching prompt indices.
+
+    Returns (matches, stats); files matched only by universal prompts map to [].
+    """
+    # Excluded names change which entries a directory lists, so they are part
+    # of what the cached listings depend on.
+    source = json.dumps([matcher.fingerprint, sorted(set(excludes))])
+    fingerprint = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    cached = _load_cache(cache_path, fingerprint)
+    fresh: dict[str, Any] = {}
+    matches: dict[str, list[int]] = {}
+    stats = {"dirs": 0, "files": 0, "dirs_cached": 0}
+    racy_after = time.time_ns() - RACY_WINDOW_NS
+    skip = set(excludes)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(root, rel_dir) if rel_dir else str(root)
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            continue
+        stats["dirs"] += 1
+        entry = cached.get(rel_dir)
+        if entry is not None and entry["mtime_ns"] == mtime_ns:
+            stats["dirs_cached"] += 1
+        else:
+            subdirs: list[str] = []
+            files: dict[str, list[int]] = {}
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            try:
+                with os.scandir(abs_dir) as entries:
+                    for item in entries:
+                        if item.name in skip:
+                            continue
+                        if item.is_dir(follow_symlinks=False):
+                            subdirs.append(item.name)
+                        else:
+                            files[item.name] = matcher.match(prefix + item.name, item.name)
+            except OSError:
+                continue
+            entry = {"mtime_ns": mtime_ns, "dirs": sorted(subdirs), "files": files}
+        if entry["mtime_ns"] < racy_after:
+            fresh[rel_dir] = entry
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        for name, prompts in entry["files"].items():
+            matches[prefix + name] = prompts
+        stats["files"] += len(entry["files"])
+        stack.extend(prefix + name for name in reversed(entry["dirs"]))
+    if cache_path is not None and fresh != cached:
+        _save_cache(cache_path, fingerprint, fresh)
+    return matches, stats
+
+
+def naive_scan(matcher: AppliesMatcher, paths: list[str]) -> dict[str, list[int]]:
+    """Baseline: test every pattern against every path."""
+    compiled = [re.compile(glob_to_regex(glob) + r"\Z", re.DOTALL) for glob in matcher.patterns]
+    matches = {}
+    for path in paths:
+        prompts: set[int] = set()
+        for pattern_id, regex in enumerate(compiled):
+            if regex.match(path):
+                prompts.update(matcher.pattern_prompts[pattern_id])
+        matches[path] = sorted(prompts - matcher.universal)
+    return matches
+
+
+def build_report(matcher: AppliesMatcher, matches: dict[str, list[int]], by: str) -> dict[str, Any]:
+    universal = sorted(matcher.prompts[i] for i in matcher.universal)
+    if by == "file":
+        files = {
+            path: [matcher.prompts[i] for i in prompts] for path, prompts in sorted(matches.items()) if prompts
+        }
+        return {"files": len(matches), "universal": universal, "matches": files}
+    by_prompt: dict[str, list[str]] = {}
+    for path, prompts in sorted(matches.items()):
+        for i in prompts:
+            by_prompt.setdefault(matcher.prompts[i], []).append(path)
+    return {"files": len(matches), "universal": universal, "matches": dict(sorted(by_prompt.items()))}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report which prompts' 'Applies to' globs match files in a tree.")
+    parser.add_argument("root", nargs="?", default=".", help="Tree to scan (default: current directory).")
+    parser.add_argument("--prompts-dir", default=str(DEFAULT_PROMPTS_DIR))
+    parser.add_argument("--by", choices=("prompt", "file"), default="prompt")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--exclude", action="append", default=[], help="Directory name to skip (repeatable).")
+    parser.add_argument("--cache", default="", help="Cache file (defaults to $CODEX_HOME/cache/prompt-applies/).")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--bench", action="store_true", help="Compare against testing every glob per path.")
+    args = parser.parse_args()
+
+    root = Path(args.root).resolve()
+    cache_path = None if args.no_cache else Path(args.cache) if args.cache else default_cache_path(root)
+    start = time.perf_counter()
+    matcher = load_matcher(Path(args.prompts_dir))
+    compiled_at = time.perf_counter()
+    matches, stats = scan_tree(root, matcher, cache_path, DEFAULT_EXCLUDES + tuple(args.exclude))
+    scanned_at = time.perf_counter()
+
+    if args.bench:
+        naive = naive_scan(matcher, list(matches))
+        naive_at = time.perf_counter()
+        report = {
+            **stats,
+            "patterns": len(matcher.patterns),
+            "compile_ms": round((compiled_at - start) * 1000, 1),
+            "scan_ms": round((scanned_at - compiled_at) * 1000, 1),
+            "naive_match_ms": round((naive_at - scanned_at) * 1000, 1),
+            "identical": naive == matches,
+        }
+        print(json.dumps(report, indent=2))
+        return 0 if report["identical"] else 1
+
+    report = build_report(matcher, matches, args.by)
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{report['files']} files, {stats['dirs']} dirs ({stats['dirs_cached']} cached) in {(scanned_at - start) * 1000:.1f} ms")
+    if report["universal"]:
+        print(f"all files: {', '.join(report['universal'])}")
+    for key, values in report["matches"].items():
+        if args.by == "file":
+            print(f"{key}: {', '.join(values)}")
+        else:
+            print(f"{key}: {len(values)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
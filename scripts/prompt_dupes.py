@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""Find near-duplicate prompts with MinHash signatures and LSH banding.
+
+Each prompt body is reduced to a set of word shingles. A MinHash signature
+keeps ``num_perm`` minimum hash values over the shingles; the fraction of
+equal positions between two signatures estimates the Jaccard similarity of
+their shingle sets. Signatures are split into
+bands and only prompts sharing a band bucket are compared, so the work grows
+with the number of candidates rather than with every pair of prompts.
+
+Signatures are cached by path, mtime and size; a re-run only re-shingles
+prompts that changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from array import array
+from itertools import combinations
+from pathlib import Path
+from typing import Any
+
+from prompt_headers import DEFAULT_PROMPTS_DIR, codex_cache_dir, parse_header_text, prompt_files
+
+
+CACHE_VERSION = 1
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE = 5
+DEFAULT_THRESHOLD = 0.5
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_EMPTY = 1 << 32
+_ROTATION = 0x9E3779B9
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE) -> set[bytes]:
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words).encode("utf-8")} if words else set()
+    return {" ".join(words[i : i + size]).encode("utf-8") for i in range(len(words) - size + 1)}
+
+
+def minhash(shingle_set: set[bytes], num_perm: int = DEFAULT_NUM_PERM) -> array:
+    """One-permutation MinHash signature as ``num_perm`` unsigned 32-bit ints.
+
+    Each shingle is hashed once; the low bits pick one of ``num_perm`` bins and
+    the high 32 bits are the value kept if it is the bin's minimum. Empty bins
+    borrow the next non-empty bin's value (rotation densification), so two
+    signatures agree position-by-position with probability equal to the
+    Jaccard similarity, as with ``num_perm`` separate hash functions, at the
+    cost of a single hash per shingle.
+
+    Raises ValueError for an empty set, which has no meaningful signature.
+    """
+    if not shingle_set:
+        raise ValueError("cannot MinHash an empty shingle set")
+    signature = [_EMPTY] * num_perm
+    for shingle in shingle_set:
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "little")
+        slot = (value & 0xFFFFFFFF) % num_perm
+        value >>= 32
+        if value < signature[slot]:
+            signature[slot] = value
+    filled = [i for i, value in enumerate(signature) if value != _EMPTY]
+    if filled and len(filled) < num_perm:
+        donor = filled[0] + num_perm
+        for i in range(num_perm - 1, -1, -1):
+            if signature[i] != _EMPTY:
+                donor = i
+            else:
+                distance = donor - i if donor > i else donor + num_perm - i
+                signature[i] = (signature[donor % num_perm] + distance * _ROTATION) & 0xFFFFFFFF
+    return array("I", signature)
+
+
+def similarity(a: array, b: array) -> float:
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def default_cache_path(prompts_dir: Path) -> Path:
+    digest = hashlib.sha256(str(prompts_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return codex_cache_dir("prompt-dupes", f"{digest}.json")
+
+
+def _load_cache(cache_path: Path | None, params: dict[str, int]) -> dict[str, Any]:
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION or data.get("params") != params:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(cache_path: Path, params: dict[str, int], files: dict[str, Any]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    payload = {"version": CACHE_VERSION, "params": params, "files": files}
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
+
+
+def load_signatures(
+    prompts_dir: Path,
+    cache_path: Path | None,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE,
+) -> tuple[dict[str, array], int]:
+    """Signatures for every prompt, recomputing only changed files.
+
+    Prompts whose body has no words get no signature (they would all share
+    one bucket and look identical), so they never appear in clusters.
+
+    Returns (signatures keyed by path, number of files re-shingled).
+    """
+    params = {"num_perm": num_perm, "shingle": shingle_size}
+    cached = _load_cache(cache_path, params)
+    fresh: dict[str, Any] = {}
+    signatures: dict[str, array] = {}
+    computed = 0
+    for path in prompt_files(prompts_dir):
+        key = str(path)
+        stat = path.stat()
+        entry = cached.get(key)
+        if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            text = path.read_text(encoding="utf-8", errors="replace")
+            body = text[parse_header_text(path, text).body_offset :]
+            shingle_set = shingles(body, shingle_size)
+            signature_hex = minhash(shingle_set, num_perm).tobytes().hex() if shingle_set else ""
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "signature": signature_hex}
+            computed += 1
+        fresh[key] = entry
+        if not entry["signature"]:
+            continue
+        signature = array("I")
+        signature.frombytes(bytes.fromhex(entry["signature"]))
+        signatures[key] = signature
+    if cache_path is not None and fresh != cached:
+        _save_cache(cache_path, params, fresh)
+    return signatures, computed
+
+
+def candidate_pairs(signatures: dict[str, array], bands: int) -> set[tuple[str, str]]:
+    """Pairs of paths that share at least one LSH band bucket."""
+    keys = sorted(signatures)
+    if not keys:
+        return set()
+    num_perm = len(signatures[keys[0]])
+    if num_perm % bands:
+        raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+    rows = num_perm // bands
+    pairs: set[tuple[str, str]] = set()
+    for band in range(bands):
+        buckets: dict[bytes, list[str]] = {}
+        start, stop = band * rows, (band + 1) * rows
+        for key in keys:
+            buckets.setdefault(signatures[key][start:stop].tobytes(), []).append(key)
+        for members in buckets.values():
+            if len(members) > 1:
+                pairs.update(combinations(members, 2))
+    return pairs
+
+
+def find_clusters(
+    signatures: dict[str, array], bands: int = DEFAULT_BANDS, threshold: float = DEFAULT_THRESHOLD
+) -> tuple[list[dict[str, Any]], int]:
+    """Group prompts whose estimated similarity reaches threshold.
+
+    Returns (clusters sorted by best similarity, number of candidate pairs checked).
+    """
+    candidates = candidate_pairs(signatures, bands)
+    parent: dict[str, str] = {}
+
+    def find(key: str) -> str:
+        while parent.get(key, key) != key:
+            parent[key] = parent.get(parent[key], parent[key])
+            key = parent[key]
+        return key
+
+    scored = []
+    for a, b in sorted(candidates):
+        score = similarity(signatures[a], signatures[b])
+        if score >= threshold:
+            scored.append((a, b, score))
+            parent[find(a)] = find(b)
+    groups: dict[str, dict[str, Any]] = {}
+    for a, b, score in scored:
+        group = groups.setdefault(find(a), {"members": set(), "pairs": []})
+        group["members"].update((a, b))
+        group["pairs"].append({"a": Path(a).name, "b": Path(b).name, "similarity": round(score, 3)})
+    clusters = []
+    for group in groups.values():
+        pairs = sorted(group["pairs"], key=lambda pair: -pair["similarity"])
+        clusters.append(
+            {
+                "members": sorted(Path(member).name for member in group["members"]),
+                "max_similarity": pairs[0]["similarity"],
+                "pairs": pairs,
+            }
+        )
+    clusters.sort(key=lambda cluster: (-cluster["max_similarity"], cluster["members"]))
+    return clusters, len(candidates)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report near-duplicate prompts using MinHash and LSH.")
+    parser.add_argument("--prompts-dir", default=str(DEFAULT_PROMPTS_DIR))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Minimum estimated Jaccard similarity.")
+    parser.add_argument("--num-perm", type=int, default=DEFAULT_NUM_PERM, help="Signature length.")
+    parser.add_argument("--bands", type=int, default=DEFAULT_BANDS, help="LSH bands (must divide --num-perm).")
+    parser.add_argument("--shingle", type=int, default=DEFAULT_SHINGLE, help="Words per shingle.")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--cache", default="", help="Signature cache (defaults to $CODEX_HOME/cache/prompt-dupes/).")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    if args.num_perm % args.bands:
+        parser.error("--num-perm must be a multiple of --bands")
+    prompts_dir = Path(args.prompts_dir).resolve()
+    cache_path = None if args.no_cache else Path(args.cache) if args.cache else default_cache_path(prompts_dir)
+    start = time.perf_counter()
+    signatures, computed = load_signatures(prompts_dir, cache_path, args.num_perm, args.shingle)
+    signed_at = time.perf_counter()
+    clusters, checked = find_clusters(signatures, args.bands, args.threshold)
+    done_at = time.perf_counter()
+    total_pairs = len(signatures) * (len(signatures) - 1) // 2
+    stats = {
+        "prompts": len(signatures),
+        "signatures_computed": computed,
+        "candidate_pairs": checked,
+        "all_pairs": total_pairs,
+        "signature_ms": round((signed_at - start) * 1000, 1),
+        "lsh_ms": round((done_at - signed_at) * 1000, 1),
+    }
+    if args.format == "json":
+        print(json.dumps({"stats": stats, "clusters": clusters}, indent=2))
+        return 0
+    print(
+        f"{stats['prompts']} prompts ({computed} re-shingled), {checked}/{total_pairs} pairs compared,"
+        f" {len(clusters)} clusters >= {args.threshold} in {(done_at - start) * 1000:.1f} ms"
+    )
+    for cluster in clusters:
+        print(f"\n[{cluster['max_similarity']:.2f}] {', '.join(cluster['members'])}")
+        for pair in cluster["pairs"]:
+            print(f"  {pair['similarity']:.2f}  {pair['a']} ~ {pair['b']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
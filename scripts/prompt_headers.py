@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Read the metadata header at the top of prompts/*.md files.
+
+Prompt files start with ``# <name>`` followed by ``Key: value`` lines such as
+``Description:``, ``Applies to:`` and ``Source:``. Only the header block is
+read; the body starts at the next heading.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PROMPTS_DIR = REPO_ROOT / "prompts"
+HEADER_MAX_LINES = 40
+HEADER_KEYS = {
+    "description": "description",
+    "applies to": "applies_to",
+    "source": "source",
+    "codex note": "codex_note",
+}
+_FIELD_RE = re.compile(r"^([A-Za-z][A-Za-z ]{0,30}):\s*(.*)$")
+
+
+@dataclass
+class PromptHeader:
+    path: Path
+    name: str
+    description: str = ""
+    applies_to: list[str] = field(default_factory=list)
+    source: str = ""
+    codex_note: str = ""
+    body_offset: int = 0
+
+
+def codex_cache_dir(*parts: str) -> Path:
+    home = Path(os.environ.get("CODEX_HOME", Path.home() / ".codex"))
+    return home.joinpath("cache", *parts)
+
+
+def split_globs(raw: str) -> list[str]:
+    """Split an ``Applies to`` value: ``a, b``, ``['a', "b"]`` and brace sets stay intact."""
+    raw = raw.strip()
+    if raw.startswith("[") and raw.endswith("]"):
+        raw = raw[1:-1]
+    patterns: list[str] = []
+    depth = 0
+    current = ""
+    for char in raw:
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth = max(0, depth - 1)
+        if char == "," and depth == 0:
+            patterns.append(current)
+            current = ""
+        else:
+            current += char
+    patterns.append(current)
+    return [p.strip().strip("'\"").strip() for p in patterns if p.strip().strip("'\"").strip()]
+
+
+def parse_header_text(path: Path, text: str) -> PromptHeader:
+    """Parse the header from already-read text (body_offset is a character offset)."""
+    lines = text.splitlines(keepends=True)
+    header = PromptHeader(path=path, name=path.stem)
+    offset = 0
+    for index, line in enumerate(lines[:HEADER_MAX_LINES]):
+        stripped = line.strip()
+        if index == 0 and stripped.startswith("# "):
+            header.name = stripped[2:].strip() or header.name
+        elif stripped.startswith("#") and index > 0:
+            break
+        else:
+            match = _FIELD_RE.match(stripped)
+            key = HEADER_KEYS.get(match.group(1).strip().lower()) if match else None
+            if key == "applies_to":
+                header.applies_to = split_globs(match.group(2))
+            elif key:
+                setattr(header, key, match.group(2).strip())
+            elif stripped and index > 0:
+                break
+        offset += len(line)
+    header.body_offset = offset
+    return header
+
+
+def read_header(path: Path) -> PromptHeader:
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        head = "".join(line for _, line in zip(range(HEADER_MAX_LINES), handle))
+    return parse_header_text(path, head)
+
+
+def prompt_files(prompts_dir: Path = DEFAULT_PROMPTS_DIR) -> list[Path]:
+    return sorted(path for path in prompts_dir.glob("*.md") if path.is_file())
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""BM25 search over prompts/*.md.
+
+Each prompt's header (name, ``Description:``, ``Applies to:``, ``Source:``)
+and body are tokenized into an inverted index kept in a small SQLite file.
+Header fields are weighted above body text. The index is refreshed
+incrementally: only files whose mtime or size changed are re-tokenized, so a
+query costs one directory stat pass plus a handful of indexed lookups.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import shutil
+import sqlite3
+import subprocess
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from prompt_headers import DEFAULT_PROMPTS_DIR, codex_cache_dir, parse_header_text, prompt_files
+
+
+INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Term weights per field: a query word in the name or description should
+# outrank the same word buried once in a long body.
+FIELD_WEIGHTS = {"name": 4, "description": 3, "applies_to": 2, "source": 1, "body": 1}
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with you your".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    name TEXT,
+    description TEXT,
+    applies_to TEXT,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc);
+"""
+
+
+@dataclass
+class Hit:
+    path: str
+    name: str
+    description: str
+    score: float
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def default_index_path(prompts_dir: Path) -> Path:
+    digest = hashlib.sha256(str(prompts_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return codex_cache_dir("prompt-index", f"{digest}.sqlite")
+
+
+def _weighted_terms(path: Path, text: str) -> tuple[Counter[str], dict[str, Any]]:
+    header = parse_header_text(path, text)
+    fields = {
+        "name": header.name.replace("-", " "),
+        "description": header.description,
+        "applies_to": " ".join(header.applies_to),
+        "source": header.source,
+        "body": text[header.body_offset :],
+    }
+    terms: Counter[str] = Counter()
+    for field_name, value in fields.items():
+        weight = FIELD_WEIGHTS[field_name]
+        for token in tokenize(value):
+            terms[token] += weight
+    meta = {
+        "name": header.name,
+        "description": header.description,
+        "applies_to": json.dumps(header.applies_to),
+        "source": header.source,
+    }
+    return terms, meta
+
+
+def open_index(index_path: Path) -> sqlite3.Connection:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(index_path))
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    if row is None or row[0] != str(INDEX_VERSION):
+        conn.executescript("DELETE FROM postings; DELETE FROM docs; DELETE FROM meta;")
+        conn.execute("INSERT INTO meta VALUES ('version', ?)", (str(INDEX_VERSION),))
+        conn.commit()
+    return conn
+
+
+def refresh_index(conn: sqlite3.Connection, prompts_dir: Path) -> dict[str, int]:
+    """Re-tokenize prompts whose mtime/size changed and drop deleted ones."""
+    known = {
+        path: (doc_id, mtime_ns, size)
+        for doc_id, path, mtime_ns, size in conn.execute("SELECT id, path, mtime_ns, size FROM docs")
+    }
+    seen: set[str] = set()
+    updated = 0
+    with conn:
+        for path in prompt_files(prompts_dir):
+            key = str(path)
+            seen.add(key)
+            stat = path.stat()
+            previous = known.get(key)
+            if previous and previous[1] == stat.st_mtime_ns and previous[2] == stat.st_size:
+                continue
+            text = path.read_text(encoding="utf-8", errors="replace")
+            terms, meta = _weighted_terms(path, text)
+            if previous:
+                conn.execute("DELETE FROM postings WHERE doc = ?", (previous[0],))
+                conn.execute("DELETE FROM docs WHERE id = ?", (previous[0],))
+            cursor = conn.execute(
+                "INSERT INTO docs (path, mtime_ns, size, length, name, description, applies_to, source)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, stat.st_mtime_ns, stat.st_size, sum(terms.values()), meta["name"],
+                 meta["description"], meta["applies_to"], meta["source"]),
+            )
+            conn.executemany(
+                "INSERT INTO postings (term, doc, tf) VALUES (?, ?, ?)",
+                ((term, cursor.lastrowid, tf) for term, tf in terms.items()),
+            )
+            updated += 1
+        removed = [doc_id for path, (doc_id, _, _) in known.items() if path not in seen]
+        for doc_id in removed:
+            conn.execute("DELETE FROM postings WHERE doc = ?", (doc_id,))
+            conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+    return {"documents": len(seen), "updated": updated, "removed": len(removed)}
+
+
+def search(conn: sqlite3.Connection, query: str, limit: int = 10) -> list[Hit]:
+    terms = sorted(set(tokenize(query)))
+    if not terms:
+        return []
+    total_docs, total_length = conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM docs").fetchone()
+    if not total_docs:
+        return []
+    avg_length = total_length / total_docs
+    placeholders = ",".join("?" for _ in terms)
+    doc_freq = dict(
+        conn.execute(
+            f"SELECT term, COUNT(*) FROM postings WHERE term IN ({placeholders}) GROUP BY term", terms
+        )
+    )
+    scores: dict[int, float] = {}
+    rows = conn.execute(
+        f"SELECT p.term, p.doc, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc"
+        f" WHERE p.term IN ({placeholders})",
+        terms,
+    )
+    for term, doc_id, tf, length in rows:
+        df = doc_freq[term]
+        idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+        norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+        scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+    top = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    hits = []
+    for doc_id, score in top:
+        path, name, description = conn.execute(
+            "SELECT path, name, description FROM docs WHERE id = ?", (doc_id,)
+        ).fetchone()
+        hits.append(Hit(path=path, name=name, description=description or "", score=round(score, 4)))
+    return hits
+
+
+def _linear_scan(prompts_dir: Path, query: str) -> list[str]:
+    """Baseline: read every prompt and keep those containing all query terms."""
+    terms = tokenize(query)
+    matches = []
+    for path in prompt_files(prompts_dir):
+        text = path.read_text(encoding="utf-8", errors="replace").lower()
+        if all(term in text for term in terms):
+            matches.append(str(path))
+    return matches
+
+
+def _time_ms(func: Any, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return round(samples[len(samples) // 2], 3)
+
+
+def benchmark(conn: sqlite3.Connection, prompts_dir: Path, queries: list[str], runs: int) -> list[dict[str, Any]]:
+    grep = shutil.which("grep")
+    results = []
+    for query in queries:
+        row: dict[str, Any] = {"query": query}
+        row["index_ms"] = _time_ms(lambda: search(conn, query), runs)
+        row["index_with_refresh_ms"] = _time_ms(lambda: (refresh_index(conn, prompts_dir), search(conn, query)), runs)
+        row["python_scan_ms"] = _time_ms(lambda: _linear_scan(prompts_dir, query), runs)
+        terms = tokenize(query)
+        if grep and terms:
+            # grep -l for the first term only; the Python scan handles the AND.
+            cmd = [grep, "-rli", "--include=*.md", terms[0], str(prompts_dir)]
+            row["grep_ms"] = _time_ms(lambda: subprocess.run(cmd, stdout=subprocess.DEVNULL, check=False), runs)
+        results.append(row)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Ranked search over prompts/*.md using a BM25 index.")
+    parser.add_argument("query", nargs="*", help="Search terms.")
+    parser.add_argument("--prompts-dir", default=str(DEFAULT_PROMPTS_DIR))
+    parser.add_argument("--index", default="", help="Index file (defaults to $CODEX_HOME/cache/prompt-index/).")
+    parser.add_argument("-k", "--limit", type=int, default=10)
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the index and rebuild it.")
+    parser.add_argument("--no-refresh", action="store_true", help="Query the index as-is without a stat pass.")
+    parser.add_argument("--bench", action="store_true", help="Time the query against a linear scan and grep.")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per benchmark measurement.")
+    args = parser.parse_args()
+
+    prompts_dir = Path(args.prompts_dir).resolve()
+    index_path = Path(args.index) if args.index else default_index_path(prompts_dir)
+    if args.rebuild and index_path.exists():
+        index_path.unlink()
+    conn = open_index(index_path)
+    try:
+        stats = {} if args.no_refresh else refresh_index(conn, prompts_dir)
+        query = " ".join(args.query)
+        if args.bench:
+            queries = [query] if query else ["python testing", "azure bicep deployment", "accessibility wcag"]
+            report = benchmark(conn, prompts_dir, queries, max(1, args.runs))
+            print(json.dumps(report, indent=2))
+            return 0
+        if not query:
+            print(json.dumps({"index": str(index_path), **stats}))
+            return 0
+        hits = search(conn, query, args.limit)
+    finally:
+        conn.close()
+    if args.format == "json":
+        print(json.dumps([hit.__dict__ for hit in hits], indent=2))
+    else:
+        for hit in hits:
+            print(f"{hit.score:8.3f}  {hit.name}  {Path(hit.path).name}")
+            if hit.description:
+                print(f"          {hit.description[:140]}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Stand-in for a codex session that appends TRACE-style records to .codexlog.
+
+Used to exercise ``logging_ab_harness.py --capture-command`` without a real
+agent: it writes a fixed number of records with rotating levels and phases.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+LEVELS = ("TRACE", "DEBUG", "INFO")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Append synthetic agent records to a .codexlog file.")
+    parser.add_argument("--codexlog", required=True, help="Path to .codexlog JSONL file.")
+    parser.add_argument("--records", type=int, default=20, help="Number of records to append.")
+    parser.add_argument("--interval", type=float, default=0.05, help="Delay between records (seconds).")
+    parser.add_argument("--phases", type=int, default=4, help="Number of distinct phases to cycle through.")
+    args = parser.parse_args()
+
+    path = Path(args.codexlog)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for idx in range(args.records):
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "level": LEVELS[idx % len(LEVELS)],
+            "message": f"stub record {idx}",
+            "details": {"phase": f"phase_{idx % max(args.phases, 1):02d}"},
+            "output": "",
+        }
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        if args.interval > 0:
+            time.sleep(args.interval)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
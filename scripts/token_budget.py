@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Estimate token counts for prompts, skills and model base instructions.
+
+Counts are memoized by content hash (per tokenizer) in
+``$CODEX_HOME/cache/token-budget/index.json``, and files are only re-hashed
+when their mtime or size changes, so re-estimating the whole corpus costs a
+stat pass. Budgets come from ``models_cache.json`` (through the split index
+of models_cache.py): a model's usable window is
+``context_window * effective_context_window_percent / 100``, less its
+``base_instructions``.
+
+Tokenizers are pluggable: ``heuristic`` (default, offline, no dependencies),
+``tiktoken`` (if installed; falls back to the heuristic when unavailable) or
+any ``module:function`` taking a string and returning a count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from models_cache import DEFAULT_SOURCE as DEFAULT_MODELS_CACHE, ModelsCache
+from prompt_headers import DEFAULT_PROMPTS_DIR, REPO_ROOT, codex_cache_dir, prompt_files
+
+
+INDEX_VERSION = 1
+DEFAULT_SKILLS_DIR = REPO_ROOT / "skills"
+TIKTOKEN_ENCODING = "o200k_base"
+SKIP_DIRS = {".git", "__pycache__", "node_modules"}
+# Pre-tokenizer in the spirit of BPE splitters: letter runs, digit groups of
+# up to three, punctuation runs, whitespace runs.
+_PIECE_RE = re.compile(r"[^\W\d_]+|\d{1,3}|[^\w\s]+|_+|\s+")
+
+Counter = Callable[[str], int]
+
+
+def heuristic_count(text: str) -> int:
+    """Offline approximation of a BPE token count."""
+    tokens = 0
+    for piece in _PIECE_RE.findall(text):
+        first = piece[0]
+        if first.isspace():
+            # A single space merges into the following word; other runs cost one.
+            tokens += piece != " "
+        elif first.isalpha():
+            if piece.isascii():
+                tokens += (len(piece) + 5) // 6
+            else:
+                tokens += (len(piece.encode("utf-8")) + 2) // 3
+        elif first.isdigit():
+            tokens += 1
+        else:
+            tokens += (len(piece) + 1) // 2
+    return tokens
+
+
+def _tiktoken_counter() -> Counter:
+    import tiktoken
+
+    encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def load_tokenizer(spec: str) -> tuple[str, Counter]:
+    """Return (tokenizer id used as the memo key, count function).
+
+    spec is ``heuristic``, ``tiktoken`` or ``module:function``.
+    """
+    if spec == "heuristic":
+        return "heuristic-v1", heuristic_count
+    if spec == "tiktoken":
+        try:
+            return f"tiktoken:{TIKTOKEN_ENCODING}", _tiktoken_counter()
+        except Exception as exc:  # not installed, or the encoding file is not cached offline
+            print(f"tiktoken unavailable ({exc}); using the heuristic tokenizer", file=sys.stderr)
+            return "heuristic-v1", heuristic_count
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"tokenizer must be 'heuristic', 'tiktoken' or 'module:function', not {spec!r}")
+    return spec, getattr(importlib.import_module(module_name), attr)
+
+
+def default_index_path() -> Path:
+    return codex_cache_dir("token-budget", "index.json")
+
+
+def load_index(index_path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    if data.get("version") != INDEX_VERSION:
+        data = {"version": INDEX_VERSION, "counts": {}, "files": {}}
+    return data
+
+
+def save_index(index_path: Path, index: dict[str, Any]) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, index_path)
+
+
+def skill_files(skills_dir: Path) -> list[Path]:
+    found = []
+    for dirpath, dirnames, filenames in os.walk(skills_dir):
+        dirnames[:] = sorted(name for name in dirnames if name not in SKIP_DIRS)
+        if "SKILL.md" in filenames:
+            found.append(Path(dirpath) / "SKILL.md")
+    return found
+
+
+class Estimator:
+    """Token counts memoized by (tokenizer, sha256 of content)."""
+
+    def __init__(self, index: dict[str, Any], tokenizer_id: str, count: Counter) -> None:
+        self.index = index
+        self.tokenizer_id = tokenizer_id
+        self.count = count
+        self.memo: dict[str, int] = index["counts"].setdefault(tokenizer_id, {})
+        self.stats = {"hashed": 0, "counted": 0}
+        self.dirty = False
+
+    def text_tokens(self, text: str) -> tuple[str, int]:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        tokens = self.memo.get(digest)
+        if tokens is None:
+            tokens = self.memo[digest] = self.count(text)
+            self.stats["counted"] += 1
+            self.dirty = True
+        return digest, tokens
+
+    def file_tokens(self, path: Path) -> int:
+        key = str(path.resolve())
+        stat = path.stat()
+        known = self.index["files"].get(key)
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            tokens = self.memo.get(known["sha256"])
+            if tokens is not None:
+                return tokens
+        text = path.read_text(encoding="utf-8", errors="replace")
+        self.stats["hashed"] += 1
+        digest, tokens = self.text_tokens(text)
+        self.index["files"][key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+        self.dirty = True
+        return tokens
+
+
+def corpus_items(estimator: Estimator, prompts_dir: Path, skills_dir: Path) -> list[dict[str, Any]]:
+    items = []
+    for path in prompt_files(prompts_dir):
+        items.append({"kind": "prompt", "name": path.stem, "path": str(path), "tokens": estimator.file_tokens(path)})
+    for path in skill_files(skills_dir):
+        items.append(
+            {"kind": "skill", "name": path.parent.name, "path": str(path), "tokens": estimator.file_tokens(path)}
+        )
+    return items
+
+
+def model_budgets(estimator: Estimator, models_cache: Path) -> list[dict[str, Any]]:
+    cache = ModelsCache.load(models_cache)
+    budgets = []
+    for model in cache.models:
+        window = model.get("context_window")
+        if not window:
+            continue
+        percent = model.get("effective_context_window_percent") or 100
+        effective = window * percent // 100
+        # The split index knows each instruction blob's hash, so the text is
+        # only read from the blob file when its count is not memoized yet.
+        digest = model.digest("base_instructions")
+        base_tokens = estimator.memo.get(f"blob:{digest}") if digest else None
+        if base_tokens is None:
+            base_tokens = estimator.text_tokens(model.get("base_instructions") or "")[1]
+            if digest:
+                estimator.memo[f"blob:{digest}"] = base_tokens
+                estimator.dirty = True
+        budgets.append(
+            {
+                "slug": model["slug"],
+                "context_window": window,
+                "effective_percent": percent,
+                "effective_window": effective,
+                "base_instructions_tokens": base_tokens,
+                "available": effective - base_tokens,
+            }
+        )
+    cache.close()
+    return budgets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Token estimates and context budgets for prompts, skills and models.")
+    parser.add_argument("--tokenizer", default="heuristic", help="heuristic, tiktoken or module:function.")
+    parser.add_argument("--prompts-dir", default=str(DEFAULT_PROMPTS_DIR))
+    parser.add_argument("--skills-dir", default=str(DEFAULT_SKILLS_DIR))
+    parser.add_argument("--models-cache", default=str(DEFAULT_MODELS_CACHE))
+    parser.add_argument("--index", default="", help="Memo file (defaults to $CODEX_HOME/cache/token-budget/index.json).")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("build", help="Estimate every prompt, SKILL.md and base_instructions; print totals.")
+    commands.add_parser("models", help="Per-model window, base instructions and remaining budget.")
+    fits = commands.add_parser("fits", help="What fits in a model's remaining budget.")
+    fits.add_argument("model", help="Model slug from models_cache.json.")
+    fits.add_argument("--used", type=int, default=0, help="Tokens already used in the conversation.")
+    fits.add_argument("--kind", choices=("prompt", "skill"), help="Only consider one kind of item.")
+    fits.add_argument("--select", nargs="+", default=[], help="Check whether these items fit together.")
+    fits.add_argument("-k", "--limit", type=int, default=20, help="Largest fitting items to list.")
+    count = commands.add_parser("count", help="Estimate arbitrary files.")
+    count.add_argument("files", nargs="+")
+    args = parser.parse_args()
+
+    try:
+        tokenizer_id, counter = load_tokenizer(args.tokenizer)
+    except (ValueError, ImportError, AttributeError) as exc:
+        parser.error(str(exc))
+    index_path = Path(args.index) if args.index else default_index_path()
+    estimator = Estimator(load_index(index_path), tokenizer_id, counter)
+
+    if args.command == "count":
+        report: Any = [{"path": path, "tokens": estimator.file_tokens(Path(path))} for path in args.files]
+    else:
+        items = corpus_items(estimator, Path(args.prompts_dir), Path(args.skills_dir))
+        budgets = model_budgets(estimator, Path(args.models_cache))
+        if args.command == "build":
+            report = {
+                "tokenizer": tokenizer_id,
+                **estimator.stats,
+                "totals": {
+                    kind: {
+                        "items": sum(1 for item in items if item["kind"] == kind),
+                        "tokens": sum(item["tokens"] for item in items if item["kind"] == kind),
+                    }
+                    for kind in ("prompt", "skill")
+                },
+                "models": len(budgets),
+            }
+        elif args.command == "models":
+            report = budgets
+        else:
+            budget = next((b for b in budgets if b["slug"] == args.model), None)
+            if budget is None:
+                parser.error(f"unknown model {args.model!r}; choose from {', '.join(b['slug'] for b in budgets)}")
+            remaining = budget["available"] - args.used
+            pool = [item for item in items if not args.kind or item["kind"] == args.kind]
+            report = {"model": args.model, "tokenizer": tokenizer_id, "remaining": remaining}
+            if args.select:
+                by_name = {item["name"]: item for item in pool}
+                missing = [name for name in args.select if name not in by_name]
+                if missing:
+                    parser.error(f"unknown items: {', '.join(missing)}")
+                total = sum(by_name[name]["tokens"] for name in args.select)
+                report.update(selected_tokens=total, fits=total <= remaining, left_after=remaining - total)
+            else:
+                fitting = sorted((item for item in pool if item["tokens"] <= remaining), key=lambda i: -i["tokens"])
+                report.update(
+                    fitting=len(fitting),
+                    considered=len(pool),
+                    largest=[{key: item[key] for key in ("kind", "name", "tokens")} for item in fitting[: args.limit]],
+                )
+    if estimator.dirty:
+        save_index(index_path, estimator.index)
+
+    if args.format == "json" or args.command in ("build", "count"):
+        print(json.dumps(report, indent=2))
+    elif args.command == "models":
+        print(f"{'model':<22} {'window':>8} {'eff%':>5} {'base':>7} {'available':>10}")
+        for b in report:
+            print(
+                f"{b['slug']:<22} {b['context_window']:>8} {b['effective_percent']:>5}"
+                f" {b['base_instructions_tokens']:>7} {b['available']:>10}"
+            )
+    else:
+        print(f"{report['model']}: {report['remaining']} tokens remaining ({report['tokenizer']})")
+        if "fits" in report:
+            verdict = "fits" if report["fits"] else "does NOT fit"
+            print(f"selection: {report['selected_tokens']} tokens, {verdict} ({report['left_after']} left)")
+        else:
+            print(f"{report['fitting']} of {report['considered']} items fit individually; largest:")
+            for item in report["largest"]:
+                print(f"  {item['tokens']:>7}  {item['kind']:<6} {item['name']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark - Measures skill-creator entry point startup on real skills
+
+Runs `quick_validate.py <skill>` and `package_skill.py <skill> <tmpdir>` as
+fresh processes for every skill found under the given roots, once as-is
+(lazy: PyYAML only imported for complex frontmatter) and once with PyYAML
+imported up front (eager: the previous behavior), and reports median wall
+time per script and mode.
+
+Usage:
+    python benchmark_startup.py [root ...] [--runs N] [--json]
+
+Example:
+    python benchmark_startup.py ../../.. --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_ROOT = SCRIPT_DIR.parents[2]
+
+MODES = {
+    "lazy": "",
+    "eager": "import yaml; ",
+}
+SCRIPTS = ("quick_validate", "package_skill")
+
+
+def _script_args(script, skill_dir, out_dir):
+    if script == "package_skill":
+        # --force so every run validates and packages instead of hitting the up-to-date check.
+        return [str(skill_dir), str(out_dir), "--force"]
+    return [str(skill_dir)]
+
+
+def _command(script, mode, skill_dir, out_dir):
+    argv = [f"{script}.py", *_script_args(script, skill_dir, out_dir)]
+    code = (
+        f"{MODES[mode]}import runpy, sys; "
+        f"sys.path.insert(0, {str(SCRIPT_DIR)!r}); "
+        f"sys.argv = {argv!r}; "
+        f"runpy.run_path({str(SCRIPT_DIR / f'{script}.py')!r}, run_name='__main__')"
+    )
+    return [sys.executable, "-c", code]
+
+
+def _time_run(command):
+    start = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return time.perf_counter() - start
+
+
+def _yaml_imported(skill_dir):
+    """Whether validating this skill still needs PyYAML (complex frontmatter)."""
+    code = (
+        f"import sys; sys.path.insert(0, {str(SCRIPT_DIR)!r}); "
+        "from quick_validate import validate_skill; "
+        f"validate_skill({str(skill_dir)!r}); print('yaml' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False)
+    return result.stdout.strip() == "True"
+
+
+def benchmark(roots, runs):
+    skills = sorted({md.parent for root in roots for md in Path(root).rglob("SKILL.md")})
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="skill-startup-") as out_dir:
+        for skill_dir in skills:
+            row = {"skill": str(skill_dir), "yaml_imported": _yaml_imported(skill_dir)}
+            for script in SCRIPTS:
+                for mode in MODES:
+                    command = _command(script, mode, skill_dir, out_dir)
+                    _time_run(command)  # warm the page cache
+                    timings = [_time_run(command) for _ in range(runs)]
+                    row[f"{script}_{mode}_ms"] = round(statistics.median(timings) * 1000, 2)
+            rows.append(row)
+    summary = {"skills": len(rows), "runs": runs, "yaml_fallbacks": sum(row["yaml_imported"] for row in rows)}
+    for script in SCRIPTS:
+        for mode in MODES:
+            key = f"{script}_{mode}_ms"
+            summary[f"{script}_{mode}_median_ms"] = round(statistics.median(row[key] for row in rows), 2) if rows else 0
+    return {"summary": summary, "skills": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skill-creator entry point startup on real skills.")
+    parser.add_argument("roots", nargs="*", default=[str(DEFAULT_ROOT)], help="Roots to search for skills")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per skill, script and mode")
+    parser.add_argument("--json", action="store_true", help="Print the full JSON report")
+    args = parser.parse_args()
+
+    report = benchmark(args.roots, max(1, args.runs))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for row in report["skills"]:
+        note = " (yaml fallback)" if row["yaml_imported"] else ""
+        timings = "  ".join(
+            f"{script} {row[f'{script}_lazy_ms']:7.2f}/{row[f'{script}_eager_ms']:7.2f} ms" for script in SCRIPTS
+        )
+        print(f"{timings}  {row['skill']}{note}")
+    summary = report["summary"]
+    print(f"\n{summary['skills']} skills (lazy/eager medians); {summary['yaml_fallbacks']} needed PyYAML")
+    for script in SCRIPTS:
+        print(
+            f"  {script}.py: {summary[f'{script}_lazy_median_ms']} ms lazy vs "
+            f"{summary[f'{script}_eager_median_ms']} ms eager"
+        )
+
+if __name__ == "__main__":
+    main()
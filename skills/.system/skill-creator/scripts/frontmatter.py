@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Fast SKILL.md frontmatter reader
+
+Reads only up to the closing `---` and parses the common `key: value` subset
+(plus one level of nested mappings such as `metadata:`) without PyYAML.
+Anything outside that subset is handed to yaml.safe_load, which is imported
+only then, so results always match what PyYAML would produce.
+"""
+
+import re
+
+_KEY = re.compile(r"^([A-Za-z][A-Za-z0-9_-]*):(?:[ ]+(.*))?$")
+_INDENTED_KEY = re.compile(r"^([ ]+)([A-Za-z][A-Za-z0-9_-]*):(?:[ ]+(.*))?$")
+# Tabs, characters YAML treats as line breaks (CR, NEL, LS, PS) and anything
+# PyYAML rejects as non-printable; text containing any goes to PyYAML.
+_NOT_SIMPLE_CHARS = re.compile("[\u2028\u2029]|[^\n\x20-\x7E\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]")
+# Plain scalars YAML 1.1 would resolve to something other than a string.
+_TYPED_SCALAR = re.compile(
+    r"^(?:~|null|Null|NULL|y|Y|n|N|yes|Yes|YES|no|No|NO|true|True|TRUE|false|False|FALSE"
+    r"|on|On|ON|off|Off|OFF|=|<<|[-+]?[0-9.].*|[-+]?\.(?:inf|Inf|INF|nan|NaN|NAN))$"
+)
+_INDICATORS = set("-?:,[]{}#&*!|>'\"%@`")
+
+
+class FrontmatterError(Exception):
+    pass
+
+
+class _NotSimple(Exception):
+    pass
+
+
+def read_frontmatter_stream(handle):
+    """
+    Return the raw frontmatter from a text stream positioned at the start of a
+    SKILL.md, leaving the stream just past the closing `---` line (the body).
+
+    Raises:
+        FrontmatterError: If there is no frontmatter or it is not closed
+    """
+    first = handle.readline()
+    if not first.startswith("---"):
+        raise FrontmatterError("No YAML frontmatter found")
+    if first != "---\n":
+        raise FrontmatterError("Invalid frontmatter format")
+    lines = []
+    while True:
+        line = handle.readline()
+        if not line:
+            raise FrontmatterError("Invalid frontmatter format")
+        if line.startswith("---") and lines:
+            return "".join(lines)[:-1]
+        lines.append(line)
+
+
+def read_frontmatter_text(skill_md):
+    """Return the raw frontmatter of a SKILL.md, reading no further than its end."""
+    with open(skill_md, encoding="utf-8") as handle:
+        return read_frontmatter_stream(handle)
+
+
+def _scalar(value):
+    value = value.strip()
+    if not value:
+        raise _NotSimple
+    if value[0] == '"':
+        if len(value) < 2 or value[-1] != '"' or '"' in value[1:-1] or "\\" in value:
+            raise _NotSimple
+        return value[1:-1]
+    if value[0] == "'":
+        if len(value) < 2 or value[-1] != "'" or "'" in value[1:-1]:
+            raise _NotSimple
+        return value[1:-1]
+    if value[0] in _INDICATORS or ": " in value or " #" in value or value.endswith(":") or "\t" in value:
+        raise _NotSimple
+    if _TYPED_SCALAR.match(value):
+        raise _NotSimple
+    return value
+
+
+def _parse_simple(text):
+    if _NOT_SIMPLE_CHARS.search(text):
+        raise _NotSimple
+    data = {}
+    nested = None
+    indent = None
+    for line in text.split("\n"):
+        if not line.strip():
+            continue
+        if line[0] == " ":
+            match = _INDENTED_KEY.match(line)
+            if nested is None or not match or match.group(3) is None or _TYPED_SCALAR.match(match.group(2)):
+                raise _NotSimple
+            if indent is None:
+                indent = match.group(1)
+            elif match.group(1) != indent:
+                raise _NotSimple
+            nested[match.group(2)] = _scalar(match.group(3))
+            continue
+        if nested is not None and not nested:
+            raise _NotSimple
+        nested = None
+        indent = None
+        match = _KEY.match(line)
+        if not match or _TYPED_SCALAR.match(match.group(1)):
+            raise _NotSimple
+        key, value = match.group(1), match.group(2)
+        if value is None or not value.strip():
+            nested = data[key] = {}
+        else:
+            data[key] = _scalar(value)
+    if nested is not None and not nested:
+        raise _NotSimple
+    return data
+
+
+def parse_frontmatter(text):
+    """
+    Parse frontmatter text, falling back to PyYAML for anything complex.
+
+    Raises:
+        FrontmatterError: If the YAML is invalid
+    """
+    try:
+        return _parse_simple(text)
+    except _NotSimple:
+        pass
+    import yaml
+
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise FrontmatterError(f"Invalid YAML in frontmatter: {e}") from e
+
+
+def read_frontmatter(skill_md):
+    """Read and parse the frontmatter of a SKILL.md file."""
+    return parse_frontmatter(read_frontmatter_text(skill_md))
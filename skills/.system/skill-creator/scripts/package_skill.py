@@ -2,28 +2,237 @@
 """
 Skill Packager - Creates a distributable .skill file of a skill folder
 
+Archives are reproducible: entries are sorted, timestamps and permissions are
+normalized, and caches/VCS files are excluded. The archive comment records a
+hash of the packaged content, so re-running on an unchanged skill leaves the
+existing .skill file alone.
+
 Usage:
     python utils/package_skill.py <path/to/skill-folder> [output-directory]
+        [--level 0-9] [--exclude GLOB ...] [--jobs N] [--force]
+    python utils/package_skill.py --bundle <out.skillbundle> <skill-folder> [<skill-folder> ...]
+    python utils/package_skill.py --unpack <bundle.skillbundle> <destination>
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --level 9 --exclude "*.log"
+    python utils/package_skill.py --bundle dist/all.skillbundle skills/public/*
 """
 
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import stat
+import struct
 import sys
+import tempfile
 import zipfile
-from pathlib import Path
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PureWindowsPath
 
 from quick_validate import validate_skill
 
+DEFAULT_LEVEL = 6
+DEFAULT_EXCLUDES = (
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    "*.pyc",
+    "*.pyo",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".DS_Store",
+    "Thumbs.db",
+    "*.skill",
+)
+# Formats that are already compressed; deflating them again only costs time.
+STORED_EXTENSIONS = {
+    ".7z", ".avif", ".br", ".bz2", ".docx", ".gif", ".gz", ".heic", ".jar", ".jpeg", ".jpg",
+    ".m4a", ".mov", ".mp3", ".mp4", ".ogg", ".pdf", ".png", ".pptx", ".skill", ".tgz", ".webm",
+    ".webp", ".whl", ".woff", ".woff2", ".xlsx", ".xz", ".zip", ".zst",
+}
+# 1980-01-01 00:00:00, the earliest timestamp a zip entry can hold.
+ZIP_DOS_TIME = 0
+ZIP_DOS_DATE = (0 << 9) | (1 << 5) | 1
+MANIFEST_PREFIX = "skill-manifest-sha256:"
+MANIFEST_VERSION = 1
+BUNDLE_MANIFEST = "bundle.json"
+BUNDLE_VERSION = 1
+# File modes a bundle may record; collect_files() only produces these.
+BUNDLE_MODES = {"644": 0o644, "755": 0o755}
+
+
+def is_excluded(rel_path, patterns):
+    """True if any path component, or the whole relative path, matches a glob."""
+    parts = rel_path.split("/")
+    return any(
+        fnmatch.fnmatch(rel_path, pattern) or any(fnmatch.fnmatch(part, pattern) for part in parts)
+        for pattern in patterns
+    )
 
-def package_skill(skill_path, output_dir=None):
+
+def collect_files(skill_path, excludes):
+    """
+    List files to package, sorted by archive name.
+
+    Returns:
+        List of (arcname, path, mode) tuples with mode normalized to 0o755 or 0o644
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(skill_path):
+        rel_dir = Path(dirpath).relative_to(skill_path).as_posix()
+        rel_dir = "" if rel_dir == "." else rel_dir + "/"
+        dirnames[:] = [name for name in dirnames if not is_excluded(rel_dir + name, excludes)]
+        for filename in filenames:
+            rel_path = rel_dir + filename
+            path = Path(dirpath) / filename
+            if is_excluded(rel_path, excludes) or not path.is_file():
+                continue
+            mode = 0o755 if path.stat().st_mode & stat.S_IXUSR else 0o644
+            entries.append((f"{skill_path.name}/{rel_path}", path, mode))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def content_digest(entries, level):
+    """Hash of everything that determines the archive bytes."""
+    digest = hashlib.sha256(f"v{MANIFEST_VERSION} level={level}\n".encode())
+    for arcname, path, mode in entries:
+        digest.update(f"{arcname}\0{mode:o}\0{file_sha256(path)}\n".encode())
+    return digest.hexdigest()
+
+
+def existing_digest(skill_filename):
+    """Content digest recorded in an existing .skill file's comment, if any."""
+    try:
+        with open(skill_filename, "rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            size = handle.tell()
+            handle.seek(max(0, size - 22 - 0xFFFF))
+            tail = handle.read()
+    except OSError:
+        return None
+    end = tail.rfind(b"PK\x05\x06")
+    if end < 0 or len(tail) < end + 22:
+        return None
+    (comment_length,) = struct.unpack("<H", tail[end + 20 : end + 22])
+    comment = tail[end + 22 : end + 22 + comment_length].decode("ascii", "replace")
+    return comment[len(MANIFEST_PREFIX) :] if comment.startswith(MANIFEST_PREFIX) else None
+
+
+def compress_entry(source, level):
+    """
+    Read and compress one file, or in-memory bytes (runs in a worker thread;
+    zlib releases the GIL).
+
+    Returns:
+        (method, crc32, uncompressed size, payload)
+    """
+    if isinstance(source, bytes):
+        data, suffix = source, ""
+    else:
+        data, suffix = Path(source).read_bytes(), Path(source).suffix.lower()
+    crc = zlib.crc32(data)
+    if level and suffix not in STORED_EXTENSIONS:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        payload = compressor.compress(data) + compressor.flush()
+        if len(payload) < len(data):
+            return 8, crc, len(data), payload
+    return 0, crc, len(data), data
+
+
+def _compressed_in_order(entries, level, jobs):
+    """Yield compress_entry results in entry order, keeping a bounded number in flight."""
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for _, path, _ in entries:
+            pending.append(pool.submit(compress_entry, path, level))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_archive(skill_filename, entries, level, jobs, comment):
+    """
+    Write a deterministic zip: fixed timestamps, normalized modes, no extra fields.
+
+    Each entry is (arcname, source, mode) where source is a file path or bytes.
+
+    Entries are written by hand so payloads compressed in worker threads can be
+    stored as-is; zipfile would recompress them on the calling thread.
+    """
+    tmp_filename = skill_filename.with_name(f".{skill_filename.name}.{os.getpid()}.tmp")
+    central = []
+    try:
+        with open(tmp_filename, "wb") as out:
+            for (arcname, _, mode), result in zip(entries, _compressed_in_order(entries, level, jobs)):
+                method, crc, size, payload = result
+                if size > 0xFFFFFFFE or out.tell() > 0xFFFFFFFE:
+                    raise ValueError(f"{arcname}: archives over 4 GiB are not supported")
+                name = arcname.encode("utf-8")
+                flags = 0x800 if not arcname.isascii() else 0
+                offset = out.tell()
+                out.write(
+                    struct.pack(
+                        "<IHHHHHIIIHH", 0x04034B50, 20, flags, method, ZIP_DOS_TIME, ZIP_DOS_DATE,
+                        crc, len(payload), size, len(name), 0,
+                    )
+                )
+                out.write(name)
+                out.write(payload)
+                central.append(
+                    struct.pack(
+                        "<IHHHHHHIIIHHHHHII", 0x02014B50, (3 << 8) | 20, 20, flags, method,
+                        ZIP_DOS_TIME, ZIP_DOS_DATE, crc, len(payload), size, len(name), 0, 0, 0, 0,
+                        (stat.S_IFREG | mode) << 16, offset,
+                    )
+                    + name
+                )
+                print(f"  Added: {arcname}")
+            start = out.tell()
+            for record in central:
+                out.write(record)
+            comment_bytes = comment.encode("ascii")
+            out.write(
+                struct.pack(
+                    "<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                    out.tell() - start, start, len(comment_bytes),
+                )
+            )
+            out.write(comment_bytes)
+        os.replace(tmp_filename, skill_filename)
+    finally:
+        if tmp_filename.exists():
+            tmp_filename.unlink()
+
+
+def package_skill(skill_path, output_dir=None, level=DEFAULT_LEVEL, excludes=(), jobs=None, force=False):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        level: Deflate level 0-9 (0 stores everything uncompressed)
+        excludes: Extra glob patterns to leave out, on top of DEFAULT_EXCLUDES
+        jobs: Compression worker threads (defaults to the CPU count)
+        force: Repackage even if the existing .skill file is up to date
 
     Returns:
         Path to the created .skill file, or None if error
@@ -66,14 +275,13 @@ def package_skill(skill_path, output_dir=None):
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob("*"):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        entries = collect_files(skill_path, DEFAULT_EXCLUDES + tuple(excludes))
+        digest = content_digest(entries, level)
+        if not force and existing_digest(skill_filename) == digest:
+            print(f"[OK] Up to date, not repackaged: {skill_filename}")
+            return skill_filename
+
+        write_archive(skill_filename, entries, level, jobs or os.cpu_count() or 1, MANIFEST_PREFIX + digest)
 
         print(f"\n[OK] Successfully packaged skill to: {skill_filename}")
         return skill_filename
@@ -83,23 +291,249 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def _validated_skill(skill_path):
+    skill_path = Path(skill_path).resolve()
+    if not (skill_path / "SKILL.md").is_file():
+        print(f"[ERROR] SKILL.md not found in {skill_path}")
+        return None
+    valid, message = validate_skill(skill_path)
+    if not valid:
+        print(f"[ERROR] Validation failed for {skill_path.name}: {message}")
+        return None
+    return skill_path
+
+
+def package_bundle(skill_paths, bundle_filename, level=DEFAULT_LEVEL, excludes=(), jobs=None, force=False):
+    """
+    Package several skills into one bundle that stores each unique file once.
+
+    The bundle is a zip holding bundle.json (per-skill manifests mapping each
+    relative path to a blob hash and mode) and one blobs/<sha256> entry per
+    distinct file content, so shared LICENSE.txt files, references and assets
+    cost their size once.
+
+    Args:
+        skill_paths: Skill folders to include (names must be unique)
+        bundle_filename: Output path of the bundle
+        level, excludes, jobs, force: As for package_skill
+
+    Returns:
+        Path to the bundle, or None if error
+    """
+    skills = {}
+    blob_sources = {}
+    for skill_path in skill_paths:
+        skill_path = _validated_skill(skill_path)
+        if skill_path is None:
+            return None
+        if skill_path.name in skills:
+            print(f"[ERROR] Duplicate skill name in bundle: {skill_path.name}")
+            return None
+        files = {}
+        for arcname, path, mode in collect_files(skill_path, DEFAULT_EXCLUDES + tuple(excludes)):
+            blob = file_sha256(path)
+            blob_sources.setdefault(blob, path)
+            files[arcname.split("/", 1)[1]] = {"blob": blob, "mode": f"{mode:o}"}
+        skills[skill_path.name] = {"files": files}
+
+    manifest = json.dumps(
+        {"version": BUNDLE_VERSION, "skills": skills}, indent=2, sort_keys=True
+    ).encode("utf-8")
+    digest = hashlib.sha256(f"bundle v{BUNDLE_VERSION} level={level}\n".encode() + manifest).hexdigest()
+    bundle_filename = Path(bundle_filename).resolve()
+    if not force and existing_digest(bundle_filename) == digest:
+        print(f"[OK] Up to date, not repackaged: {bundle_filename}")
+        return bundle_filename
+
+    entries = [(BUNDLE_MANIFEST, manifest, 0o644)]
+    entries += [(f"blobs/{blob}", path, 0o644) for blob, path in sorted(blob_sources.items())]
+    try:
+        bundle_filename.parent.mkdir(parents=True, exist_ok=True)
+        write_archive(bundle_filename, entries, level, jobs or os.cpu_count() or 1, MANIFEST_PREFIX + digest)
+    except Exception as e:
+        print(f"[ERROR] Error creating bundle: {e}")
+        return None
+
+    total = sum(len(skill["files"]) for skill in skills.values())
+    print(
+        f"\n[OK] Bundled {len(skills)} skills ({total} files, {len(blob_sources)} unique) "
+        f"to: {bundle_filename}"
+    )
+    return bundle_filename
+
+
+def _is_plain_name(name):
+    """True if name is one ordinary path segment (no separators, drive or dot names)."""
+    return (
+        isinstance(name, str)
+        and name not in ("", ".", "..")
+        and "/" not in name
+        and "\\" not in name
+        and not Path(name).is_absolute()
+        and not PureWindowsPath(name).drive
+    )
+
+
+def _bundle_target(staging, name, rel_path):
+    """Staging path for a bundle file; raises ValueError if it would leave the skill's folder."""
+    root = staging / name
+    target = (root / rel_path).resolve()
+    if Path(rel_path).is_absolute() or "\\" in rel_path or target == root or not target.is_relative_to(root):
+        raise ValueError(f"Unsafe path in bundle: {name}/{rel_path}")
+    return target
+
+
+def _extract_blob(bundle, blob, target):
+    """Write blobs/<blob> to target, checking its content against the sha256 it is named by."""
+    digest = hashlib.sha256()
+    with bundle.open(f"blobs/{blob}") as src, open(target, "wb") as out:
+        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+            digest.update(chunk)
+            out.write(chunk)
+    if digest.hexdigest() != blob:
+        raise ValueError(f"Blob {blob} does not match its sha256 (got {digest.hexdigest()})")
+
+
+def unpack_bundle(bundle_filename, dest_dir):
+    """
+    Install every skill in a bundle into dest_dir.
+
+    Each blob is extracted once and checked against its sha256 (any mismatch
+    aborts the whole unpack); further files with the same content and mode
+    are hardlinked to it (copied where linking is not possible). Skills are
+    staged next to their destination and published with a rename.
+
+    Returns:
+        List of installed skill paths, or None if error
+    """
+    dest_dir = Path(dest_dir).resolve()
+    try:
+        bundle = zipfile.ZipFile(bundle_filename)
+        manifest = json.loads(bundle.read(BUNDLE_MANIFEST))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        print(f"[ERROR] Cannot read bundle {bundle_filename}: {e}")
+        return None
+    if manifest.get("version") != BUNDLE_VERSION:
+        print(f"[ERROR] Unsupported bundle version: {manifest.get('version')}")
+        return None
+    skills = manifest.get("skills")
+    if not isinstance(skills, dict):
+        print("[ERROR] Bundle manifest has no skills table")
+        return None
+    unsafe = [name for name in skills if not _is_plain_name(name)]
+    if unsafe:
+        print(f"[ERROR] Unsafe skill name(s) in bundle: {', '.join(map(repr, unsafe))}")
+        return None
+    existing = [name for name in skills if (dest_dir / name).exists()]
+    if existing:
+        print(f"[ERROR] Destination already exists: {', '.join(str(dest_dir / name) for name in existing)}")
+        return None
+
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".bundle-staging-", dir=dest_dir)).resolve()
+    extracted = {}
+    linked = 0
+    try:
+        with bundle:
+            for name in sorted(skills):
+                for rel_path, info in sorted(skills[name]["files"].items()):
+                    target = _bundle_target(staging, name, rel_path)
+                    mode = BUNDLE_MODES.get(info["mode"])
+                    if mode is None:
+                        raise ValueError(f"Unsupported file mode in bundle: {name}/{rel_path} ({info['mode']!r})")
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    key = (info["blob"], mode)
+                    if key in extracted:
+                        try:
+                            os.link(extracted[key], target)
+                            linked += 1
+                            continue
+                        except OSError:
+                            pass
+                    _extract_blob(bundle, info["blob"], target)
+                    os.chmod(target, mode)
+                    extracted.setdefault(key, target)
+            installed = []
+            for name in sorted(skills):
+                os.rename(staging / name, dest_dir / name)
+                installed.append(dest_dir / name)
+    except (OSError, KeyError, TypeError, ValueError, zipfile.BadZipFile) as e:
+        print(f"[ERROR] Error unpacking bundle: {e}")
+        return None
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    files = sum(len(skill["files"]) for skill in skills.values())
+    print(f"[OK] Unpacked {len(installed)} skills ({files} files, {linked} hardlinked) to: {dest_dir}")
+    return installed
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python utils/package_skill.py skills/public/my-skill")
-        print("  python utils/package_skill.py skills/public/my-skill ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder into a .skill file, or several into a bundle.",
+        epilog=(
+            "Examples: python utils/package_skill.py skills/public/my-skill ./dist\n"
+            "          python utils/package_skill.py --bundle dist/all.skillbundle skills/public/*\n"
+            "          python utils/package_skill.py --unpack dist/all.skillbundle ~/.codex/skills"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="path",
+        help="<skill-folder> [output-directory]; with --bundle, the skill folders; with --unpack, the destination",
+    )
+    parser.add_argument("--bundle", metavar="FILE", help="Write a deduplicated multi-skill bundle to FILE")
+    parser.add_argument("--unpack", metavar="FILE", help="Install every skill from bundle FILE into path")
+    parser.add_argument(
+        "--level",
+        type=int,
+        choices=range(10),
+        default=DEFAULT_LEVEL,
+        metavar="0-9",
+        help=f"Deflate compression level (default: {DEFAULT_LEVEL}; 0 stores files)",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Additional glob to exclude (repeatable; matched against names and relative paths)",
+    )
+    parser.add_argument("--jobs", type=int, help="Compression threads (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Repackage even if up to date")
+    args = parser.parse_args()
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    if args.bundle and args.unpack:
+        parser.error("--bundle and --unpack are mutually exclusive")
+    if args.unpack:
+        if len(args.paths) != 1:
+            parser.error("--unpack takes exactly one destination directory")
+        sys.exit(0 if unpack_bundle(args.unpack, args.paths[0]) else 1)
+    if args.bundle:
+        print(f"Bundling {len(args.paths)} skills into: {args.bundle}\n")
+        result = package_bundle(
+            args.paths, args.bundle, level=args.level, excludes=args.exclude, jobs=args.jobs, force=args.force
+        )
+        sys.exit(0 if result else 1)
+    if len(args.paths) > 2:
+        parser.error("expected <skill-folder> [output-directory] (use --bundle for several skills)")
+    skill_path = args.paths[0]
+    output_dir = args.paths[1] if len(args.paths) > 1 else None
 
     print(f"Packaging skill: {skill_path}")
     if output_dir:
         print(f"   Output directory: {output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(
+        skill_path,
+        output_dir,
+        level=args.level,
+        excludes=args.exclude,
+        jobs=args.jobs,
+        force=args.force,
+    )
 
     if result:
         sys.exit(0)
@@ -7,35 +7,36 @@ import re
 import sys
 from pathlib import Path
 
-import yaml
+from frontmatter import FrontmatterError, read_frontmatter
 
 MAX_SKILL_NAME_LENGTH = 64
 
 
 def validate_skill(skill_path):
-    """Basic validation of a skill"""
+    """Basic validation of a skill folder, or of a packaged .skill archive"""
     skill_path = Path(skill_path)
+    if skill_path.is_file() and skill_path.suffix == ".skill":
+        # Imported lazily so validating folders never pulls in zipfile.
+        from skill_archive import validate_archive
+
+        return validate_archive(skill_path)
 
     skill_md = skill_path / "SKILL.md"
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    content = skill_md.read_text()
-    if not content.startswith("---"):
-        return False, "No YAML frontmatter found"
-
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
+    # Only the frontmatter is read; PyYAML is imported just for complex YAML.
+    try:
+        frontmatter = read_frontmatter(skill_md)
+    except FrontmatterError as e:
+        return False, str(e)
+    return validate_frontmatter(frontmatter)
 
-    frontmatter_text = match.group(1)
 
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+def validate_frontmatter(frontmatter):
+    """Check parsed SKILL.md frontmatter against the skill rules"""
+    if not isinstance(frontmatter, dict):
+        return False, "Frontmatter must be a YAML dictionary"
 
     allowed_properties = {"name", "description", "license", "allowed-tools", "metadata"}
 
@@ -93,7 +94,7 @@ def validate_skill(skill_path):
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
+        print("Usage: python quick_validate.py <skill_directory|skill_file.skill>")
         sys.exit(1)
 
     valid, message = validate_skill(sys.argv[1])
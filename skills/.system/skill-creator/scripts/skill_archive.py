@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Skill Archive Reader - Reads packaged .skill files without extracting them
+
+SKILL.md frontmatter and body are read straight from the zip, and resource
+members (scripts/, references/, assets/) are listed from the central directory
+and streamed only when asked for. Per-archive summaries are cached by path,
+mtime and size, in memory and in an on-disk index, so re-indexing a directory
+of packaged skills only opens archives that changed.
+
+Usage:
+    skill_archive.py show <file.skill> [--json]
+    skill_archive.py ls <file.skill> [--prefix scripts/]
+    skill_archive.py cat <file.skill> <member>
+    skill_archive.py validate <file.skill> [...]
+    skill_archive.py index <directory> [--json] [--no-cache]
+
+Examples:
+    skill_archive.py show dist/my-skill.skill
+    skill_archive.py cat dist/my-skill.skill scripts/run.py
+    skill_archive.py index dist --json
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import sys
+import threading
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from frontmatter import FrontmatterError, parse_frontmatter, read_frontmatter_stream
+
+INDEX_VERSION = 1
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+class SkillArchiveError(Exception):
+    pass
+
+
+def codex_home():
+    return Path(os.environ.get("CODEX_HOME", Path.home() / ".codex"))
+
+
+def default_index_path():
+    return codex_home() / "cache" / "skill-creator" / "archive-index.json"
+
+
+class SkillArchive:
+    """
+    Read-only view of a .skill file. Only the central directory is read on
+    open; member data is read when requested.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        try:
+            self._zip = zipfile.ZipFile(self.path)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise SkillArchiveError(f"Cannot open {self.path}: {e}") from e
+        self.root = self._find_root()
+
+    def _find_root(self):
+        # Packages hold a single "<skill-name>/" folder; bare archives are accepted too.
+        candidates = [
+            name[: -len("SKILL.md")]
+            for name in self._zip.namelist()
+            if name == "SKILL.md" or (name.endswith("/SKILL.md") and name.count("/") == 1)
+        ]
+        if not candidates:
+            raise SkillArchiveError(f"SKILL.md not found in {self.path}")
+        return min(candidates, key=len)
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def names(self, prefix=""):
+        """Member paths relative to the skill folder, optionally under prefix."""
+        start = len(self.root)
+        return sorted(
+            name[start:]
+            for name in self._zip.namelist()
+            if name.startswith(self.root + prefix) and not name.endswith("/")
+        )
+
+    def open(self, member):
+        """Binary stream for a member; the data is decompressed as it is read."""
+        try:
+            return self._zip.open(self.root + member)
+        except KeyError as e:
+            raise SkillArchiveError(f"No member {member!r} in {self.path}") from e
+
+    def read_text(self, member):
+        with self.open(member) as handle:
+            return handle.read().decode("utf-8")
+
+    def read_skill_md(self, with_body=True):
+        """
+        Read SKILL.md from the archive.
+
+        Args:
+            with_body: Also read the body; otherwise stop after the frontmatter
+
+        Returns:
+            (frontmatter text, body or None)
+        """
+        with io.TextIOWrapper(self.open("SKILL.md"), encoding="utf-8") as handle:
+            text = read_frontmatter_stream(handle)
+            return text, handle.read() if with_body else None
+
+
+def _summarize(path):
+    from quick_validate import validate_frontmatter
+
+    summary = {"path": str(path), "valid": False, "message": "", "name": None, "description": None}
+    try:
+        with SkillArchive(path) as archive:
+            summary["root"] = archive.root
+            summary["members"] = archive.names()
+            frontmatter = parse_frontmatter(archive.read_skill_md(with_body=False)[0])
+    except (SkillArchiveError, FrontmatterError, UnicodeDecodeError) as e:
+        summary["message"] = str(e)
+        return summary
+    except (zipfile.BadZipFile, zlib.error, RuntimeError, NotImplementedError) as e:
+        # Corrupt member data, an encrypted member or an unsupported
+        # compression method only show up once SKILL.md is read.
+        summary["message"] = f"Cannot read {path}: {e}"
+        return summary
+    summary["valid"], summary["message"] = validate_frontmatter(frontmatter)
+    if isinstance(frontmatter, dict):
+        summary["name"] = frontmatter.get("name")
+        summary["description"] = frontmatter.get("description")
+        summary["frontmatter"] = frontmatter
+    return summary
+
+
+def _signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_summary(path):
+    """
+    Return a cached summary of a .skill file: name, description, frontmatter,
+    validation result and member list. Re-read only if mtime or size changed.
+    """
+    path = Path(path).resolve()
+    signature = _signature(path)
+    with _memo_lock:
+        hit = _memo.get(path)
+    if hit and hit[0] == signature:
+        return hit[1]
+    summary = _summarize(path)
+    with _memo_lock:
+        _memo[path] = (signature, summary)
+    return summary
+
+
+def read_skill(path):
+    """
+    Read a packaged skill's validated frontmatter and body.
+
+    Returns:
+        (frontmatter dict, body text)
+
+    Raises:
+        SkillArchiveError: If the archive or its SKILL.md is invalid
+    """
+    summary = load_summary(path)
+    if not summary["valid"]:
+        raise SkillArchiveError(summary["message"])
+    with SkillArchive(path) as archive:
+        return summary["frontmatter"], archive.read_skill_md()[1]
+
+
+def validate_archive(path):
+    """quick_validate-style (valid, message) for a .skill file"""
+    try:
+        summary = load_summary(path)
+    except OSError as e:
+        return False, str(e)
+    if summary["valid"]:
+        return True, "Skill is valid!"
+    return False, summary["message"]
+
+
+def _load_index(index_path):
+    try:
+        data = json.loads(Path(index_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("archives", {})
+
+
+def _save_index(index_path, archives):
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps({"version": INDEX_VERSION, "archives": archives}, default=str))
+    os.replace(tmp_path, index_path)
+
+
+def index_archives(directory, index_path=None, jobs=None):
+    """
+    Summarize every .skill file under directory without extracting any.
+
+    Args:
+        directory: Directory searched recursively for .skill files
+        index_path: On-disk summary cache, or None to disable it
+        jobs: Threads for archives that are not cached
+
+    Returns:
+        List of summaries sorted by path
+    """
+    root = Path(directory).resolve()
+    paths = sorted(root.rglob("*.skill"))
+    cached = _load_index(index_path) if index_path else {}
+    # Entries for archives deleted from this directory; other directories' entries stay.
+    gone = [key for key in cached if Path(key).is_relative_to(root) and not os.path.exists(key)]
+    for key in gone:
+        del cached[key]
+    summaries = {}
+    stale = []
+    for path in paths:
+        signature = list(_signature(path))
+        hit = cached.get(str(path))
+        if hit and hit.get("signature") == signature:
+            summaries[str(path)] = hit["summary"]
+        else:
+            stale.append((path, signature))
+    if stale:
+        with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+            for (path, signature), summary in zip(stale, pool.map(lambda item: load_summary(item[0]), stale)):
+                summaries[str(path)] = summary
+                cached[str(path)] = {"signature": signature, "summary": summary}
+    if index_path and (stale or gone):
+        _save_index(index_path, cached)
+    return [summaries[str(path)] for path in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read packaged .skill files without extracting them.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("show", help="Print frontmatter and body")
+    show.add_argument("archive")
+    show.add_argument("--json", action="store_true")
+
+    ls = commands.add_parser("ls", help="List members")
+    ls.add_argument("archive")
+    ls.add_argument("--prefix", default="", help="Only members under this path (e.g. scripts/)")
+
+    cat = commands.add_parser("cat", help="Stream one member to stdout")
+    cat.add_argument("archive")
+    cat.add_argument("member")
+
+    validate = commands.add_parser("validate", help="Validate archives like quick_validate.py")
+    validate.add_argument("archives", nargs="+")
+
+    index = commands.add_parser("index", help="Summarize every .skill file under a directory")
+    index.add_argument("directory")
+    index.add_argument("--json", action="store_true")
+    index.add_argument("--no-cache", action="store_true", help="Ignore the on-disk index")
+    index.add_argument("--jobs", type=int)
+
+    args = parser.parse_args()
+    try:
+        if args.command == "show":
+            frontmatter, body = read_skill(args.archive)
+            if args.json:
+                print(json.dumps({"frontmatter": frontmatter, "body": body}, indent=2, default=str))
+            else:
+                for key, value in frontmatter.items():
+                    print(f"{key}: {value}")
+                print("---")
+                print(body, end="")
+        elif args.command == "ls":
+            with SkillArchive(args.archive) as archive:
+                for name in archive.names(args.prefix):
+                    print(name)
+        elif args.command == "cat":
+            with SkillArchive(args.archive) as archive, archive.open(args.member) as handle:
+                shutil.copyfileobj(handle, sys.stdout.buffer)
+        elif args.command == "validate":
+            failed = False
+            for path in args.archives:
+                valid, message = validate_archive(path)
+                failed = failed or not valid
+                print(f"{path}: {message}")
+            sys.exit(1 if failed else 0)
+        elif args.command == "index":
+            index_path = None if args.no_cache else default_index_path()
+            summaries = index_archives(args.directory, index_path=index_path, jobs=args.jobs)
+            if args.json:
+                print(json.dumps(summaries, indent=2, default=str))
+            else:
+                for summary in summaries:
+                    status = "[OK]" if summary["valid"] else f"[ERROR] {summary['message']}"
+                    print(f"{summary['name'] or Path(summary['path']).stem}: {status}")
+    except SkillArchiveError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Skill Catalog - Precomputes one compact manifest describing every skill
+
+The builder scans the skills roots and records, per skill, its name,
+description, path, SKILL.md hash, resource listing and an estimated token
+size. Rebuilds are incremental: SKILL.md is only re-read when its mtime or
+size changed, and only re-parsed when its hash changed. Consumers call
+load_catalog(), which reads just the manifest file.
+
+Usage:
+    skill_catalog.py [root ...] [--output catalog.json] [--force] [--print]
+
+Defaults to ./skills and $CODEX_HOME/skills when no roots are given.
+
+Examples:
+    skill_catalog.py
+    skill_catalog.py skills --output /tmp/catalog.json --print
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+CATALOG_VERSION = 1
+RESOURCE_DIRS = ("scripts", "references", "assets")
+SKIP_DIRS = {".git", "__pycache__", "node_modules"}
+# Rough size of SKILL.md in model tokens (about four characters per token).
+CHARS_PER_TOKEN = 4
+
+
+def codex_home():
+    return Path(os.environ.get("CODEX_HOME", Path.home() / ".codex"))
+
+
+def default_catalog_path():
+    return codex_home() / "cache" / "skill-creator" / "catalog.json"
+
+
+def default_roots():
+    return [Path("skills"), codex_home() / "skills"]
+
+
+def load_catalog(path=None):
+    """
+    Read the catalog manifest; no skill directories are touched.
+
+    Returns:
+        List of skill entries, or an empty list if there is no usable catalog
+    """
+    try:
+        with open(path or default_catalog_path(), encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict) or data.get("version") != CATALOG_VERSION:
+        return []
+    return data.get("skills", [])
+
+
+def _find_skills(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "SKILL.md" in filenames:
+            dirnames[:] = []
+            yield Path(dirpath)
+            continue
+        dirnames[:] = sorted(
+            name for name in dirnames if name not in SKIP_DIRS and not name.startswith(".skill-")
+        )
+
+
+def _resources(skill_dir):
+    resources = {}
+    for name in RESOURCE_DIRS:
+        base = skill_dir / name
+        if not base.is_dir():
+            continue
+        files = []
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            rel_dir = Path(dirpath).relative_to(skill_dir).as_posix()
+            files.extend(f"{rel_dir}/{filename}" for filename in sorted(filenames))
+        resources[name] = files
+    return resources
+
+
+def _parse_skill_md(raw):
+    # Imported here so load_catalog() users only pay for json.
+    from frontmatter import FrontmatterError, parse_frontmatter, read_frontmatter_stream
+
+    text = raw.decode("utf-8", "replace").replace("\r\n", "\n")
+    entry = {"tokens": (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN}
+    try:
+        frontmatter = parse_frontmatter(read_frontmatter_stream(io.StringIO(text)))
+    except FrontmatterError as e:
+        entry["error"] = str(e)
+        frontmatter = {}
+    if not isinstance(frontmatter, dict):
+        entry["error"] = "Frontmatter must be a YAML dictionary"
+        frontmatter = {}
+    entry["name"] = frontmatter.get("name")
+    entry["description"] = frontmatter.get("description")
+    metadata = frontmatter.get("metadata")
+    if isinstance(metadata, dict) and metadata.get("short-description"):
+        entry["short_description"] = metadata["short-description"]
+    return entry
+
+
+def build_catalog(roots, output=None, force=False):
+    """
+    Build or refresh the catalog manifest.
+
+    Args:
+        roots: Directories to scan for skills
+        output: Manifest path (defaults to default_catalog_path())
+        force: Re-read every SKILL.md even if unchanged
+
+    Returns:
+        (skill entries, number of SKILL.md files re-read)
+    """
+    output = Path(output or default_catalog_path())
+    previous = {} if force else {entry["path"]: entry for entry in load_catalog(output)}
+    by_hash = {entry["sha256"]: entry for entry in previous.values()}
+    skills = []
+    reread = 0
+    for root in roots:
+        if not Path(root).is_dir():
+            continue
+        for skill_dir in _find_skills(root):
+            skill_md = skill_dir / "SKILL.md"
+            stat = skill_md.stat()
+            path = str(skill_dir.resolve())
+            known = previous.get(path)
+            if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+                entry = dict(known)
+            else:
+                reread += 1
+                raw = skill_md.read_bytes()
+                digest = hashlib.sha256(raw).hexdigest()
+                # Same content seen before (touched or copied): reuse its parse.
+                cached = by_hash.get(digest)
+                entry = dict(cached) if cached else _parse_skill_md(raw)
+                entry["sha256"] = digest
+            entry.update(
+                path=path,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                resources=_resources(skill_dir),
+            )
+            entry["name"] = entry.get("name") or skill_dir.name
+            skills.append(entry)
+    skills.sort(key=lambda entry: (entry["name"], entry["path"]))
+
+    payload = {"version": CATALOG_VERSION, "generated_at": time.time(), "skills": skills}
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, output)
+    return skills, reread
+
+
+def main():
+    # argparse is the costliest import here; keep it off the load_catalog() path.
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the precomputed skill catalog manifest.")
+    parser.add_argument("roots", nargs="*", help="Roots to scan (default: ./skills and $CODEX_HOME/skills)")
+    parser.add_argument("--output", help="Manifest path (default: $CODEX_HOME/cache/skill-creator/catalog.json)")
+    parser.add_argument("--force", action="store_true", help="Re-read every SKILL.md")
+    parser.add_argument("--print", action="store_true", help="Print the catalog as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    skills, reread = build_catalog(args.roots or default_roots(), args.output, args.force)
+    elapsed = time.perf_counter() - start
+    if args.print:
+        print(json.dumps(skills, indent=2, ensure_ascii=False))
+    output = args.output or default_catalog_path()
+    print(
+        f"[OK] Cataloged {len(skills)} skills ({reread} SKILL.md re-read) in {elapsed * 1000:.1f} ms -> {output}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Batch Skill Validator - Validates every skill under one or more roots in parallel
+
+Results are cached by SKILL.md content hash (and the validator source), so
+repeat runs only re-validate skills whose SKILL.md changed.
+
+Usage:
+    python validate_skills.py [root ...] [--output report.json] [--jobs N] [--no-cache]
+
+Defaults to ./skills and $CODEX_HOME/skills when no roots are given.
+
+Example:
+    python validate_skills.py
+    python validate_skills.py skills --output /tmp/skills-report.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SKIP_DIRS = {".git", "__pycache__", "node_modules"}
+CACHE_VERSION = 1
+VALIDATOR_SOURCES = ("quick_validate.py", "frontmatter.py")
+
+
+def codex_home():
+    return Path(os.environ.get("CODEX_HOME", Path.home() / ".codex"))
+
+
+def default_cache_path():
+    return codex_home() / "cache" / "skill-creator" / "validate-cache.json"
+
+
+def validator_fingerprint():
+    """Hash of the validation rules, so editing them invalidates cached results."""
+    digest = hashlib.sha256()
+    for name in VALIDATOR_SOURCES:
+        digest.update((SCRIPT_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def find_skills(root):
+    """
+    Find skill directories (folders containing SKILL.md) under root.
+
+    Does not descend into a skill once found, and skips installer staging
+    directories (.skill-*).
+    """
+    root = Path(root)
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if "SKILL.md" in filenames:
+            found.append(Path(dirpath))
+            dirnames[:] = []
+            continue
+        dirnames[:] = sorted(
+            name for name in dirnames if name not in SKIP_DIRS and not name.startswith(".skill-")
+        )
+    return found
+
+
+def load_cache(path):
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data
+
+
+def save_cache(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def _validate(skill_dir):
+    # Imported lazily: a fully cached run never needs the validator (or PyYAML).
+    from quick_validate import validate_skill
+
+    return validate_skill(skill_dir)
+
+
+def validate_all(roots, cache_path=None, jobs=None):
+    """
+    Validate every skill under roots.
+
+    Args:
+        roots: Directories to search for skills
+        cache_path: Result cache file, or None to disable caching
+        jobs: Worker threads for uncached skills
+
+    Returns:
+        Report dict with a summary and per-skill results
+    """
+    start = time.perf_counter()
+    skills = []
+    for root in roots:
+        if Path(root).is_dir():
+            skills.extend(find_skills(root))
+
+    cache = load_cache(cache_path) if cache_path else {}
+    fingerprint = validator_fingerprint()
+    if cache.get("validator") != fingerprint:
+        cache = {}
+    entries = cache.get("results", {})
+
+    results = []
+    pending = []
+    for skill_dir in skills:
+        try:
+            digest = hashlib.sha256((skill_dir / "SKILL.md").read_bytes()).hexdigest()
+        except OSError as e:
+            results.append({"path": str(skill_dir), "valid": False, "message": str(e), "cached": False})
+            continue
+        hit = entries.get(digest)
+        if hit is not None:
+            results.append({"path": str(skill_dir), **hit, "cached": True})
+        else:
+            pending.append((skill_dir, digest))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+            outcomes = pool.map(lambda item: _validate(item[0]), pending)
+            for (skill_dir, digest), (valid, message) in zip(pending, outcomes):
+                entries[digest] = {"valid": valid, "message": message}
+                results.append({"path": str(skill_dir), "valid": valid, "message": message, "cached": False})
+
+    if cache_path and pending:
+        save_cache(
+            cache_path,
+            {"version": CACHE_VERSION, "validator": fingerprint, "results": entries},
+        )
+
+    results.sort(key=lambda result: result["path"])
+    invalid = sum(1 for result in results if not result["valid"])
+    return {
+        "summary": {
+            "total": len(results),
+            "valid": len(results) - invalid,
+            "invalid": invalid,
+            "cached": sum(1 for result in results if result["cached"]),
+            "elapsed_s": round(time.perf_counter() - start, 4),
+        },
+        "skills": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate every skill under the given roots.")
+    parser.add_argument("roots", nargs="*", help="Roots to search (default: ./skills and $CODEX_HOME/skills)")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--jobs", type=int, help="Parallel validations")
+    parser.add_argument("--cache", default=str(default_cache_path()), help="Result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Re-validate everything")
+    args = parser.parse_args()
+
+    roots = args.roots or [Path("skills"), codex_home() / "skills"]
+    report = validate_all(roots, cache_path=None if args.no_cache else args.cache, jobs=args.jobs)
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n")
+        summary = report["summary"]
+        status = "[ERROR]" if summary["invalid"] else "[OK]"
+        print(
+            f"{status} {summary['valid']}/{summary['total']} skills valid "
+            f"({summary['cached']} cached) -> {args.output}"
+        )
+    else:
+        print(payload)
+    sys.exit(1 if report["summary"]["invalid"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,405 @@
 
 from __future__ import annotations
 
+import email.message
+import hashlib
+import http.client
+import json
 import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from dataclasses import dataclass
+from typing import BinaryIO
 
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_CODELOAD_URL = os.environ.get("GITHUB_CODELOAD_URL", "https://codeload.github.com").rstrip("/")
+CACHE_MAX_BYTES = int(os.environ.get("CODEX_SKILL_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+CACHE_MAX_AGE_SECONDS = int(os.environ.get("CODEX_SKILL_CACHE_MAX_AGE", str(30 * 24 * 3600)))
+HTTP_TIMEOUT = float(os.environ.get("CODEX_GITHUB_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.environ.get("CODEX_GITHUB_RETRIES", "4"))
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+STREAM_CHUNK_SIZE = 1024 * 1024
 
-def github_request(url: str, user_agent: str) -> bytes:
+
+def codex_home() -> str:
+    return os.environ.get("CODEX_HOME", os.path.expanduser("~/.codex"))
+
+
+def codex_cache_dir(*parts: str) -> str:
+    return os.path.join(codex_home(), "cache", *parts)
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    body_path: str
+
+    def read(self) -> bytes:
+        with open(self.body_path, "rb") as file_handle:
+            return file_handle.read()
+
+
+class ResponseCache:
+    """On-disk cache of GitHub responses revalidated with ETag/If-None-Match."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.root, key[:2], key)
+        return base + ".json", base + ".body"
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file_handle:
+                meta = json.load(file_handle)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not meta.get("etag") or not os.path.isfile(body_path):
+            return None
+        return CachedResponse(etag=meta["etag"], body_path=body_path)
+
+    def store(self, url: str, etag: str, payload: bytes) -> None:
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        _atomic_write(body_path, payload)
+        meta = {"url": url, "etag": etag, "fetched_at": time.time(), "size": len(payload)}
+        _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def touch(self, url: str) -> None:
+        for path in self._paths(url):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as file_handle:
+        file_handle.write(payload)
+    os.replace(tmp_path, path)
+
+
+def evict_cache(root: str, max_bytes: int = CACHE_MAX_BYTES, max_age: int = CACHE_MAX_AGE_SECONDS) -> int:
+    """Drop files older than max_age, then least recently used ones until under max_bytes."""
+    if not os.path.isdir(root):
+        return 0
+    now = time.time()
+    entries = []
+    removed = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if now - stat.st_mtime > max_age:
+                removed += _remove(path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        removed += _remove(path)
+        total -= size
+    return removed
+
+
+def _remove(path: str) -> int:
+    try:
+        os.remove(path)
+    except OSError:
+        return 0
+    return 1
+
+
+def _headers(user_agent: str, accept: str | None = None) -> dict[str, str]:
     headers = {"User-Agent": user_agent}
+    if accept:
+        headers["Accept"] = accept
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if token:
         headers["Authorization"] = f"token {token}"
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req) as resp:
-        return resp.read()
+    return headers
+
+
+@dataclass
+class RequestStat:
+    url: str
+    status: int
+    seconds: float
+    attempts: int
+    size: int
+
+
+@dataclass
+class Response:
+    status: int
+    headers: email.message.Message
+    body: bytes
+
+
+class GitHubClient:
+    """Keep-alive HTTP client with retries, backoff and rate-limit handling.
+
+    Connections are pooled per (scheme, host, port) and per thread, since
+    http.client connections are not thread-safe. 429/5xx responses and dropped
+    connections are retried with exponential backoff and full jitter, honoring
+    Retry-After and X-RateLimit-Reset. Failures surface as
+    urllib.error.HTTPError so callers can keep checking ``exc.code``.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: float = HTTP_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_rate_limit_wait: float = 60.0,
+    ) -> None:
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.stats: list[RequestStat] = []
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        self._rate_limit_reset: dict[str, float] = {}
+
+    def _pool(self) -> dict[tuple[str, str, int], http.client.HTTPConnection]:
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        return pool
+
+    def _connection(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        key = (scheme, host, port)
+        pool = self._pool()
+        conn = pool.get(key)
+        if conn is None:
+            conn = self._new_connection(scheme, host, port)
+            pool[key] = conn
+        return conn
+
+    def _new_connection(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        proxy = urllib.request.getproxies().get(scheme)
+        if proxy and not urllib.request.proxy_bypass(host):
+            parsed = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            proxy_host, proxy_port = parsed.hostname or "", parsed.port or 80
+            if scheme == "https":
+                tunnel = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout)
+                tunnel.set_tunnel(host, port)
+                return tunnel
+            conn = http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+            conn._codex_proxy = True  # type: ignore[attr-defined]
+            return conn
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _drop(self, scheme: str, host: str, port: int) -> None:
+        conn = self._pool().pop((scheme, host, port), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        for conn in self._pool().values():
+            conn.close()
+        self._pool().clear()
+
+    def _backoff(self, attempt: int, headers: email.message.Message | None) -> float:
+        if headers is not None:
+            retry_after = headers.get("Retry-After")
+            if retry_after and retry_after.strip().isdigit():
+                return min(float(retry_after), self.max_rate_limit_wait)
+            reset = headers.get("X-RateLimit-Reset")
+            if headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+                return min(max(float(reset) - time.time(), 0.0) + 1.0, self.max_rate_limit_wait)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    def _wait_for_rate_limit(self, host: str) -> None:
+        reset = self._rate_limit_reset.get(host)
+        if reset is None:
+            return
+        delay = reset - time.time()
+        if 0 < delay <= self.max_rate_limit_wait:
+            time.sleep(delay)
+        self._rate_limit_reset.pop(host, None)
+
+    def _record(self, url: str, status: int, start: float, attempts: int, size: int) -> None:
+        with self._stats_lock:
+            self.stats.append(RequestStat(url, status, time.perf_counter() - start, attempts, size))
+
+    def _retryable(self, status: int, headers: email.message.Message) -> bool:
+        retry_after = headers.get("Retry-After", "").strip()
+        if retry_after.isdigit() and float(retry_after) > self.max_rate_limit_wait:
+            return False
+        if status == 429 or 500 <= status < 600:
+            return True
+        if status == 403 and headers.get("X-RateLimit-Remaining") == "0":
+            reset = headers.get("X-RateLimit-Reset", "")
+            return reset.isdigit() and float(reset) - time.time() <= self.max_rate_limit_wait
+        return False
+
+    def request(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        sink: BinaryIO | None = None,
+        ok_statuses: tuple[int, ...] = (),
+    ) -> Response:
+        """GET url; with `sink`, the body is streamed there instead of returned."""
+        all_headers = _headers(self.user_agent)
+        all_headers.update(headers or {})
+        start = time.perf_counter()
+        attempt = 0
+        redirects = 0
+        while True:
+            parsed = urllib.parse.urlsplit(url)
+            scheme = parsed.scheme or "https"
+            host = parsed.hostname or ""
+            port = parsed.port or (443 if scheme == "https" else 80)
+            target = parsed.path or "/"
+            if parsed.query:
+                target += f"?{parsed.query}"
+            self._wait_for_rate_limit(host)
+            conn = self._connection(scheme, host, port)
+            if getattr(conn, "_codex_proxy", False):
+                target = url
+            try:
+                conn.request("GET", target, headers=all_headers)
+                resp = conn.getresponse()
+                status = resp.status
+                if status in REDIRECT_STATUSES and resp.getheader("Location") and redirects < 5:
+                    resp.read()
+                    url = urllib.parse.urljoin(url, resp.getheader("Location") or "")
+                    redirects += 1
+                    continue
+                if 200 <= status < 300 and sink is not None:
+                    if hasattr(sink, "truncate"):
+                        sink.seek(0)
+                        sink.truncate()
+                    size = 0
+                    while chunk := resp.read(STREAM_CHUNK_SIZE):
+                        sink.write(chunk)
+                        size += len(chunk)
+                    body = b""
+                else:
+                    body = resp.read()
+                    size = len(body)
+                if resp.will_close:
+                    self._drop(scheme, host, port)
+            except (http.client.HTTPException, OSError) as exc:
+                self._drop(scheme, host, port)
+                if attempt >= self.max_retries:
+                    raise urllib.error.URLError(exc) from exc
+                time.sleep(self._backoff(attempt, None))
+                attempt += 1
+                continue
+
+            if resp.headers.get("X-RateLimit-Remaining") == "0":
+                reset = resp.headers.get("X-RateLimit-Reset", "")
+                if reset.isdigit():
+                    self._rate_limit_reset[host] = float(reset)
+            if self._retryable(status, resp.headers) and attempt < self.max_retries:
+                time.sleep(self._backoff(attempt, resp.headers))
+                attempt += 1
+                continue
+            self._record(url, status, start, attempt + 1, size)
+            if not (200 <= status < 300) and status not in ok_statuses:
+                raise urllib.error.HTTPError(url, status, resp.reason, resp.headers, None)
+            return Response(status=status, headers=resp.headers, body=body)
+
+    def latency_summary(self) -> dict[str, float]:
+        with self._stats_lock:
+            samples = sorted(stat.seconds for stat in self.stats)
+            retries = sum(stat.attempts - 1 for stat in self.stats)
+            total_bytes = sum(stat.size for stat in self.stats)
+        if not samples:
+            return {"requests": 0}
+        return {
+            "requests": len(samples),
+            "retries": retries,
+            "bytes": total_bytes,
+            "total_s": round(sum(samples), 4),
+            "mean_s": round(sum(samples) / len(samples), 4),
+            "p50_s": round(samples[len(samples) // 2], 4),
+            "p95_s": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+            "max_s": round(samples[-1], 4),
+        }
+
+
+_CLIENTS: dict[str, GitHubClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(user_agent: str) -> GitHubClient:
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(user_agent)
+        if client is None:
+            client = _CLIENTS[user_agent] = GitHubClient(user_agent)
+        return client
+
+
+def format_latency_summary(client: GitHubClient) -> str:
+    summary = client.latency_summary()
+    return "HTTP stats: " + ", ".join(f"{key}={value}" for key, value in summary.items())
+
+
+def github_request(
+    url: str,
+    user_agent: str,
+    cache: ResponseCache | None = None,
+    accept: str | None = None,
+) -> bytes:
+    headers = {"Accept": accept} if accept else {}
+    cached = cache.lookup(url) if cache else None
+    if cached:
+        headers["If-None-Match"] = cached.etag
+    resp = get_client(user_agent).request(url, headers, ok_statuses=(304,) if cached else ())
+    if resp.status == 304 and cached and cache:
+        cache.touch(url)
+        return cached.read()
+    etag = resp.headers.get("ETag")
+    if cache and etag:
+        cache.store(url, etag, resp.body)
+    return resp.body
+
+
+def github_download(url: str, user_agent: str, file_handle: BinaryIO) -> int:
+    """Stream a response body into file_handle in chunks; returns bytes written."""
+    get_client(user_agent).request(url, sink=file_handle)
+    return file_handle.tell()
 
 
 def github_api_contents_url(repo: str, path: str, ref: str) -> str:
-    return f"https://api.github.com/repos/{repo}/contents/{path}?ref={ref}"
+    return f"{GITHUB_API_URL}/repos/{repo}/contents/{path}?ref={ref}"
+
+
+def github_api_commit_url(repo: str, ref: str) -> str:
+    return f"{GITHUB_API_URL}/repos/{repo}/commits/{ref}"
+
+
+def github_codeload_zip_url(repo: str, ref: str) -> str:
+    return f"{GITHUB_CODELOAD_URL}/{repo}/zip/{ref}"
+
+
+def github_api_tree_url(repo: str, ref: str, path: str) -> str:
+    treeish = urllib.parse.quote(f"{ref}:{path.strip('/')}", safe="/:")
+    return f"{GITHUB_API_URL}/repos/{repo}/git/trees/{treeish}?recursive=1"
+
+
+def github_api_blob_url(repo: str, sha: str) -> str:
+    return f"{GITHUB_API_URL}/repos/{repo}/git/blobs/{sha}"
@@ -4,18 +4,41 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import hashlib
+import json
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import urllib.error
 import urllib.parse
 import zipfile
-
-from github_utils import github_request
+from typing import BinaryIO
+
+from github_utils import (
+    CACHE_MAX_AGE_SECONDS,
+    ResponseCache,
+    codex_cache_dir,
+    evict_cache,
+    format_latency_summary,
+    get_client,
+    github_api_commit_url,
+    github_codeload_zip_url,
+    github_download,
+    github_request,
+)
+from skill_lock import IGNORED_DIRS, file_info, file_mode, git_blob_sha, lock_entry, update_lock
 DEFAULT_REF = "main"
+USER_AGENT = "codex-skill-install"
+SHA_MEDIA_TYPE = "application/vnd.github.sha"
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_JOBS = 4
 
 
 @dataclass
@@ -27,6 +50,13 @@ class Args:
     dest: str | None = None
     name: str | None = None
     method: str = "auto"
+    no_cache: bool = False
+    link: bool = False
+    manifest: str | None = None
+    git_url: str | None = None
+    timeout: float | None = None
+    stats: bool = False
+    jobs: int = DEFAULT_JOBS
 
 
 @dataclass
@@ -38,6 +68,30 @@ class Source:
     repo_url: str | None = None
 
 
+@dataclass
+class PreparedRepo:
+    root: str
+    from_cache: bool = False
+    commit: str | None = None
+
+
+@dataclass
+class ManifestEntry:
+    source: Source
+    path: str
+    name: str
+
+
+@dataclass
+class EntryResult:
+    name: str
+    dest: str
+    from_cache: bool = False
+    download_seconds: float = 0.0
+    install_seconds: float = 0.0
+    error: str | None = None
+
+
 class InstallError(Exception):
     pass
 
@@ -52,8 +106,12 @@ def _tmp_root() -> str:
     return base
 
 
-def _request(url: str) -> bytes:
-    return github_request(url, "codex-skill-install")
+def _cache_root() -> str:
+    return codex_cache_dir("skill-installer")
+
+
+def _request(url: str, cache: ResponseCache | None = None, accept: str | None = None) -> bytes:
+    return github_request(url, USER_AGENT, cache=cache, accept=accept)
 
 
 def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str | None]:
@@ -77,39 +135,144 @@ def _parse_github_url(url: str, default_ref: str) -> tuple[str, str, str, str |
     return owner, repo, ref, subpath or None
 
 
-def _download_repo_zip(owner: str, repo: str, ref: str, dest_dir: str) -> str:
-    zip_url = f"https://codeload.github.com/{owner}/{repo}/zip/{ref}"
-    zip_path = os.path.join(dest_dir, "repo.zip")
+def _resolve_commit_sha(owner: str, repo: str, ref: str) -> str | None:
+    """Resolve ref to a commit SHA with one conditional (ETag) API request."""
+    url = github_api_commit_url(f"{owner}/{repo}", ref)
+    cache = ResponseCache(os.path.join(_cache_root(), "http"))
     try:
-        payload = _request(zip_url)
+        payload = _request(url, cache=cache, accept=SHA_MEDIA_TYPE)
+    except (urllib.error.URLError, OSError):
+        return None
+    sha = payload.decode("utf-8", "replace").strip()
+    return sha if re.fullmatch(r"[0-9a-f]{40}", sha) else None
+
+
+def _archive_cache_path(owner: str, repo: str, sha: str) -> str:
+    return os.path.join(_cache_root(), "archives", owner, repo, f"{sha}.zip")
+
+
+def _stream_zip(zip_url: str, file_handle: BinaryIO) -> None:
+    try:
+        github_download(zip_url, USER_AGENT, file_handle)
     except urllib.error.HTTPError as exc:
         raise InstallError(f"Download failed: HTTP {exc.code}") from exc
-    with open(zip_path, "wb") as file_handle:
-        file_handle.write(payload)
-    with zipfile.ZipFile(zip_path, "r") as zip_file:
-        _safe_extract_zip(zip_file, dest_dir)
-        top_levels = {name.split("/")[0] for name in zip_file.namelist() if name}
+    except urllib.error.URLError as exc:
+        raise InstallError(f"Download failed: {exc.reason}") from exc
+
+
+def _fetch_zip_to_cache(zip_url: str, zip_path: str) -> None:
+    os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+    tmp_path = f"{zip_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as file_handle:
+            _stream_zip(zip_url, file_handle)
+        os.replace(tmp_path, zip_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _open_repo_zip(owner: str, repo: str, ref: str, use_cache: bool) -> tuple[BinaryIO, bool]:
+    """Return a readable zip handle for owner/repo@ref and whether it came from the cache.
+
+    With the cache enabled, archives are stored by resolved commit SHA, so a
+    repeat install of the same ref only costs the SHA revalidation request.
+    Otherwise the response is streamed into a spooled temp file that only
+    touches disk once it outgrows SPOOL_MAX_BYTES.
+    """
+    sha = _resolve_commit_sha(owner, repo, ref) if use_cache else None
+    if sha:
+        cached_zip = _archive_cache_path(owner, repo, sha)
+        from_cache = os.path.isfile(cached_zip)
+        if from_cache:
+            os.utime(cached_zip)
+        else:
+            _fetch_zip_to_cache(github_codeload_zip_url(f"{owner}/{repo}", sha), cached_zip)
+        handle = open(cached_zip, "rb")
+        _evict_caches()
+        return handle, from_cache
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, dir=_tmp_root())
+    try:
+        _stream_zip(github_codeload_zip_url(f"{owner}/{repo}", ref), spool)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, False
+
+
+def _zip_root(zip_file: zipfile.ZipFile) -> str:
+    top_levels = {name.split("/")[0] for name in zip_file.namelist() if name}
     if not top_levels:
         raise InstallError("Downloaded archive was empty.")
     if len(top_levels) != 1:
         raise InstallError("Unexpected archive layout.")
-    return os.path.join(dest_dir, next(iter(top_levels)))
+    return next(iter(top_levels))
+
+
+def _safe_member_path(dest_dir: str, relpath: str) -> str:
+    dest_root = os.path.realpath(dest_dir)
+    extracted_path = os.path.realpath(os.path.join(dest_dir, relpath))
+    if extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep):
+        return extracted_path
+    raise InstallError("Archive contains files outside the destination.")
+
+
+def _extract_member(zip_file: zipfile.ZipFile, info: zipfile.ZipInfo, target: str) -> None:
+    if info.is_dir():
+        os.makedirs(target, exist_ok=True)
+        return
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with zip_file.open(info) as src, open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+    mode = (info.external_attr >> 16) & 0o777
+    if mode & 0o111:
+        os.chmod(target, mode)
+
+
+def _extract_paths(zip_file: zipfile.ZipFile, root: str, paths: list[str], dest_dir: str) -> None:
+    """Extract only members under the requested repo paths, checking each one.
+
+    A path of "." (or "") is the repo root, which selects every member.
+    """
+    wanted = [os.path.normpath(path).strip("/") for path in paths]
+    everything = any(path in ("", ".") for path in wanted)
+    for info in zip_file.infolist():
+        rel = info.filename[len(root) + 1 :]
+        if not rel or not (everything or any(rel == path or rel.startswith(path + "/") for path in wanted)):
+            continue
+        _extract_member(zip_file, info, _safe_member_path(dest_dir, rel))
+
+
+def _download_repo_zip(
+    owner: str, repo: str, ref: str, dest_dir: str, paths: list[str], use_cache: bool = True
+) -> PreparedRepo:
+    handle, from_cache = _open_repo_zip(owner, repo, ref, use_cache)
+    with handle:
+        try:
+            with zipfile.ZipFile(handle, "r") as zip_file:
+                root = _zip_root(zip_file)
+                repo_root = os.path.join(dest_dir, root)
+                _extract_paths(zip_file, root, paths, repo_root)
+                # GitHub zipballs carry the commit SHA as the archive comment.
+                comment = zip_file.comment.decode("ascii", "replace").strip()
+        except zipfile.BadZipFile as exc:
+            if from_cache:
+                os.remove(handle.name)
+            raise InstallError("Downloaded archive is not a valid zip file.") from exc
+    commit = comment if re.fullmatch(r"[0-9a-f]{40}", comment) else None
+    return PreparedRepo(repo_root, from_cache, commit)
 
 
 def _run_git(args: list[str]) -> None:
+    _git_output(args)
+
+
+def _git_output(args: list[str]) -> str:
     result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     if result.returncode != 0:
         raise InstallError(result.stderr.strip() or "Git command failed.")
-
-
-def _safe_extract_zip(zip_file: zipfile.ZipFile, dest_dir: str) -> None:
-    dest_root = os.path.realpath(dest_dir)
-    for info in zip_file.infolist():
-        extracted_path = os.path.realpath(os.path.join(dest_dir, info.filename))
-        if extracted_path == dest_root or extracted_path.startswith(dest_root + os.sep):
-            continue
-        raise InstallError("Archive contains files outside the destination.")
-    zip_file.extractall(dest_dir)
+    return result.stdout.strip()
 
 
 def _validate_relative_path(path: str) -> None:
@@ -125,39 +288,78 @@ def _validate_skill_name(name: str) -> None:
         raise InstallError("Invalid skill name.")
 
 
-def _git_sparse_checkout(repo_url: str, ref: str, paths: list[str], dest_dir: str) -> str:
-    repo_dir = os.path.join(dest_dir, "repo")
-    clone_cmd = [
-        "git",
-        "clone",
-        "--filter=blob:none",
-        "--depth",
-        "1",
-        "--sparse",
-        "--single-branch",
-        "--branch",
-        ref,
-        repo_url,
-        repo_dir,
-    ]
+def _mirror_path(repo_url: str) -> str:
+    digest = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[:16]
+    tail = re.sub(r"[^A-Za-z0-9._-]+", "-", repo_url.rstrip("/").split("/")[-1].split(":")[-1])
+    return os.path.join(_cache_root(), "git", f"{tail.removesuffix('.git')}-{digest}.git")
+
+
+_MIRROR_LOCKS: dict[str, threading.Lock] = {}
+_MIRROR_LOCKS_GUARD = threading.Lock()
+
+
+def _mirror_lock(mirror: str) -> threading.Lock:
+    with _MIRROR_LOCKS_GUARD:
+        return _MIRROR_LOCKS.setdefault(mirror, threading.Lock())
+
+
+def _ensure_mirror(repo_url: str) -> str:
+    mirror = _mirror_path(repo_url)
+    if os.path.isfile(os.path.join(mirror, "HEAD")):
+        return mirror
+    staging = f"{mirror}.{os.getpid()}.{threading.get_ident()}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(os.path.dirname(mirror), exist_ok=True)
+    try:
+        _run_git(["git", "init", "--quiet", "--bare", staging])
+        _run_git(["git", "-C", staging, "remote", "add", "origin", repo_url])
+        _run_git(["git", "-C", staging, "config", "remote.origin.promisor", "true"])
+        _run_git(["git", "-C", staging, "config", "remote.origin.partialclonefilter", "blob:none"])
+        os.replace(staging, mirror)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return mirror
+
+
+def _fetch_mirror_commit(mirror: str, ref: str) -> str:
+    """Incrementally fetch ref into the blobless mirror and return its commit."""
+    fetch = ["git", "-C", mirror, "fetch", "--quiet", "--depth", "1", "--filter=blob:none", "origin"]
+    # Keep a ref per fetched name so the objects survive gc between installs.
+    local_ref = f"refs/codex/{ref}"
     try:
-        _run_git(clone_cmd)
+        _run_git([*fetch, f"+{ref}:{local_ref}"])
+        return _git_output(["git", "-C", mirror, "rev-parse", f"{local_ref}^{{commit}}"])
     except InstallError:
-        _run_git(
-            [
-                "git",
-                "clone",
-                "--filter=blob:none",
-                "--depth",
-                "1",
-                "--sparse",
-                "--single-branch",
-                repo_url,
-                repo_dir,
-            ]
-        )
-    _run_git(["git", "-C", repo_dir, "sparse-checkout", "set", *paths])
-    _run_git(["git", "-C", repo_dir, "checkout", ref])
+        # ref may be a short SHA or otherwise not fetchable by name.
+        _run_git([*fetch, "+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*"])
+        try:
+            return _git_output(["git", "-C", mirror, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"])
+        except InstallError as exc:
+            raise InstallError(f"Ref not found in repository: {ref}") from exc
+
+
+def _git_sparse_checkout(repo_url: str, ref: str, paths: list[str], dest_dir: str) -> str:
+    """Check out only `paths` at `ref` via a persistent partial-clone mirror.
+
+    The mirror lives under the codex cache and keeps commits and trees between
+    installs; each install fetches incrementally and materializes a sparse
+    worktree, so only the blobs under `paths` are downloaded.
+    """
+    repo_dir = os.path.join(dest_dir, "repo")
+    mirror = _mirror_path(repo_url)
+    with _mirror_lock(mirror):
+        try:
+            _ensure_mirror(repo_url)
+            commit = _fetch_mirror_commit(mirror, ref)
+            _run_git(["git", "-C", mirror, "worktree", "prune"])
+            _run_git(["git", "-C", mirror, "worktree", "add", "--quiet", "--no-checkout", "--detach", repo_dir, commit])
+            _run_git(["git", "-C", repo_dir, "sparse-checkout", "set", *paths])
+            _run_git(["git", "-C", repo_dir, "checkout", "--quiet", "--detach", commit])
+        except InstallError:
+            # A mirror that never fetched anything (e.g. bad URL) is not worth keeping.
+            if os.path.isdir(mirror) and not _git_output(["git", "-C", mirror, "for-each-ref"]):
+                shutil.rmtree(mirror, ignore_errors=True)
+            raise
     return repo_dir
 
 
@@ -169,11 +371,127 @@ def _validate_skill(path: str) -> None:
         raise InstallError("SKILL.md not found in selected skill directory.")
 
 
-def _copy_skill(src: str, dest_dir: str) -> None:
-    os.makedirs(os.path.dirname(dest_dir), exist_ok=True)
+def _objects_root() -> str:
+    return os.path.join(_cache_root(), "objects")
+
+
+def _store_object(path: str) -> tuple[str, dict]:
+    """Add a file to the content store; return the object path and its lock info.
+
+    Objects are keyed by git blob SHA and mode. They share an inode with every
+    linked install, so they are never chmod-ed or re-stamped once published;
+    an existing object is rehashed before reuse and replaced (a new inode)
+    if an install edited it in place.
+    """
+    info = {"blob": git_blob_sha(path), "mode": file_mode(path)}
+    suffix = "x" if info["mode"] == "100755" else ""
+    obj = os.path.join(_objects_root(), info["blob"][:2], info["blob"][2:] + suffix)
+    try:
+        if file_mode(obj) == info["mode"] and git_blob_sha(obj) == info["blob"]:
+            return obj, info
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(obj), exist_ok=True)
+    tmp_path = f"{obj}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        shutil.copyfile(path, tmp_path)
+        # tmp_path is a fresh inode nothing links to yet.
+        os.chmod(tmp_path, 0o755 if suffix else 0o644)
+        os.replace(tmp_path, obj)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return obj, info
+
+
+def _link_tree(src: str, dest: str) -> dict[str, dict]:
+    """Recreate src at dest with files hardlinked from the content store.
+
+    Falls back to a plain copy per file when linking is not possible (store
+    on another filesystem, link limits, no hardlink support).
+    """
+    files: dict[str, dict] = {}
+    for dirpath, dirnames, filenames in os.walk(src):
+        dirnames[:] = [name for name in dirnames if name not in IGNORED_DIRS]
+        target_dir = os.path.join(dest, os.path.relpath(dirpath, src))
+        os.makedirs(target_dir, exist_ok=True)
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            target = os.path.join(target_dir, filename)
+            if os.path.islink(path):
+                os.symlink(os.readlink(path), target)
+                continue
+            obj, info = _store_object(path)
+            try:
+                os.link(obj, target)
+            except OSError:
+                shutil.copy2(path, target)
+            files[os.path.relpath(path, src).replace(os.sep, "/")] = file_info(target, info["blob"])
+    return files
+
+
+def _prune_objects(max_age: int = CACHE_MAX_AGE_SECONDS) -> int:
+    """Remove store objects no installed file links to any more.
+
+    ctime changes whenever an object's link count does, so it tracks the
+    last time an install or uninstall touched it.
+    """
+    removed = 0
+    now = time.time()
+    for dirpath, _, filenames in os.walk(_objects_root()):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_nlink == 1 and now - stat.st_ctime > max_age:
+                removed += _remove_file(path)
+    return removed
+
+
+def _remove_file(path: str) -> int:
+    try:
+        os.remove(path)
+    except OSError:
+        return 0
+    return 1
+
+
+def _evict_caches() -> None:
+    # Mirrors under git/ are maintained by git itself and objects/ has its own
+    # reference-based pruning, so age/size eviction only covers downloads.
+    for name in ("archives", "http"):
+        evict_cache(os.path.join(_cache_root(), name))
+    _prune_objects()
+
+
+def _copy_skill(src: str, dest_dir: str, move: bool = True, link: bool = False) -> dict[str, dict] | None:
+    """Publish src at dest_dir with one rename; returns per-file lock info when linking."""
+    dest_root = os.path.dirname(dest_dir)
+    os.makedirs(dest_root, exist_ok=True)
     if os.path.exists(dest_dir):
         raise InstallError(f"Destination already exists: {dest_dir}")
-    shutil.copytree(src, dest_dir)
+    # Stage next to the destination so publishing is a single atomic rename;
+    # a crash midway only ever leaves a hidden staging dir behind. Files are
+    # hardlinked from the content store only with --link; otherwise src
+    # (normally the disposable install temp dir) is moved or copied.
+    staging = tempfile.mkdtemp(prefix=".skill-staging-", dir=dest_root)
+    files = None
+    try:
+        staged = os.path.join(staging, os.path.basename(dest_dir))
+        if link:
+            files = _link_tree(src, staged)
+        elif move:
+            shutil.move(src, staged)
+        else:
+            shutil.copytree(src, staged)
+        if os.path.exists(dest_dir):
+            raise InstallError(f"Destination already exists: {dest_dir}")
+        os.rename(staged, dest_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return files
 
 
 def _build_repo_url(owner: str, repo: str) -> str:
@@ -184,10 +502,16 @@ def _build_repo_ssh(owner: str, repo: str) -> str:
     return f"git@github.com:{owner}/{repo}.git"
 
 
-def _prepare_repo(source: Source, method: str, tmp_dir: str) -> str:
+def _git_prepared(repo_dir: str) -> PreparedRepo:
+    return PreparedRepo(repo_dir, False, _git_output(["git", "-C", repo_dir, "rev-parse", "HEAD"]))
+
+
+def _prepare_repo(source: Source, method: str, tmp_dir: str, use_cache: bool = True) -> PreparedRepo:
     if method in ("download", "auto"):
         try:
-            return _download_repo_zip(source.owner, source.repo, source.ref, tmp_dir)
+            return _download_repo_zip(
+                source.owner, source.repo, source.ref, tmp_dir, source.paths, use_cache
+            )
         except InstallError as exc:
             if method == "download":
                 raise
@@ -197,12 +521,14 @@ def _prepare_repo(source: Source, method: str, tmp_dir: str) -> str:
             else:
                 raise
     if method in ("git", "auto"):
-        repo_url = source.repo_url or _build_repo_url(source.owner, source.repo)
+        if source.repo_url:
+            return _git_prepared(_git_sparse_checkout(source.repo_url, source.ref, source.paths, tmp_dir))
+        repo_url = _build_repo_url(source.owner, source.repo)
         try:
-            return _git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir)
+            return _git_prepared(_git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir))
         except InstallError:
             repo_url = _build_repo_ssh(source.owner, source.repo)
-            return _git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir)
+            return _git_prepared(_git_sparse_checkout(repo_url, source.ref, source.paths, tmp_dir))
     raise InstallError("Unsupported method.")
 
 
@@ -240,6 +566,177 @@ def _resolve_source(args: Args) -> Source:
     )
 
 
+def _load_manifest(path: str, default_ref: str) -> list[ManifestEntry]:
+    """Read a JSON manifest: a list of {repo|url, ref?, path, name?} objects."""
+    try:
+        with open(path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError) as exc:
+        raise InstallError(f"Unable to read manifest {path}: {exc}") from exc
+    if isinstance(data, dict):
+        data = data.get("skills")
+    if not isinstance(data, list):
+        raise InstallError("Manifest must be a JSON list of skill entries.")
+    entries = []
+    seen_names: set[str] = set()
+    for idx, item in enumerate(data, start=1):
+        if not isinstance(item, dict):
+            raise InstallError(f"Manifest entry {idx} must be an object.")
+        path = item.get("path")
+        entry_args = Args(
+            url=item.get("url"),
+            repo=item.get("repo"),
+            path=[path] if path else None,
+            ref=item.get("ref") or default_ref,
+        )
+        source = _resolve_source(entry_args)
+        source.repo_url = item.get("git_url")
+        if len(source.paths) != 1:
+            raise InstallError(f"Manifest entry {idx} must name exactly one path.")
+        skill_path = source.paths[0]
+        _validate_relative_path(skill_path)
+        name = item.get("name") or os.path.basename(skill_path.rstrip("/"))
+        _validate_skill_name(name)
+        if name in seen_names:
+            raise InstallError(f"Manifest entry {idx}: duplicate skill name {name}.")
+        seen_names.add(name)
+        entries.append(ManifestEntry(source=source, path=skill_path, name=name))
+    return entries
+
+
+def _group_entries(entries: list[ManifestEntry]) -> dict[tuple[str, str, str], list[ManifestEntry]]:
+    groups: dict[tuple[str, str, str], list[ManifestEntry]] = {}
+    for entry in entries:
+        key = (entry.source.owner, entry.source.repo, entry.source.ref)
+        groups.setdefault(key, []).append(entry)
+    return groups
+
+
+def _fetch_group(
+    key: tuple[str, str, str], entries: list[ManifestEntry], method: str, tmp_dir: str, use_cache: bool
+) -> tuple[PreparedRepo, float]:
+    owner, repo, ref = key
+    paths = sorted({entry.path for entry in entries})
+    repo_url = next((entry.source.repo_url for entry in entries if entry.source.repo_url), None)
+    source = Source(owner=owner, repo=repo, ref=ref, paths=paths, repo_url=repo_url)
+    group_dir = tempfile.mkdtemp(prefix=f"{owner}-{repo}-", dir=tmp_dir)
+    start = time.perf_counter()
+    prepared = _prepare_repo(source, method, group_dir, use_cache)
+    return prepared, time.perf_counter() - start
+
+
+def _record_install(
+    dest_root: str,
+    name: str,
+    source: Source,
+    path: str,
+    prepared: PreparedRepo,
+    method: str,
+    files: dict[str, dict] | None = None,
+) -> None:
+    entry = lock_entry(
+        os.path.join(dest_root, name),
+        repo=f"{source.owner}/{source.repo}",
+        ref=source.ref,
+        path=path,
+        commit=prepared.commit,
+        method=method,
+        files=files,
+    )
+    if source.repo_url:
+        entry["git_url"] = source.repo_url
+    update_lock(dest_root, {name: entry})
+
+
+def _install_entry(
+    entry: ManifestEntry, prepared: PreparedRepo, dest_root: str, args: Args, result: EntryResult
+) -> EntryResult:
+    start = time.perf_counter()
+    skill_src = os.path.join(prepared.root, entry.path)
+    _validate_skill(skill_src)
+    # Several entries may share one extracted path, so copy instead of move.
+    files = _copy_skill(skill_src, result.dest, move=False, link=args.link and not args.no_cache)
+    _record_install(dest_root, entry.name, entry.source, entry.path, prepared, args.method, files)
+    result.install_seconds = time.perf_counter() - start
+    return result
+
+
+def _install_manifest(args: Args) -> int:
+    """Install every manifest entry, downloading each (repo, ref) once."""
+    entries = _load_manifest(args.manifest or "", args.ref)
+    if not entries:
+        raise InstallError("Manifest has no entries.")
+    dest_root = args.dest or _default_dest()
+    results = {entry.name: EntryResult(entry.name, os.path.join(dest_root, entry.name)) for entry in entries}
+    for result in results.values():
+        if os.path.exists(result.dest):
+            result.error = f"Destination already exists: {result.dest}"
+
+    groups = _group_entries(entries)
+    jobs = max(1, args.jobs)
+    total_start = time.perf_counter()
+    tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            fetches = {
+                key: pool.submit(_fetch_group, key, group, args.method, tmp_dir, not args.no_cache)
+                for key, group in groups.items()
+                if any(results[entry.name].error is None for entry in group)
+            }
+            installs = []
+            for key, future in fetches.items():
+                try:
+                    prepared, elapsed = future.result()
+                except InstallError as exc:
+                    for entry in groups[key]:
+                        results[entry.name].error = results[entry.name].error or str(exc)
+                    continue
+                for entry in groups[key]:
+                    result = results[entry.name]
+                    if result.error:
+                        continue
+                    result.from_cache = prepared.from_cache
+                    result.download_seconds = elapsed
+                    installs.append(
+                        (result, pool.submit(_install_entry, entry, prepared, dest_root, args, result))
+                    )
+            for result, future in installs:
+                try:
+                    future.result()
+                except (InstallError, OSError) as exc:
+                    result.error = str(exc)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    _print_summary(entries, results, groups, time.perf_counter() - total_start)
+    return 1 if any(result.error for result in results.values()) else 0
+
+
+def _print_summary(
+    entries: list[ManifestEntry],
+    results: dict[str, EntryResult],
+    groups: dict[tuple[str, str, str], list[ManifestEntry]],
+    elapsed: float,
+) -> None:
+    failed = 0
+    for entry in entries:
+        result = results[entry.name]
+        source = f"{entry.source.owner}/{entry.source.repo}@{entry.source.ref}"
+        if result.error:
+            failed += 1
+            print(f"FAILED    {result.name} ({source}:{entry.path}): {result.error}", file=sys.stderr)
+            continue
+        origin = "cache" if result.from_cache else "download"
+        print(
+            f"Installed {result.name} to {result.dest} "
+            f"[{origin} {result.download_seconds:.2f}s, install {result.install_seconds:.2f}s]"
+        )
+    print(
+        f"Summary: {len(entries) - failed}/{len(entries)} skills installed from "
+        f"{len(groups)} archive(s) in {elapsed:.2f}s"
+    )
+
+
 def _default_dest() -> str:
     return os.path.join(_codex_home(), "skills")
 
@@ -263,14 +760,46 @@ def _parse_args(argv: list[str]) -> Args:
         choices=["auto", "download", "git"],
         default="auto",
     )
+    parser.add_argument(
+        "--git-url",
+        help="Clone URL or local path for --method git (overrides the GitHub URL)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the archive cache under $CODEX_HOME/cache",
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Hardlink files from the shared content store instead of copying "
+        "(installs of the same file share one inode, so editing one edits all)",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="JSON list of {repo|url, ref, path, name} entries to install in one batch",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Parallel downloads/installs for --manifest",
+    )
+    parser.add_argument("--timeout", type=float, help="HTTP timeout in seconds")
+    parser.add_argument("--stats", action="store_true", help="Print HTTP latency stats to stderr")
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
+    if args.timeout:
+        get_client(USER_AGENT).timeout = args.timeout
     try:
+        if args.manifest:
+            return _install_manifest(args)
         source = _resolve_source(args)
         source.ref = source.ref or args.ref
+        source.repo_url = args.git_url or source.repo_url
         if not source.paths:
             raise InstallError("No skill paths provided.")
         for path in source.paths:
@@ -278,7 +807,9 @@ def main(argv: list[str]) -> int:
         dest_root = args.dest or _default_dest()
         tmp_dir = tempfile.mkdtemp(prefix="skill-install-", dir=_tmp_root())
         try:
-            repo_root = _prepare_repo(source, args.method, tmp_dir)
+            prepared = _prepare_repo(source, args.method, tmp_dir, not args.no_cache)
+            if prepared.from_cache:
+                print(f"Using cached archive for {source.owner}/{source.repo}@{source.ref}")
             installed = []
             for path in source.paths:
                 skill_name = args.name if len(source.paths) == 1 else None
@@ -289,9 +820,10 @@ def main(argv: list[str]) -> int:
                 dest_dir = os.path.join(dest_root, skill_name)
                 if os.path.exists(dest_dir):
                     raise InstallError(f"Destination already exists: {dest_dir}")
-                skill_src = os.path.join(repo_root, path)
+                skill_src = os.path.join(prepared.root, path)
                 _validate_skill(skill_src)
-                _copy_skill(skill_src, dest_dir)
+                files = _copy_skill(skill_src, dest_dir, link=args.link and not args.no_cache)
+                _record_install(dest_root, skill_name, source, path, prepared, args.method, files)
                 installed.append((skill_name, dest_dir))
         finally:
             if os.path.isdir(tmp_dir):
@@ -302,6 +834,9 @@ def main(argv: list[str]) -> int:
     except InstallError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
+    finally:
+        if args.stats:
+            print(format_latency_summary(get_client(USER_AGENT)), file=sys.stderr)
 
 
 if __name__ == "__main__":
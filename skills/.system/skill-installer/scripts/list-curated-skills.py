@@ -4,16 +4,30 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import sys
+import time
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 
-from github_utils import github_api_contents_url, github_request
+from github_utils import (
+    ResponseCache,
+    codex_cache_dir,
+    format_latency_summary,
+    get_client,
+    github_api_contents_url,
+    github_request,
+)
 
 DEFAULT_REPO = "openai/skills"
 DEFAULT_PATH = "skills/.curated"
 DEFAULT_REF = "main"
+USER_AGENT = "codex-skill-list"
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+DEFAULT_CATALOG_TTL = 3600
+DEFAULT_JOBS = 8
 
 
 class ListError(Exception):
@@ -25,10 +39,16 @@ class Args(argparse.Namespace):
     path: str
     ref: str
     format: str
+    timeout: float | None
+    stats: bool
+    catalog: bool
+    refresh: bool
+    ttl: float
+    jobs: int
 
 
-def _request(url: str) -> bytes:
-    return github_request(url, "codex-skill-list")
+def _request(url: str, cache: ResponseCache | None = None, accept: str | None = None) -> bytes:
+    return github_request(url, USER_AGENT, cache=cache, accept=accept)
 
 
 def _codex_home() -> str:
@@ -47,10 +67,10 @@ def _installed_skills() -> set[str]:
     return entries
 
 
-def _list_curated(repo: str, path: str, ref: str) -> list[str]:
+def _fetch_listing(repo: str, path: str, ref: str, cache: ResponseCache | None = None) -> list[dict]:
     api_url = github_api_contents_url(repo, path, ref)
     try:
-        payload = _request(api_url)
+        payload = _request(api_url, cache=cache)
     except urllib.error.HTTPError as exc:
         if exc.code == 404:
             raise ListError(
@@ -58,11 +78,121 @@ def _list_curated(repo: str, path: str, ref: str) -> list[str]:
                 f"https://github.com/{repo}/tree/{ref}/{path}"
             ) from exc
         raise ListError(f"Failed to fetch curated skills: HTTP {exc.code}") from exc
+    except urllib.error.URLError as exc:
+        raise ListError(f"Failed to fetch curated skills: {exc.reason}") from exc
     data = json.loads(payload.decode("utf-8"))
     if not isinstance(data, list):
         raise ListError("Unexpected curated listing response.")
-    skills = [item["name"] for item in data if item.get("type") == "dir"]
-    return sorted(skills)
+    return [item for item in data if item.get("type") == "dir"]
+
+
+def _list_curated(repo: str, path: str, ref: str) -> list[str]:
+    return sorted(item["name"] for item in _fetch_listing(repo, path, ref))
+
+
+def _catalog_path(repo: str, path: str, ref: str) -> str:
+    key = hashlib.sha256(f"{repo}\0{path}\0{ref}".encode("utf-8")).hexdigest()[:16]
+    return codex_cache_dir("skill-installer", "catalog", f"{key}.json")
+
+
+def _load_catalog(catalog_path: str) -> dict:
+    try:
+        with open(catalog_path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_catalog(catalog_path: str, catalog: dict) -> None:
+    os.makedirs(os.path.dirname(catalog_path), exist_ok=True)
+    tmp_path = f"{catalog_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file_handle:
+        json.dump(catalog, file_handle, indent=2)
+    os.replace(tmp_path, catalog_path)
+
+
+def _parse_frontmatter(text: str) -> dict[str, str]:
+    """Parse top-level `key: value` pairs (incl. `>`/`|` blocks) from SKILL.md frontmatter."""
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+    fields: dict[str, str] = {}
+    key = None
+    block: list[str] = []
+    for line in lines[1:]:
+        if line.strip() == "---":
+            break
+        if key and (line.startswith((" ", "\t")) or not line.strip()):
+            block.append(line.strip())
+            continue
+        if key:
+            fields[key] = " ".join(part for part in block if part)
+            key = None
+        name, sep, value = line.partition(":")
+        if not sep or line.startswith((" ", "\t", "#")):
+            continue
+        value = value.strip()
+        if value in (">", "|", ">-", "|-"):
+            key, block = name.strip(), []
+            continue
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        fields[name.strip()] = value
+    if key:
+        fields[key] = " ".join(part for part in block if part)
+    return fields
+
+
+def _fetch_skill_meta(repo: str, path: str, ref: str, item: dict, cache: ResponseCache) -> dict:
+    name = item["name"]
+    entry = {"name": name, "path": f"{path}/{name}", "sha": item.get("sha", ""), "description": ""}
+    url = github_api_contents_url(repo, f"{path}/{name}/SKILL.md", ref)
+    try:
+        text = _request(url, cache=cache, accept=RAW_MEDIA_TYPE).decode("utf-8", "replace")
+    except urllib.error.URLError:
+        entry["error"] = "SKILL.md unavailable"
+        return entry
+    frontmatter = _parse_frontmatter(text)
+    entry["description"] = frontmatter.get("description", "")
+    if frontmatter.get("name"):
+        entry["skill_name"] = frontmatter["name"]
+    return entry
+
+
+def _curated_catalog(repo: str, path: str, ref: str, ttl: float, refresh: bool, jobs: int) -> list[dict]:
+    """Return curated skills enriched with SKILL.md frontmatter, cached locally.
+
+    Within the TTL the stored catalog is returned without any request. After
+    it (or with refresh) the listing is revalidated via ETag, and frontmatter
+    is only fetched, concurrently, for skills whose tree SHA changed.
+    """
+    catalog_path = _catalog_path(repo, path, ref)
+    catalog = _load_catalog(catalog_path)
+    fresh = time.time() - float(catalog.get("fetched_at", 0)) < ttl
+    if catalog.get("skills") is not None and fresh and not refresh:
+        return catalog["skills"]
+
+    cache = ResponseCache(codex_cache_dir("skill-installer", "http"))
+    listing = _fetch_listing(repo, path, ref, cache=cache)
+    previous = {entry["name"]: entry for entry in catalog.get("skills", [])}
+    skills: list[dict] = []
+    stale = []
+    for item in listing:
+        known = previous.get(item["name"])
+        if known and known.get("sha") and known.get("sha") == item.get("sha") and "error" not in known:
+            skills.append(known)
+        else:
+            stale.append(item)
+    if stale:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            skills.extend(pool.map(lambda item: _fetch_skill_meta(repo, path, ref, item, cache), stale))
+    skills.sort(key=lambda entry: entry["name"])
+    _save_catalog(
+        catalog_path,
+        {"repo": repo, "path": path, "ref": ref, "fetched_at": time.time(), "skills": skills},
+    )
+    return skills
 
 
 def _parse_args(argv: list[str]) -> Args:
@@ -76,14 +206,53 @@ def _parse_args(argv: list[str]) -> Args:
         default="text",
         help="Output format",
     )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Include SKILL.md descriptions, using the local catalog cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Revalidate the cached catalog even if it is within the TTL (implies --catalog)",
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=DEFAULT_CATALOG_TTL,
+        help="Seconds before the cached catalog is revalidated",
+    )
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Parallel SKILL.md fetches")
+    parser.add_argument("--timeout", type=float, help="HTTP timeout in seconds")
+    parser.add_argument("--stats", action="store_true", help="Print HTTP latency stats to stderr")
     return parser.parse_args(argv, namespace=Args())
 
 
 def main(argv: list[str]) -> int:
     args = _parse_args(argv)
+    if args.timeout:
+        get_client(USER_AGENT).timeout = args.timeout
     try:
-        skills = _list_curated(args.repo, args.path, args.ref)
         installed = _installed_skills()
+        if args.catalog or args.refresh:
+            catalog = _curated_catalog(args.repo, args.path, args.ref, args.ttl, args.refresh, args.jobs)
+            if args.format == "json":
+                payload = [
+                    {
+                        "name": entry["name"],
+                        "description": entry.get("description", ""),
+                        "installed": entry["name"] in installed,
+                    }
+                    for entry in catalog
+                ]
+                print(json.dumps(payload))
+            else:
+                for idx, entry in enumerate(catalog, start=1):
+                    suffix = " (already installed)" if entry["name"] in installed else ""
+                    description = f" - {entry['description']}" if entry.get("description") else ""
+                    print(f"{idx}. {entry['name']}{suffix}{description}")
+            return 0
+        skills = _list_curated(args.repo, args.path, args.ref)
         if args.format == "json":
             payload = [
                 {"name": name, "installed": name in installed} for name in skills
@@ -97,6 +266,9 @@ def main(argv: list[str]) -> int:
     except ListError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
+    finally:
+        if args.stats:
+            print(format_latency_summary(get_client(USER_AGENT)), file=sys.stderr)
 
 
 if __name__ == "__main__":
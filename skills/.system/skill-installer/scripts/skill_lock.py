@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Lock file helpers recording where installed skills came from."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+import threading
+import time
+from concurrent.futures import Executor
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+LOCK_FILENAME = ".skill-lock.json"
+LOCK_VERSION = 1
+IGNORED_DIRS = {"__pycache__", ".git"}
+
+_LOCK_GUARD = threading.Lock()
+
+
+def lock_path(skills_root: str) -> str:
+    return os.path.join(skills_root, LOCK_FILENAME)
+
+
+def git_blob_sha(path: str) -> str:
+    """Return the git blob SHA-1 of a file, matching upstream tree entries."""
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(f"blob {size}\0".encode("ascii"))
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_mode(path: str) -> str:
+    return "100755" if os.stat(path).st_mode & stat.S_IXUSR else "100644"
+
+
+def file_info(path: str, blob: str | None = None) -> dict:
+    """Lock info for one file: blob SHA and git mode plus the stat fields used
+    to skip rehashing when nothing changed."""
+    stat_result = os.stat(path)
+    return {
+        "blob": blob or git_blob_sha(path),
+        "mode": "100755" if stat_result.st_mode & stat.S_IXUSR else "100644",
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+    }
+
+
+def walk_files(root: str) -> list[str]:
+    """Posix relpaths of the regular files under root, sorted."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name not in IGNORED_DIRS)
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if os.path.isfile(path) and not os.path.islink(path):
+                paths.append(os.path.relpath(path, root).replace(os.sep, "/"))
+    return paths
+
+
+def scan_skill(root: str, pool: Executor | None = None) -> dict[str, dict]:
+    """Map each file under root (posix relpath) to its file_info(), hashing on pool if given."""
+    rels = walk_files(root)
+    paths = [os.path.join(root, *rel.split("/")) for rel in rels]
+    infos = pool.map(file_info, paths) if pool is not None else map(file_info, paths)
+    return dict(zip(rels, infos))
+
+
+def unchanged(path: str, recorded: dict) -> dict | None:
+    """Return fresh file_info() for path if its size and mtime still match
+    the recorded ones (so the content is assumed unchanged), else None."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    if stat_result.st_size != recorded.get("size") or stat_result.st_mtime_ns != recorded.get("mtime_ns"):
+        return None
+    mode = "100755" if stat_result.st_mode & stat.S_IXUSR else "100644"
+    return {**recorded, "mode": mode}
+
+
+def git_tree_sha(files: dict[str, dict]) -> str:
+    """Compute the git tree SHA for a {relpath: {blob, mode}} map."""
+    tree: dict = {}
+    for rel, info in files.items():
+        node = tree
+        parts = rel.split("/")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = info
+    return _tree_sha(tree)
+
+
+def _tree_sha(node: dict) -> str:
+    entries = []
+    for name, value in node.items():
+        if "blob" in value and isinstance(value["blob"], str):
+            entries.append((name, value["mode"], bytes.fromhex(value["blob"])))
+        else:
+            entries.append((name + "/", "40000", bytes.fromhex(_tree_sha(value))))
+    body = b""
+    for sort_name, mode, sha in sorted(entries, key=lambda entry: entry[0].encode("utf-8")):
+        body += f"{mode} {sort_name.rstrip('/')}".encode("utf-8") + b"\0" + sha
+    return hashlib.sha1(f"tree {len(body)}\0".encode("ascii") + body).hexdigest()
+
+
+def rescan_skill(
+    root: str, recorded: dict[str, dict], pool: Executor | None = None
+) -> tuple[dict[str, dict], int]:
+    """Like scan_skill(), but files whose size and mtime match recorded are
+    not rehashed. Returns the file map and how many files were hashed."""
+    files: dict[str, dict] = {}
+    stale = []
+    for rel in walk_files(root):
+        info = unchanged(os.path.join(root, *rel.split("/")), recorded.get(rel, {}))
+        if info is None:
+            stale.append(rel)
+        else:
+            files[rel] = info
+    paths = [os.path.join(root, *rel.split("/")) for rel in stale]
+    files.update(zip(stale, pool.map(file_info, paths) if pool is not None else map(file_info, paths)))
+    return dict(sorted(files.items())), len(stale)
+
+
+def load_lock(skills_root: str) -> dict:
+    try:
+        with open(lock_path(skills_root), "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, dict) or not isinstance(data.get("skills"), dict):
+        data = {"version": LOCK_VERSION, "skills": {}}
+    return data
+
+
+def update_lock(skills_root: str, updates: dict[str, dict | None]) -> None:
+    """Merge entries into the lock file (None removes an entry).
+
+    Serialized across threads and, where fcntl exists, across processes, so
+    concurrent installs do not drop each other's entries.
+    """
+    os.makedirs(skills_root, exist_ok=True)
+    path = lock_path(skills_root)
+    with _LOCK_GUARD, open(path + ".lock", "a") as guard:
+        if fcntl is not None:
+            fcntl.flock(guard, fcntl.LOCK_EX)
+        data = load_lock(skills_root)
+        for name, entry in updates.items():
+            if entry is None:
+                data["skills"].pop(name, None)
+            else:
+                data["skills"][name] = entry
+        data["version"] = LOCK_VERSION
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file_handle:
+            json.dump(data, file_handle, indent=2, sort_keys=True)
+            file_handle.write("\n")
+        os.replace(tmp_path, path)
+
+
+def lock_entry(
+    skill_dir: str,
+    repo: str,
+    ref: str,
+    path: str,
+    commit: str | None,
+    method: str,
+    files: dict[str, dict] | None = None,
+) -> dict:
+    """Build a lock entry; pass files when the caller already hashed them."""
+    files = files if files is not None else scan_skill(skill_dir)
+    return {
+        "repo": repo,
+        "ref": ref,
+        "path": path,
+        "commit": commit,
+        "method": method,
+        "tree": git_tree_sha(files),
+        "files": files,
+        "installed_at": time.time(),
+    }
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Update installed skills in place, fetching only files that changed upstream."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from github_utils import (
+    ResponseCache,
+    codex_cache_dir,
+    codex_home,
+    format_latency_summary,
+    get_client,
+    github_api_blob_url,
+    github_api_commit_url,
+    github_api_tree_url,
+    github_request,
+)
+from skill_lock import git_tree_sha, load_lock, lock_entry, rescan_skill, update_lock
+
+USER_AGENT = "codex-skill-sync"
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+SHA_MEDIA_TYPE = "application/vnd.github.sha"
+SYMLINK_MODE = "120000"
+DEFAULT_JOBS = 8
+
+
+class SyncError(Exception):
+    pass
+
+
+class Args(argparse.Namespace):
+    dest: str | None
+    skill: list[str]
+    check: bool
+    jobs: int
+    format: str
+    timeout: float | None
+    stats: bool
+
+
+@dataclass
+class SyncResult:
+    name: str
+    status: str
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    detail: str = ""
+
+
+def _request(url: str, cache: ResponseCache | None = None, accept: str | None = None) -> bytes:
+    return github_request(url, USER_AGENT, cache=cache, accept=accept)
+
+
+def _resolve_commit(entry: dict, cache: ResponseCache) -> str:
+    """Resolve the entry's ref to a commit SHA so the tree and lock agree on one snapshot."""
+    try:
+        payload = _request(github_api_commit_url(entry["repo"], entry["ref"]), cache=cache, accept=SHA_MEDIA_TYPE)
+    except urllib.error.HTTPError as exc:
+        raise SyncError(f"Failed to resolve {entry['repo']}@{entry['ref']}: HTTP {exc.code}") from exc
+    except urllib.error.URLError as exc:
+        raise SyncError(f"Failed to resolve {entry['repo']}@{entry['ref']}: {exc.reason}") from exc
+    sha = payload.decode("utf-8", "replace").strip()
+    if not re.fullmatch(r"[0-9a-f]{40}", sha):
+        raise SyncError(f"Unexpected commit SHA for {entry['repo']}@{entry['ref']}")
+    return sha
+
+
+def _remote_tree(entry: dict, commit: str, cache: ResponseCache) -> tuple[str, dict[str, dict], dict[str, str]]:
+    """Return the tree SHA of the upstream regular files, {relpath: {blob, mode}}
+    for them, and {relpath: blob} for upstream symlinks.
+
+    Symlinks are kept out of the file map: the lock only tracks regular files,
+    so the tree SHA is recomputed over those to compare with the local one.
+    """
+    url = github_api_tree_url(entry["repo"], commit, entry["path"])
+    try:
+        payload = json.loads(_request(url, cache=cache).decode("utf-8"))
+    except urllib.error.HTTPError as exc:
+        if exc.code == 404:
+            raise SyncError(f"{entry['path']} not found at {entry['repo']}@{entry['ref']}") from exc
+        raise SyncError(f"Failed to fetch tree: HTTP {exc.code}") from exc
+    except urllib.error.URLError as exc:
+        raise SyncError(f"Failed to fetch tree: {exc.reason}") from exc
+    if payload.get("truncated"):
+        raise SyncError("Upstream tree listing is truncated; reinstall the skill instead.")
+    files, links = {}, {}
+    for item in payload.get("tree", []):
+        if item.get("type") != "blob":
+            continue
+        if item["mode"] == SYMLINK_MODE:
+            links[item["path"]] = item["sha"]
+        else:
+            files[item["path"]] = {"blob": item["sha"], "mode": item["mode"]}
+    return git_tree_sha(files), files, links
+
+
+def _blob_and_mode(info: dict | None) -> dict | None:
+    return {"blob": info["blob"], "mode": info["mode"]} if info else None
+
+
+def _fetch_blob(repo: str, sha: str) -> bytes:
+    try:
+        return _request(github_api_blob_url(repo, sha), accept=RAW_MEDIA_TYPE)
+    except urllib.error.URLError as exc:
+        raise SyncError(f"Failed to fetch blob {sha}: {getattr(exc, 'reason', exc)}") from exc
+
+
+def _link_or_copy(src: str, dest: str) -> None:
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def _stage_update(
+    skill_dir: str,
+    repo: str,
+    remote: dict[str, dict],
+    links: dict[str, str],
+    local: dict[str, dict],
+    pool: ThreadPoolExecutor,
+) -> tuple[str, list[str]]:
+    """Build the updated skill in a sibling directory; unchanged files are reused.
+
+    Upstream symlinks are recreated from their blobs (the link target), as the
+    installer copies them.
+    """
+    changed = [rel for rel, info in remote.items() if local.get(rel, {}).get("blob") != info["blob"]]
+    blobs = dict(zip(changed, pool.map(lambda rel: _fetch_blob(repo, remote[rel]["blob"]), changed)))
+    targets = dict(zip(links, pool.map(lambda rel: _fetch_blob(repo, links[rel]), links)))
+    holder = tempfile.mkdtemp(prefix=".skill-staging-", dir=os.path.dirname(skill_dir))
+    staging = os.path.join(holder, os.path.basename(skill_dir))
+    try:
+        os.mkdir(staging)
+        for rel, info in remote.items():
+            target = os.path.join(staging, *rel.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            source = os.path.join(skill_dir, *rel.split("/"))
+            if rel in blobs:
+                with open(target, "wb") as file_handle:
+                    file_handle.write(blobs[rel])
+            elif local[rel]["mode"] == info["mode"]:
+                # Links may point into the installer's content store, so
+                # their mode is left alone.
+                _link_or_copy(source, target)
+                continue
+            else:
+                shutil.copyfile(source, target)
+            os.chmod(target, 0o755 if info["mode"] == "100755" else 0o644)
+        for rel, link_target in targets.items():
+            target = os.path.join(staging, *rel.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.symlink(link_target.decode("utf-8"), target)
+    except BaseException:
+        shutil.rmtree(holder, ignore_errors=True)
+        raise
+    return staging, changed
+
+
+def _swap_in(staging: str, skill_dir: str) -> None:
+    """Replace skill_dir with staging via renames; the old tree is removed last."""
+    holder = os.path.dirname(staging)
+    old = os.path.join(holder, ".old")
+    os.rename(skill_dir, old)
+    try:
+        os.rename(staging, skill_dir)
+    except OSError:
+        os.rename(old, skill_dir)
+        raise
+    finally:
+        shutil.rmtree(holder, ignore_errors=True)
+
+
+def _sync_skill(
+    name: str, entry: dict, dest_root: str, check: bool, cache: ResponseCache, pool: ThreadPoolExecutor
+) -> SyncResult:
+    skill_dir = os.path.join(dest_root, name)
+    if not os.path.isdir(skill_dir):
+        return SyncResult(name, "missing", detail=skill_dir)
+    if entry.get("git_url"):
+        return SyncResult(name, "skipped", detail="installed with --git-url; reinstall to update")
+    try:
+        commit = _resolve_commit(entry, cache)
+        remote_tree, remote, links = _remote_tree(entry, commit, cache)
+        local, _ = rescan_skill(skill_dir, entry.get("files", {}), pool)
+        local_tree = git_tree_sha(local)
+        if remote_tree == local_tree:
+            if entry.get("tree") != local_tree or entry.get("commit") != commit:
+                update_lock(dest_root, {name: {**entry, "commit": commit, "tree": local_tree, "files": local}})
+            return SyncResult(name, "up-to-date")
+        changed = [rel for rel, info in remote.items() if _blob_and_mode(local.get(rel)) != info]
+        removed = sorted(set(local) - set(remote))
+        # Files edited locally since install are overwritten too; say so.
+        modified = entry.get("tree") and entry["tree"] != local_tree
+        detail = "local edits will be replaced" if modified else ""
+        if check:
+            return SyncResult(name, "outdated", sorted(changed), removed, detail)
+        staging, fetched = _stage_update(skill_dir, entry["repo"], remote, links, local, pool)
+        _swap_in(staging, skill_dir)
+    except (SyncError, OSError) as exc:
+        return SyncResult(name, "error", detail=str(exc))
+    updated = lock_entry(skill_dir, entry["repo"], entry["ref"], entry["path"], commit, entry.get("method", "auto"))
+    if entry.get("git_url"):
+        updated["git_url"] = entry["git_url"]
+    update_lock(dest_root, {name: updated})
+    summary = f"{len(fetched)} file(s) downloaded" + ("; local edits replaced" if modified else "")
+    return SyncResult(name, "updated", sorted(changed), removed, summary)
+
+
+def sync_skills(dest_root: str, names: list[str], check: bool, jobs: int) -> list[SyncResult]:
+    lock = load_lock(dest_root)["skills"]
+    selected = names or sorted(lock)
+    results = [SyncResult(name, "untracked") for name in selected if name not in lock]
+    tracked = [name for name in selected if name in lock]
+    cache = ResponseCache(codex_cache_dir("skill-installer", "http"))
+    # Tree lookups run concurrently across skills; blob downloads share a second pool
+    # so a skill waiting on its blobs never starves the outer workers.
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as blob_pool:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            results.extend(
+                pool.map(lambda name: _sync_skill(name, lock[name], dest_root, check, cache, blob_pool), tracked)
+            )
+    results.sort(key=lambda result: result.name)
+    return results
+
+
+def _parse_args(argv: list[str]) -> Args:
+    parser = argparse.ArgumentParser(description="Sync installed skills with their upstream source.")
+    parser.add_argument("--dest", help="Skills directory (default: $CODEX_HOME/skills)")
+    parser.add_argument("--skill", action="append", default=[], help="Skill name to sync (repeatable)")
+    parser.add_argument("--check", action="store_true", help="Report outdated skills without changing them")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Parallel tree and blob fetches")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
+    parser.add_argument("--timeout", type=float, help="HTTP timeout in seconds")
+    parser.add_argument("--stats", action="store_true", help="Print HTTP latency stats to stderr")
+    return parser.parse_args(argv, namespace=Args())
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    if args.timeout:
+        get_client(USER_AGENT).timeout = args.timeout
+    dest_root = args.dest or os.path.join(codex_home(), "skills")
+    try:
+        results = sync_skills(dest_root, args.skill, args.check, args.jobs)
+    finally:
+        if args.stats:
+            print(format_latency_summary(get_client(USER_AGENT)), file=sys.stderr)
+    if args.format == "json":
+        print(json.dumps([result.__dict__ for result in results], indent=2))
+    else:
+        for result in results:
+            line = f"{result.name}: {result.status}"
+            if result.changed or result.removed:
+                line += f" ({len(result.changed)} changed, {len(result.removed)} removed)"
+            if result.detail:
+                line += f" - {result.detail}"
+            print(line)
+    if any(result.status in ("error", "missing") for result in results):
+        return 1
+    if args.check and any(result.status == "outdated" for result in results):
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,57 @@
+"""Tests for archive extraction in install-skill-from-github.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+_spec = importlib.util.spec_from_file_location("install_skill_from_github", SCRIPTS_DIR / "install-skill-from-github.py")
+installer = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = installer
+_spec.loader.exec_module(installer)
+
+SKILL_MD = "---\nname: root-skill\ndescription: Lives at the repo root.\n---\n"
+
+
+def _zipball(files: dict[str, str]) -> io.BytesIO:
+    """A GitHub-style zipball: every member under one "<repo>-<sha>/" folder."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("repo-abc123/", "")
+        for name, text in files.items():
+            zip_file.writestr(f"repo-abc123/{name}", text)
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def zipball(monkeypatch):
+    def install(files: dict[str, str]) -> None:
+        monkeypatch.setattr(installer, "_open_repo_zip", lambda *args: (_zipball(files), False))
+
+    return install
+
+
+@pytest.mark.parametrize("path", [".", "./", ""])
+def test_repo_root_skill_extracts_every_member(tmp_path, zipball, path):
+    zipball({"SKILL.md": SKILL_MD, "scripts/run.py": "print('hi')\n"})
+    prepared = installer._download_repo_zip("owner", "repo", "main", str(tmp_path), [path], use_cache=False)
+    skill_src = os.path.join(prepared.root, path)
+    installer._validate_skill(skill_src)
+    assert Path(skill_src, "scripts", "run.py").read_text() == "print('hi')\n"
+
+
+def test_subpath_extracts_only_that_skill(tmp_path, zipball):
+    zipball({"skills/a/SKILL.md": SKILL_MD, "skills/ab/SKILL.md": SKILL_MD, "README.md": "readme\n"})
+    prepared = installer._download_repo_zip("owner", "repo", "main", str(tmp_path), ["skills/a"], use_cache=False)
+    installer._validate_skill(os.path.join(prepared.root, "skills/a"))
+    assert not Path(prepared.root, "skills", "ab").exists()
+    assert not Path(prepared.root, "README.md").exists()
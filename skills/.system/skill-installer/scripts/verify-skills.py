@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Check installed skills against the hashes recorded in the skills lock file."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from github_utils import codex_home
+from skill_lock import load_lock, rescan_skill, update_lock
+
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 2)
+
+
+class Args(argparse.Namespace):
+    dest: str | None
+    skill: list[str]
+    jobs: int
+    format: str
+
+
+@dataclass
+class VerifyResult:
+    name: str
+    status: str
+    modified: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+    hashed: int = 0
+    files: int = 0
+
+
+def _verify_skill(name: str, entry: dict, dest_root: str, pool: ThreadPoolExecutor) -> tuple[VerifyResult, dict | None]:
+    """Compare one skill with its lock entry; also return refreshed file stats
+    when contents matched but mtimes moved, so the next run can skip them."""
+    skill_dir = os.path.join(dest_root, name)
+    if not os.path.isdir(skill_dir):
+        return VerifyResult(name, "missing"), None
+    recorded = entry.get("files", {})
+    current, hashed = rescan_skill(skill_dir, recorded, pool)
+    result = VerifyResult(name, "ok", hashed=hashed, files=len(current))
+    for rel, info in current.items():
+        known = recorded.get(rel)
+        if known is None:
+            result.added.append(rel)
+        elif (known["blob"], known["mode"]) != (info["blob"], info["mode"]):
+            result.modified.append(rel)
+    result.missing = sorted(set(recorded) - set(current))
+    if result.modified or result.missing or result.added:
+        result.status = "modified"
+        return result, None
+    if hashed:
+        return result, {**entry, "files": current}
+    return result, None
+
+
+def verify_skills(dest_root: str, names: list[str], jobs: int) -> list[VerifyResult]:
+    lock = load_lock(dest_root)["skills"]
+    if names:
+        selected = names
+    else:
+        on_disk = set()
+        if os.path.isdir(dest_root):
+            on_disk = {
+                name
+                for name in os.listdir(dest_root)
+                if not name.startswith(".") and os.path.isdir(os.path.join(dest_root, name))
+            }
+        selected = sorted(on_disk | set(lock))
+    results = [VerifyResult(name, "untracked") for name in selected if name not in lock]
+    tracked = [name for name in selected if name in lock]
+    refreshed = {}
+    # Skills fan out on one pool and file hashing on another, so a skill with
+    # a large assets/ tree is hashed in parallel rather than by a single worker.
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as hash_pool:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(tracked) or 1))) as pool:
+            for result, entry in pool.map(lambda name: _verify_skill(name, lock[name], dest_root, hash_pool), tracked):
+                results.append(result)
+                if entry is not None:
+                    refreshed[result.name] = entry
+    if refreshed:
+        update_lock(dest_root, refreshed)
+    results.sort(key=lambda result: result.name)
+    return results
+
+
+def _parse_args(argv: list[str]) -> Args:
+    parser = argparse.ArgumentParser(description="Verify installed skills against the skills lock file.")
+    parser.add_argument("--dest", help="Skills directory (default: $CODEX_HOME/skills)")
+    parser.add_argument("--skill", action="append", default=[], help="Skill name to verify (repeatable)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="Parallel file hashing workers")
+    parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
+    return parser.parse_args(argv, namespace=Args())
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    dest_root = args.dest or os.path.join(codex_home(), "skills")
+    start = time.perf_counter()
+    results = verify_skills(dest_root, args.skill, args.jobs)
+    elapsed = time.perf_counter() - start
+    if args.format == "json":
+        print(json.dumps([result.__dict__ for result in results], indent=2))
+    else:
+        for result in results:
+            line = f"{result.name}: {result.status}"
+            for label in ("modified", "missing", "added"):
+                paths = getattr(result, label)
+                if paths:
+                    line += f"\n  {label}: {', '.join(paths)}"
+            print(line)
+        files = sum(result.files for result in results)
+        hashed = sum(result.hashed for result in results)
+        print(f"Checked {files} file(s), hashed {hashed}, in {elapsed:.3f}s", file=sys.stderr)
+    return 1 if any(result.status in ("modified", "missing") for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))